@@ -3,6 +3,8 @@ A Sphinx extension to add markdown generation support.
 """
 
 from sphinx_markdown_builder.builder import MarkdownBuilder
+from sphinx_markdown_builder.cobuild import on_builder_inited
+from sphinx_markdown_builder.postprocess import POST_PROCESSORS_EVENT
 
 __version__ = "0.6.6"
 __docformat__ = "reStructuredText"
@@ -15,3 +17,27 @@ def setup(app):
     app.add_config_value("markdown_anchor_sections", False, False)
     app.add_config_value("markdown_anchor_signatures", False, False)
     app.add_config_value("markdown_docinfo", False, False)
+    app.add_config_value("markdown_chunks", False, False)
+    app.add_config_value("markdown_chunk_max_chars", 2000, False)
+    app.add_config_value("markdown_sqlite", "", False)
+    app.add_config_value("markdown_pipeline_depth", 0, False)
+    app.add_config_value("markdown_write_threads", 0, False)
+    app.add_config_value("markdown_fsync", False, False)
+    app.add_config_value("markdown_render_cache", 0, False)
+    app.add_config_value("markdown_trace", "", False)
+    app.add_config_value("markdown_profile_docs", 0, False)
+    app.add_config_value("markdown_profile_sample", 1.0, False)
+    app.add_config_value("markdown_memory_report", "", False)
+    app.add_config_value("markdown_memory_budget", 0, False)
+    app.add_config_value("markdown_depth_budget", 0, False)
+    app.add_config_value("markdown_variants", {}, False)
+    app.add_config_value("markdown_ir", False, False)
+    app.add_config_value("markdown_incremental_sections", False, False)
+    app.add_config_value("markdown_cobuild_dir", "", False)
+    app.add_config_value("markdown_schedule_history", "", False)
+    app.add_config_value("markdown_content_store", "", False)
+    app.add_config_value("markdown_content_store_hardlinks", False, False)
+    app.add_config_value("markdown_changes", "", False)
+    app.add_config_value("markdown_delete_orphans", False, False)
+    app.add_event(POST_PROCESSORS_EVENT)
+    app.connect("builder-inited", on_builder_inited)
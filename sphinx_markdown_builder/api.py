@@ -0,0 +1,142 @@
+"""
+Programmatic builds that return the rendered documents, instead of writing them to the output directory.
+
+    documents = build_markdown("docs/source")  # {docname: markdown}
+
+    for docname, markdown in iter_markdown("docs/source", jobs=4):
+        ...  # Each document as soon as it is rendered
+
+A temporary directory is used for the doctree cache (and as the unused output directory).
+
+Plain reStructuredText strings (only docutils roles and directives) are converted without a Sphinx project:
+
+    converter = MarkdownConverter(markdown_anchor_sections=True)
+    documents = converter.convert_all(sources)  # The parser settings are processed once
+"""
+
+import asyncio
+import functools
+import queue
+import sys
+import tempfile
+import threading
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from docutils import io
+from docutils.core import Publisher
+from docutils.parsers import rst
+from docutils.readers import standalone
+from sphinx.application import Sphinx
+from sphinx.util.docutils import docutils_namespace, patch_docutils
+
+from sphinx_markdown_builder.config import TranslatorConfig
+from sphinx_markdown_builder.writer import MarkdownWriter
+
+OutputSink = Callable[[str, str], None]
+
+_DONE = object()
+
+
+def run_build(
+    srcdir: str,
+    sink: OutputSink,
+    *,
+    confoverrides: Optional[Dict[str, Any]] = None,
+    jobs: int = 1,
+    confdir: Optional[str] = None,
+    warning: Optional[IO] = sys.stderr,
+):
+    """Builds the markdown of the sources, and passes each document to `sink(docname, markdown)`"""
+    confdir = srcdir if confdir is None else confdir
+    with tempfile.TemporaryDirectory(prefix="markdown-") as temp_dir:
+        with patch_docutils(confdir), docutils_namespace():
+            app = Sphinx(
+                srcdir,
+                confdir,
+                f"{temp_dir}/markdown",
+                f"{temp_dir}/doctrees",
+                "markdown",
+                confoverrides=confoverrides or {},
+                status=None,
+                warning=warning,
+                parallel=jobs,
+            )
+            app.builder.output_sink = sink
+            app.build(force_all=True)
+
+
+def build_markdown(srcdir: str, **kwargs) -> Dict[str, str]:
+    """Returns the markdown of each document (see `run_build()` for the arguments)"""
+    documents: Dict[str, str] = {}
+    run_build(srcdir, documents.__setitem__, **kwargs)
+    return documents
+
+
+def iter_markdown(srcdir: str, **kwargs) -> Iterator[Tuple[str, str]]:
+    """
+    Yields `(docname, markdown)` as the documents are rendered, while the build runs in a thread.
+    Errors of the build are raised when the iteration reaches them.
+    """
+    documents: "queue.Queue[Any]" = queue.Queue()
+
+    def build():
+        try:
+            run_build(srcdir, lambda docname, markdown: documents.put((docname, markdown)), **kwargs)
+        except BaseException as ex:  # pylint: disable=broad-except
+            documents.put(ex)
+        else:
+            documents.put(_DONE)
+
+    thread = threading.Thread(target=build, name="markdown-build", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = documents.get()
+            if item is _DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        thread.join()
+
+
+async def build_markdown_async(srcdir: str, **kwargs) -> Dict[str, str]:
+    """Same as `build_markdown()`, but runs the build in the default executor of the event loop"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(build_markdown, srcdir, **kwargs))
+
+
+class MarkdownConverter:
+    """
+    Converts reStructuredText strings to markdown with the docutils parser, without a Sphinx application.
+    A single publisher is reused, so the settings (and the translator configuration) are processed once.
+    """
+
+    def __init__(self, settings_overrides: Optional[Dict[str, Any]] = None, **config):
+        self.writer = MarkdownWriter(**config)
+        self.publisher = Publisher(
+            standalone.Reader(),
+            rst.Parser(),
+            self.writer,
+            source_class=io.StringInput,
+            destination_class=io.StringOutput,
+        )
+        settings = self.publisher.get_settings(output_encoding="unicode", **(settings_overrides or {}))
+        self.writer.builder.translator_config = TranslatorConfig.from_config(
+            self.writer.builder.config, settings.language_code
+        )
+
+    def convert(self, source: str, docname: str = "index") -> str:
+        self.writer.builder.current_doc_name = docname
+        self.publisher.set_source(source, docname)
+        self.publisher.set_destination(None, None)
+        return self.publisher.publish()
+
+    def convert_all(self, sources: Iterable[str]) -> List[str]:
+        return [self.convert(source) for source in sources]
+
+
+def convert_rst(source: str, **kwargs) -> str:
+    """Converts a single reStructuredText string (see `MarkdownConverter` for the arguments)"""
+    return MarkdownConverter(**kwargs).convert(source)
@@ -3,8 +3,10 @@ Custom docutils builder for markdown.
 """
 
 import os
-from contextlib import contextmanager
-from typing import Set
+import sqlite3
+import time
+from contextlib import ExitStack, contextmanager, nullcontext
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple
 
 from docutils import nodes
 from docutils.io import StringOutput
@@ -12,10 +14,53 @@ from sphinx.application import Sphinx
 from sphinx.builders import Builder
 from sphinx.environment import BuildEnvironment
 from sphinx.locale import __
-from sphinx.util import logging
-from sphinx.util.osutil import ensuredir, os_path
+from sphinx.util import logging, parallel
+from sphinx.util.build_phase import BuildPhase
+from sphinx.util.osutil import os_path
 
+try:
+    from sphinx.util.display import status_iterator
+except ImportError:  # pragma: no cover
+    from sphinx.util import status_iterator  # Sphinx < 6.1
+
+from sphinx_markdown_builder.changes import ChangeTracker, content_hash
+from sphinx_markdown_builder.chunks import CHUNKS_SUFFIX, dump_chunks, make_chunks
+from sphinx_markdown_builder.config import TranslatorConfig
+from sphinx_markdown_builder.database import DocumentRecord, MarkdownDatabase
+from sphinx_markdown_builder.ir import (
+    DocumentIR,
+    environment_fingerprint,
+    ir_path,
+    load_ir,
+    render_ir,
+    save_ir,
+    settings_fingerprint,
+)
+from sphinx_markdown_builder.memory import (
+    DocumentMemory,
+    MemoryBudget,
+    MemoryReport,
+    TranslatorStats,
+    trace_peak_memory,
+)
+from sphinx_markdown_builder.output import OutputWriter
+from sphinx_markdown_builder.pipeline import StageTimeline, WritePipeline
+from sphinx_markdown_builder.postprocess import PostProcessPipeline, registered_stages
+from sphinx_markdown_builder.profiling import PROFILE_DIR, DocumentProfiler
+from sphinx_markdown_builder.render_cache import RenderCache
+from sphinx_markdown_builder.schedule import (
+    BatchDispatcher,
+    BatchRun,
+    DocumentCost,
+    ScheduleHistory,
+    ScheduleReport,
+    make_batches,
+)
+from sphinx_markdown_builder.store import ContentStore
+from sphinx_markdown_builder.trace import BuildTracer
 from sphinx_markdown_builder.translator import MarkdownTranslator
+from sphinx_markdown_builder.urls import CacheStats, UrlResolver
+from sphinx_markdown_builder.variants import OutputVariant, create_variant, unknown_options
 from sphinx_markdown_builder.writer import MarkdownWriter
 
 logger = logging.getLogger(__name__)
@@ -35,7 +80,11 @@ def get_mod_time_if_exists(file_path, log_error=True):
         return os.path.getmtime(file_path)
 
 
-class MarkdownBuilder(Builder):
+def _first(item: Tuple[str, Any]) -> str:
+    return item[0]
+
+
+class MarkdownBuilder(Builder):  # pylint: disable=too-many-instance-attributes
     name = "markdown"
     format = "markdown"
     epilog = __("The markdown files are in %(outdir)s.")
@@ -50,9 +99,93 @@ class MarkdownBuilder(Builder):
         self.writer = None
         self.sec_numbers = None
         self.current_doc_name = None
+        self.database: Optional[MarkdownDatabase] = None
+        self.url_resolver: Optional[UrlResolver] = None
+        self.render_cache: Optional[RenderCache] = None
+        self.translator_config: Optional[TranslatorConfig] = None
+        self.output_writer: Optional[OutputWriter] = None
+        self.content_store: Optional[ContentStore] = None
+        self.change_tracker: Optional[ChangeTracker] = None
+        # The output files that could not be written (see `OutputWriter.failed`)
+        self.failed_outputs: Set[str] = set()
+        # Post-processors registered by extensions (see `postprocess.add_post_processor()`)
+        self.post_processors: Optional[PostProcessPipeline] = None
+        # Records the spans of the write phase (if tracing, or while the write phase is pipelined)
+        self.timeline: Optional[StageTimeline] = None
+        self.profiler: Optional[DocumentProfiler] = None
+        self.memory_report: Optional[MemoryReport] = None
+        self.variants: List[OutputVariant] = []
+        # The costs of the documents, to schedule the parallel write phase (see `markdown_schedule_history`)
+        self.schedule_history: Optional[ScheduleHistory] = None
+        self.schedule_report: Optional[ScheduleReport] = None
+        # The documents' IR is recorded, and reused, if set (see `markdown_ir`)
+        self.ir_fingerprint: Optional[str] = None
+        # The unchanged sections are spliced from the previous IR of the document (see `markdown_incremental_sections`)
+        self.incremental_sections = False
+        self.previous_ir: Optional[DocumentIR] = None
+        self.ir_settings = ""  # The previous IR is only reused if it has the same settings
+        # Receives `(docname, markdown)` instead of the output files of the documents (see `api.run_build()`)
+        self.output_sink: Optional[Callable[[str, str], None]] = None
+        # Doctrees of the variants that must be resolved separately (with another document suffix)
+        self._variant_doctrees: Dict[Tuple[str, str], nodes.document] = {}
+
+        # Results of the write phase that must be handled by the main process
+        self._in_worker = False
+        self._worker_results: List[Tuple[str, Any]] = []
+        self._result_handlers: Dict[str, Callable[[Any], None]] = {}
 
     def init(self):
         self.sec_numbers = {}
+        self.url_resolver = UrlResolver(self.config.markdown_http_base, self.config.markdown_uri_doc_suffix)
+        self._result_handlers["url_cache"] = self.url_resolver.stats.merge
+        self._result_handlers["output"] = self._send_output
+        self._result_handlers["failed"] = self.failed_outputs.update
+        if self.config.markdown_render_cache > 0:
+            self.render_cache = RenderCache(self.config.markdown_render_cache)
+            self._result_handlers["render_cache"] = self.render_cache.stats.merge
+        if self.config.markdown_trace:
+            # Relative to the output directory of this builder (which differs from `app.outdir` in a cobuild)
+            tracer = BuildTracer(os.path.join(self.outdir, self.config.markdown_trace))
+            tracer.connect(self.app)
+            self.timeline = tracer.timeline
+            self._result_handlers["trace"] = self.timeline.extend
+        if self.config.markdown_profile_docs > 0:
+            self.profiler = DocumentProfiler(self.config.markdown_profile_docs, self.config.markdown_profile_sample)
+            self._result_handlers["profile"] = self.profiler.add
+        budget = MemoryBudget(self.config.markdown_memory_budget, self.config.markdown_depth_budget)
+        if self.config.markdown_memory_report or budget.max_memory > 0 or budget.max_depth > 0:
+            self.memory_report = MemoryReport(budget)
+            self._result_handlers["memory"] = self.memory_report.add
+        for name, overrides in self.config.markdown_variants.items():
+            unknown = unknown_options(overrides)
+            if unknown:
+                logger.warning(__("markdown variant %r: ignoring unsupported options: %s"), name, ", ".join(unknown))
+            self.variants.append(create_variant(name, overrides, self.config, self.outdir))
+        if self.config.markdown_schedule_history:
+            self.schedule_history = ScheduleHistory(os.path.join(self.outdir, self.config.markdown_schedule_history))
+            self.schedule_history.load()
+            self._result_handlers["cost"] = self._add_costs
+            self._result_handlers["batch"] = self._add_batch
+        self._init_outputs()
+
+    def _init_outputs(self):
+        """The post-processors, the content store, the change set and the database of the outputs"""
+        stages = registered_stages(self.app)
+        if stages:
+            self.post_processors = PostProcessPipeline(stages)
+            self._result_handlers["post_process"] = self.post_processors.merge
+        if self.config.markdown_content_store:
+            store_root = os.path.join(self.outdir, self.config.markdown_content_store)
+            self.content_store = ContentStore(
+                store_root, self.config.markdown_fsync, self.config.markdown_content_store_hardlinks
+            )
+            self._result_handlers["store"] = self.content_store.stats.merge
+        if self.config.markdown_changes or self.config.markdown_delete_orphans:
+            self.change_tracker = ChangeTracker(self.outdir, self.out_suffix)
+            self._result_handlers["written"] = self.change_tracker.add
+        if self.config.markdown_sqlite:
+            self.database = MarkdownDatabase(os.path.join(self.outdir, self.config.markdown_sqlite))
+            self._result_handlers["database"] = self.database.add
 
     def _get_source_mtime(self, doc_name: str):
         source_name = self.env.doc2path(doc_name)
@@ -79,19 +212,456 @@ class MarkdownBuilder(Builder):
         By default, we link to the currently generated markdown files.
         But, we also support linking to external document (e.g., an html web page).
         """
-        return f"{docname}{self.config.markdown_uri_doc_suffix}"
+        return self.url_resolver.target_uri(docname)
+
+    def _span(self, stage: str, name: str = ""):
+        if self.timeline is None:
+            return nullcontext()
+        return self.timeline.span(stage, name)
 
     def prepare_writing(self, docnames: Set[str]):
-        self.writer = MarkdownWriter(self)
+        with self._span("prepare-writing"):
+            self.writer = MarkdownWriter(self)
+            language_code = self.env.settings.get("language_code", "en")
+            self.translator_config = TranslatorConfig.from_config(self.config, language_code)
+            for variant in self.variants:
+                variant.translator_config = TranslatorConfig.from_config(variant.config, language_code)
+            self.incremental_sections = bool(self.config.markdown_incremental_sections)
+            if self.config.markdown_ir or self.incremental_sections:
+                self.ir_fingerprint = environment_fingerprint(
+                    self.env.all_docs, self.url_resolver.doc_suffix, language_code
+                )
+                self.ir_settings = settings_fingerprint(self.config, self.url_resolver.doc_suffix, language_code)
+            # The parallel workers are forked from the main process, which must not have writer threads then
+            threads = 0 if self.parallel_ok else self.config.markdown_write_threads
+            self.output_writer = self._create_output_writer(threads)
+
+    def _create_output_writer(self, threads: int) -> OutputWriter:
+        output_writer = OutputWriter(threads, self.config.markdown_fsync, error_handler=io_handler)
+        output_writer.timeline = self.timeline
+        output_writer.store = self.content_store
+        return output_writer
+
+    def _add_result(self, kind: str, value: Any):
+        """Passes a result to the main process. In a parallel worker, it is sent when the chunk is done."""
+        if self._in_worker:
+            self._worker_results.append((kind, value))
+        else:
+            self._result_handlers[kind](value)
+
+    def _start_worker(self):
+        self._in_worker = True
+        self._worker_results = []
+        if self.timeline is not None:
+            # Only pass back the spans of this worker
+            self.timeline.spans = []
+        if self.profiler is not None:
+            self.profiler.profiles = []
+        self.url_resolver.stats = CacheStats()
+        if self.render_cache is not None:
+            self.render_cache.stats = CacheStats()
+        if self.content_store is not None:
+            self.content_store.stats = CacheStats()
+        if self.post_processors is not None:
+            self.post_processors.reset()
+        # A forked worker has its own writer threads
+        self.output_writer = self._create_output_writer(self.config.markdown_write_threads)
+
+    def _finish_worker(self) -> List[Tuple[str, Any]]:
+        self.output_writer.close()
+        self._add_result("failed", self.output_writer.failed)
+        self._add_result("url_cache", self.url_resolver.stats)
+        if self.timeline is not None:
+            self._add_result("trace", self.timeline.spans)
+        if self.render_cache is not None:
+            self._add_result("render_cache", self.render_cache.stats)
+        if self.profiler is not None:
+            self._add_result("profile", self.profiler.profiles)
+        if self.content_store is not None:
+            self._add_result("store", self.content_store.stats)
+        if self.post_processors is not None:
+            self._add_result("post_process", dict(self.post_processors.timings))
+        return self._worker_results
+
+    def _handle_worker_results(self, results: List[Tuple[str, Any]]):
+        for kind, value in results:
+            self._result_handlers[kind](value)
+
+    def _load_doctree(self, docname: str) -> Optional[nodes.document]:
+        if docname in getattr(self.env, "_write_doc_doctree_cache", {}):
+            return None  # Sphinx (>= 7.2) kept the doctree in memory since the read phase
+        return self.env.get_doctree(docname)
+
+    def _iter_doctrees(self, docnames: Sequence[str]) -> Iterator[Tuple[str, Optional[nodes.document]]]:
+        for docname in docnames:
+            with self._span("read", docname):
+                doctree = self._load_doctree(docname)
+            yield docname, doctree
+
+    def _write_serial(self, docnames: Sequence[str]):
+        """
+        Pipelines the writing of the documents if `markdown_pipeline_depth` is set:
+        the next doctrees are loaded, and the outputs are written, while the current document is translated.
+        """
+        docnames = self._write_from_ir(docnames)
+        depth = self.config.markdown_pipeline_depth
+        if depth <= 0 and self.timeline is None:
+            super()._write_serial(docnames)
+            return
+
+        build_timeline = self.timeline
+        timeline = build_timeline if build_timeline is not None else StageTimeline()
+        self.timeline = self.output_writer.timeline = timeline
+        try:
+            with logging.pending_warnings(), ExitStack() as stack:
+                if depth > 0:
+                    pipeline = stack.enter_context(WritePipeline(depth, timeline))
+                    documents = pipeline.prefetch(docnames, self._load_doctree)
+                else:
+                    documents = self._iter_doctrees(docnames)
+                for docname, doctree in status_iterator(
+                    documents,
+                    __("writing output... "),
+                    "darkgreen",
+                    len(docnames),
+                    self.app.verbosity,
+                    stringify_func=_first,
+                ):
+                    self.app.phase = BuildPhase.RESOLVING
+                    with timeline.span("resolve", docname):
+                        doctree = self.env.get_and_resolve_doctree(docname, self, doctree=doctree)
+                    self.app.phase = BuildPhase.WRITING
+                    self.write_doc_serialized(docname, doctree)
+                    self.write_doc(docname, doctree)
+                with timeline.span("write-wait"):
+                    self.output_writer.wait()
+        finally:
+            self.timeline = self.output_writer.timeline = build_timeline
+
+        # When tracing, the trace has the complete timeline of the build
+        if build_timeline is None:
+            logger.info(timeline.report())
+
+    def _write_process(
+        self, docs: List[Tuple[str, nodes.document, Dict[str, nodes.document]]]
+    ) -> List[Tuple[str, Any]]:
+        """Writes a chunk of documents in a parallel worker"""
+        self.app.phase = BuildPhase.WRITING
+        self._start_worker()
+        start = time.perf_counter()
+        for docname, doctree, variant_doctrees in docs:
+            for name, variant_doctree in variant_doctrees.items():
+                self._variant_doctrees[name, docname] = variant_doctree
+            self.write_doc(docname, doctree)
+        if self.schedule_report is not None:
+            run = BatchRun([docname for docname, _, _ in docs], start, time.perf_counter(), os.getpid())
+            self._add_result("batch", run)
+        return self._finish_worker()
+
+    def _write_parallel(self, docnames: Sequence[str], nproc: int):
+        """
+        Same as the Sphinx implementation, except the workers pass their results back to the main process.
+        """
+
+        def on_chunk_done(_args, results: List[Tuple[str, Any]]):
+            self._handle_worker_results(results)
+            next(progress)
+
+        docnames = self._write_from_ir(docnames)
+        if not docnames:
+            return
+
+        # warm up caches/compile templates using the first document
+        firstname, docnames = docnames[0], docnames[1:]
+        self.app.phase = BuildPhase.RESOLVING
+        with self._span("resolve", firstname):
+            doctree = self.env.get_and_resolve_doctree(firstname, self)
+        self.app.phase = BuildPhase.WRITING
+        self.write_doc_serialized(firstname, doctree)
+        self.write_doc(firstname, doctree)
+
+        # The chunks are started in their order (longest-processing-time first, with a schedule history)
+        tasks = BatchDispatcher(nproc)
+        if self.schedule_history is None:
+            chunks = parallel.make_chunks(docnames, nproc)
+        else:
+            chunks = make_batches(self.schedule_history.estimates(docnames), nproc)
+            self.schedule_report = ScheduleReport(nproc)
+        progress = status_iterator(chunks, __("writing output... "), "darkgreen", len(chunks), self.app.verbosity)
+
+        self.app.phase = BuildPhase.RESOLVING
+        for chunk in chunks:
+            arg = []
+            for docname in chunk:
+                with self._span("resolve", docname):
+                    doctree = self.env.get_and_resolve_doctree(docname, self)
+                self.write_doc_serialized(docname, doctree)
+                # The doctrees of the variants are passed to the worker, and released with its task
+                arg.append((docname, doctree, self._pop_variant_doctrees(docname)))
+            tasks.add_task(self._write_process, arg, on_chunk_done)
+
+        # make sure all threads have finished
+        tasks.join()
+        logger.info("")
+        if self.schedule_report is not None:
+            logger.info(self.schedule_report.report())
+
+    def write_doctrees(self, docnames: Set[str]):
+        """
+        Writes the documents of the loaded environment, without a read phase (see `convert.DoctreeConverter`).
+        Same as the write phase of a build, except the dependent documents are not added.
+        """
+        self.parallel_ok = parallel.parallel_available and self.app.parallel > 1
+        if self.parallel_ok:
+            self.parallel_ok = self.app.is_parallel_allowed("write")
+        self.prepare_writing(docnames)
+        if self.parallel_ok and len(docnames) > 1:
+            self._write_parallel(sorted(docnames), nproc=self.app.parallel - 1)
+        else:
+            self._write_serial(sorted(docnames))
+        self.finish()
+
+    def finish(self):
+        with self._span("finish"):
+            self._finish()
+
+    def _finish(self):
+        self.output_writer.close()
+        self.failed_outputs.update(self.output_writer.failed)
+        stats = self.url_resolver.stats
+        logger.verbose(
+            "URL resolution cache: %d hits, %d misses (%.1f%% hit rate), %d evictions",
+            stats.hits,
+            stats.misses,
+            100 * stats.hit_rate,
+            stats.evictions,
+        )
+        if self.render_cache is not None:
+            stats = self.render_cache.stats
+            logger.info(
+                "render cache: %d hits, %d misses (%.1f%% hit rate), %d evictions",
+                stats.hits,
+                stats.misses,
+                100 * stats.hit_rate,
+                stats.evictions,
+            )
+        if self.post_processors is not None:
+            logger.info(self.post_processors.report())
+        if self.content_store is not None:
+            stats = self.content_store.stats
+            logger.info(
+                "content store: %d outputs reused, %d added to %s", stats.hits, stats.misses, self.content_store.root
+            )
+        if self.profiler is not None:
+            summary_path = self.profiler.dump(os.path.join(self.outdir, PROFILE_DIR))
+            logger.info(__("profiles of the %d slowest documents are in %s"), len(self.profiler.profiles), summary_path)
+        if self.memory_report is not None and self.config.markdown_memory_report:
+            # The output writer is closed, so the report is written synchronously
+            self._write_file(os.path.join(self.outdir, self.config.markdown_memory_report), self.memory_report.dumps())
+        if self.schedule_history is not None:
+            with io_handler(self.schedule_history.file_path):
+                self.schedule_history.save(self.env.found_docs)
+        if self.change_tracker is not None:
+            self._write_changes()
+        if self.database is not None:
+            self._write_database()
+
+    def _write_database(self):
+        try:
+            self.database.flush()
+            self.database.prune(self.env.found_docs)
+        except sqlite3.Error as err:
+            logger.warning(__("error writing the database %s: %s"), self.database.file_path, err)
+        finally:
+            self.database.close()
+
+    def _write_changes(self):
+        with io_handler(self.change_tracker.manifest_path):
+            changes = self.change_tracker.finish(
+                self.env.found_docs, self.config.markdown_delete_orphans, self.failed_outputs
+            )
+            logger.info(
+                "outputs: %d added, %d modified, %d unchanged, %d deleted, %d orphaned",
+                len(changes.added),
+                len(changes.modified),
+                len(changes.unchanged),
+                len(changes.deleted),
+                len(changes.orphaned),
+            )
+            if self.config.markdown_changes:
+                self._write_file(os.path.join(self.outdir, self.config.markdown_changes), changes.dumps())
 
     def write_doc(self, docname: str, doctree: nodes.document):
+        start = time.perf_counter()
+        if self.profiler is None and self.memory_report is None:
+            size, _ = self._write_doc(docname, doctree)
+        else:
+            size = self._write_doc_instrumented(docname, doctree)
+        if self.schedule_history is not None:
+            cost = DocumentCost(docname, time.perf_counter() - start, size)
+            self._add_result("cost", [cost])
+
+    def _add_costs(self, costs: List[DocumentCost]):
+        self.schedule_history.add(costs)
+        if self.schedule_report is not None:
+            self.schedule_report.add_costs(costs)
+
+    def _add_batch(self, run: BatchRun):
+        self.schedule_report.add_run(run)
+
+    def _write_doc_instrumented(self, docname: str, doctree: nodes.document) -> int:
+        peak_memory = None
+        with ExitStack() as stack:
+            if self.memory_report is not None:
+                peak_memory = stack.enter_context(trace_peak_memory())
+            if self.profiler is not None:
+                stack.enter_context(self.profiler.profile(docname))
+            size, stats = self._write_doc(docname, doctree)
+        if peak_memory is not None:
+            self._record_memory(docname, peak_memory[0], size, stats)
+        return size
+
+    def _record_memory(self, docname: str, peak_memory: int, size: int, stats: TranslatorStats):
+        record = DocumentMemory(
+            docname,
+            peak_memory,
+            size,
+            stats.context_depth,
+            stats.status_depth,
+            stats.fragments,
+        )
+        for violation in self.memory_report.budget.violations(record):
+            logger.warning(__("memory budget exceeded: %s"), violation, location=docname)
+        self._add_result("memory", [record])
+
+    @contextmanager
+    def _use_variant(self, variant: OutputVariant):
+        """Renders with the URL resolution and the translator configuration of the variant"""
+        url_resolver, translator_config = self.url_resolver, self.translator_config
+        self.url_resolver, self.translator_config = variant.url_resolver, variant.translator_config
+        try:
+            yield
+        finally:
+            self.url_resolver, self.translator_config = url_resolver, translator_config
+
+    def write_doc_serialized(self, docname: str, doctree: nodes.document):
+        """
+        The resolved references depend on the document suffix (see `get_target_uri()`).
+        So the variants with another suffix must resolve their own copy, in the main process.
+        """
+        super().write_doc_serialized(docname, doctree)
+        for variant in self.variants:
+            if variant.doc_suffix != self.url_resolver.doc_suffix:
+                with self._use_variant(variant):
+                    self._variant_doctrees[variant.name, docname] = self.env.get_and_resolve_doctree(docname, self)
+
+    def _pop_variant_doctrees(self, docname: str) -> Dict[str, nodes.document]:
+        return {
+            variant.name: self._variant_doctrees.pop((variant.name, docname))
+            for variant in self.variants
+            if (variant.name, docname) in self._variant_doctrees
+        }
+
+    def _write_doc(self, docname: str, doctree: nodes.document) -> Tuple[int, TranslatorStats]:
+        """Writes the document and its variants. Returns the size and the translator stats of its (main) output."""
         self.current_doc_name = docname
         self.sec_numbers = self.env.toc_secnumbers.get(docname, {})
+        if self.incremental_sections:
+            self.previous_ir = load_ir(ir_path(self.doctreedir, docname))
+        try:
+            self._translate(docname, doctree, self.outdir)
+        finally:
+            self.previous_ir = None
+        size, stats = len(self.writer.output), self.writer.stats
+        segments = self.writer.segments
+        if segments is not None:
+            logger.verbose("%s: reused %d of %d sections", docname, segments.spliced, len(segments.keys))
+
+        document_ir = self.writer.ir
+        if document_ir is not None:
+            file_path = ir_path(self.doctreedir, docname)
+            with io_handler(file_path):
+                save_ir(file_path, document_ir)
+        self._write_record(docname)
+        self._write_variants(docname, doctree, document_ir)
+        return size, stats
+
+    def _write_record(self, docname: str):
+        if self.database is not None:
+            self._add_result("database", DocumentRecord(docname, self.writer.output, self.writer.sections))
+
+    def _write_variants(self, docname: str, doctree: Optional[nodes.document], document_ir: Optional[DocumentIR]):
+        """The variants share the loaded (and usually the resolved) doctree, or the IR"""
+        for variant in self.variants:
+            with self._use_variant(variant):
+                variant_doctree = self._variant_doctrees.pop((variant.name, docname), None)
+                if variant_doctree is None and document_ir is not None:
+                    self._render_ir(docname, document_ir, variant.outdir)
+                else:
+                    self._translate(docname, doctree if variant_doctree is None else variant_doctree, variant.outdir)
+
+    def _write_from_ir(self, docnames: Sequence[str]) -> List[str]:
+        """
+        Renders the documents that have an IR of the current environment, without loading their doctree.
+        Returns the other documents.
+        """
+        if self.ir_fingerprint is None or any(
+            variant.doc_suffix != self.url_resolver.doc_suffix for variant in self.variants
+        ):
+            return list(docnames)
+
+        remaining = []
+        for docname in docnames:
+            with self._span("load-ir", docname):
+                document_ir = load_ir(ir_path(self.doctreedir, docname))
+            if document_ir is None or document_ir.fingerprint != self.ir_fingerprint:
+                remaining.append(docname)
+                continue
+            self.current_doc_name = docname
+            self._render_ir(docname, document_ir, self.outdir)
+            self._write_record(docname)
+            self._write_variants(docname, None, document_ir)
+
+        if len(remaining) < len(docnames):
+            logger.info(__("rendered %d documents from their IR"), len(docnames) - len(remaining))
+        return remaining
+
+    def _render_ir(self, docname: str, document_ir: DocumentIR, outdir: str):
+        with self._span("render-ir", docname):
+            self.writer.output, self.writer.sections = render_ir(document_ir, self.translator_config, self.url_resolver)
+        self._write_output(docname, outdir)
+
+    def _translate(self, docname: str, doctree: nodes.document, outdir: str):
         destination = StringOutput(encoding="utf-8")
-        self.writer.write(doctree, destination)
-        out_filename = os.path.join(self.outdir, f"{os_path(docname)}{self.out_suffix}")
-        ensuredir(os.path.dirname(out_filename))
+        with self._span("translate", docname):
+            self.writer.write(doctree, destination)
+        self._write_output(docname, outdir)
+
+    def _write_output(self, docname: str, outdir: str):
+        if self.post_processors is not None:
+            with self._span("post-process", docname):
+                self.writer.output, self.writer.sections = self.post_processors.run(
+                    docname, self.writer.output, self.writer.sections
+                )
+        if self.output_sink is not None and outdir == self.outdir:
+            self._add_result("output", (docname, self.writer.output))
+        else:
+            out_filename = os.path.join(outdir, f"{os_path(docname)}{self.out_suffix}")
+            self._write_file(out_filename, self.writer.output)
+            if self.change_tracker is not None and outdir == self.outdir:
+                self._add_result("written", (docname, content_hash(self.writer.output)))
+
+        if self.config.markdown_chunks:
+            self._write_chunks(docname, outdir)
+
+    def _send_output(self, output: Tuple[str, str]):
+        if self.output_sink is not None:
+            self.output_sink(*output)
+
+    def _write_chunks(self, docname: str, outdir: str):
+        chunks = make_chunks(docname, self.writer.output, self.writer.sections, self.config.markdown_chunk_max_chars)
+        chunks_filename = os.path.join(outdir, f"{os_path(docname)}{CHUNKS_SUFFIX}")
+        self._write_file(chunks_filename, dump_chunks(chunks))
 
-        with io_handler(out_filename):
-            with open(out_filename, "w", encoding="utf-8") as file:
-                file.write(self.writer.output)
+    def _write_file(self, file_path: str, content: str):
+        self.output_writer.write(file_path, content)
@@ -0,0 +1,135 @@
+"""
+Change set of the output files of a build (see `markdown_changes`), for an incremental sync of the output directory.
+
+The hashes of the outputs are kept in a manifest in the output directory.
+At the end of a build, the written outputs are compared to the manifest, so the change set lists the added,
+modified (with their new hash), unchanged and deleted outputs, without scanning the output directory.
+Only the outputs that were actually written are added or modified: a failed write keeps its previous output.
+The outputs of the documents that no longer exist can be deleted (see `markdown_delete_orphans`);
+otherwise, they are listed as orphaned while they remain in the output directory.
+"""
+
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from typing import AbstractSet, Dict, Iterable, List, Optional, Tuple
+
+from sphinx.util.osutil import os_path
+
+from sphinx_markdown_builder.chunks import CHUNKS_SUFFIX
+from sphinx_markdown_builder.store import blob_digest
+
+MANIFEST_FILE = ".markdown-outputs.json"
+
+
+def content_hash(content: str) -> str:
+    """The same hash as the blob of the output in a content store"""
+    return blob_digest(content.encode("utf-8"))
+
+
+@dataclass
+class ChangeSet:
+    added: Dict[str, str] = field(default_factory=dict)  # Output path: hash
+    modified: Dict[str, str] = field(default_factory=dict)
+    unchanged: List[str] = field(default_factory=list)
+    deleted: List[str] = field(default_factory=list)
+    orphaned: List[str] = field(default_factory=list)  # Outputs of the removed documents, not deleted
+
+    def dumps(self) -> str:
+        return json.dumps(asdict(self), indent=1, sort_keys=True)
+
+
+class ChangeTracker:
+    def __init__(self, outdir: str, out_suffix: str):
+        self.outdir = outdir
+        self.out_suffix = out_suffix
+        self.manifest_path = os.path.join(outdir, MANIFEST_FILE)
+        self.written: Dict[str, str] = {}  # Docname: hash of its output
+
+    def add(self, written: Tuple[str, str]):
+        docname, digest = written
+        self.written[docname] = digest
+
+    def output_name(self, docname: str) -> str:
+        """The output path, relative to the output directory (with `/` separators)"""
+        return f"{docname}{self.out_suffix}"
+
+    def output_path(self, docname: str) -> str:
+        return os.path.join(self.outdir, f"{os_path(docname)}{self.out_suffix}")
+
+    def load_manifest(self) -> Dict[str, str]:
+        try:
+            with open(self.manifest_path, encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def _existing_hash(self, docname: str) -> Optional[str]:
+        """The hash of an output that was not written in this build, and is not in the manifest"""
+        try:
+            with open(self.output_path(docname), encoding="utf-8") as file:
+                return content_hash(file.read())
+        except (OSError, ValueError):
+            return None
+
+    def compare(self, docnames: Iterable[str], previous: Dict[str, str]) -> ChangeSet:
+        changes = ChangeSet()
+        for docname in sorted(docnames):
+            name = self.output_name(docname)
+            digest = self.written.get(docname, None)
+            if digest is None:
+                if name in previous or self._existing_hash(docname) is not None:
+                    changes.unchanged.append(name)
+            elif name not in previous:
+                changes.added[name] = digest
+            elif previous[name] != digest:
+                changes.modified[name] = digest
+            else:
+                changes.unchanged.append(name)
+        current = {self.output_name(docname) for docname in docnames}
+        changes.orphaned = sorted(name for name in previous if name not in current)
+        return changes
+
+    def discard(self, failed_paths: AbstractSet[str]):
+        """Forgets the outputs whose write failed: their previous output (if any) remains"""
+        for docname in [docname for docname in self.written if self.output_path(docname) in failed_paths]:
+            del self.written[docname]
+
+    def finish(
+        self, docnames: Iterable[str], delete_orphans: bool = False, failed_paths: AbstractSet[str] = frozenset()
+    ) -> ChangeSet:
+        """Compares the outputs to the manifest, deletes the orphans (if enabled), and updates the manifest"""
+        docnames = set(docnames)
+        self.discard(failed_paths)
+        previous = self.load_manifest()
+        changes = self.compare(docnames, previous)
+
+        manifest = {}
+        for docname in docnames:
+            name = self.output_name(docname)
+            digest = self.written.get(docname, None) or previous.get(name, None) or self._existing_hash(docname)
+            if digest is not None:
+                manifest[name] = digest
+        if delete_orphans:
+            for name in changes.orphaned:
+                self._delete(name)
+            changes.deleted, changes.orphaned = changes.orphaned, []
+        else:
+            # Kept in the manifest, so they are listed as orphaned until they are deleted
+            changes.orphaned = [name for name in changes.orphaned if os.path.exists(self._file_paths(name)[0])]
+            manifest.update((name, previous[name]) for name in changes.orphaned)
+
+        with open(self.manifest_path, "w", encoding="utf-8") as file:
+            json.dump(manifest, file, indent=1, sort_keys=True)
+        return changes
+
+    def _file_paths(self, name: str) -> Tuple[str, str]:
+        """The output and the chunks of a document"""
+        docname = name[: -len(self.out_suffix)] if self.out_suffix else name
+        return self.output_path(docname), os.path.join(self.outdir, f"{os_path(docname)}{CHUNKS_SUFFIX}")
+
+    def _delete(self, name: str):
+        """Deletes the output of a document that no longer exists (and its chunks)"""
+        for file_path in self._file_paths(name):
+            if os.path.exists(file_path):
+                os.remove(file_path)
@@ -0,0 +1,130 @@
+"""
+Section-level chunks of the generated markdown, for retrieval pipelines.
+
+The translator marks the section boundaries while it renders a document.
+The chunks are the regions between these boundaries, further split by a maximal size.
+Offsets are bytes into the UTF-8 encoded markdown file.
+The anchors of a chunk are the IDs of its section, and the anchors in its content (e.g., targets and signatures).
+"""
+
+import html
+import json
+import re
+from dataclasses import asdict, dataclass
+from typing import Iterable, Iterator, List, Sequence, Tuple
+
+CHUNKS_SUFFIX = ".chunks.jsonl"
+CHARS_PER_TOKEN = 4
+PARAGRAPH_BREAK = "\n\n"
+ANCHOR_PATTERN = re.compile(r'<a id="([^"]*)"></a>')  # See `MarkdownTranslator._add_anchor()`
+
+
+@dataclass(frozen=True)
+class SectionMark:
+    offset: int  # Character offset of the section boundary in the output
+    path: Tuple[str, ...] = ()  # Titles of the enclosing sections
+    anchors: Tuple[str, ...] = ()  # IDs of the innermost enclosing section
+
+
+@dataclass(frozen=True)
+class Chunk:  # pylint: disable=too-many-instance-attributes
+    docname: str
+    index: int
+    path: Tuple[str, ...]
+    anchors: Tuple[str, ...]
+    start: int  # Byte offset of the first character
+    end: int  # Byte offset after the last character
+    chars: int
+    tokens: int
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), ensure_ascii=False)
+
+
+def estimate_tokens(chars: int) -> int:
+    """A cheap approximation of the number of tokens"""
+    return -(-chars // CHARS_PER_TOKEN)
+
+
+class _ByteOffsets:  # pylint: disable=too-few-public-methods
+    """Converts (non-decreasing) character offsets to UTF-8 byte offsets in a single pass"""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.char_offset = 0
+        self.byte_offset = 0
+
+    def __call__(self, char_offset: int) -> int:
+        assert char_offset >= self.char_offset, "Offsets must be non-decreasing"
+        segment = self.text[self.char_offset : char_offset]  # noqa: E203
+        self.byte_offset += len(segment.encode("utf-8"))
+        self.char_offset = char_offset
+        return self.byte_offset
+
+
+def content_anchors(text: str, start: int, end: int) -> Iterator[str]:
+    """The IDs of the anchors in a region of the text"""
+    for match in ANCHOR_PATTERN.finditer(text, start, end):
+        yield html.unescape(match.group(1))
+
+
+def _strip_span(text: str, start: int, end: int) -> Tuple[int, int]:
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return start, end
+
+
+def _split_span(text: str, start: int, end: int, max_chars: int) -> Iterator[Tuple[int, int]]:
+    """Splits a span to parts of at most `max_chars`, preferring paragraph and line breaks"""
+    while 0 < max_chars < end - start:
+        limit = start + max_chars
+        split = text.rfind(PARAGRAPH_BREAK, start + 1, limit)
+        if split < 0:
+            split = text.rfind("\n", start + 1, limit)
+        if split < 0:
+            split = limit
+        part_start, part_end = _strip_span(text, start, split)
+        if part_start < part_end:
+            yield part_start, part_end
+        start, end = _strip_span(text, split, end)
+    if start < end:
+        yield start, end
+
+
+def iter_spans(text: str, sections: Sequence[SectionMark]) -> Iterator[Tuple[int, int, SectionMark]]:
+    """Yields the (stripped) region of each section, including the preamble before the first section"""
+    marks = [SectionMark(0), *sorted(sections, key=lambda mark: mark.offset)]
+    ends = [mark.offset for mark in marks[1:]] + [len(text)]
+    for mark, end in zip(marks, ends):
+        start, end = _strip_span(text, mark.offset, end)
+        if start < end:
+            yield start, end, mark
+
+
+def make_chunks(docname: str, text: str, sections: Sequence[SectionMark], max_chars: int = 0) -> List[Chunk]:
+    """Splits a rendered document to its section chunks"""
+    to_bytes = _ByteOffsets(text)
+    chunks = []
+    for start, end, mark in iter_spans(text, sections):
+        for part_start, part_end in _split_span(text, start, end, max_chars):
+            chars = part_end - part_start
+            chunks.append(
+                Chunk(
+                    docname=docname,
+                    index=len(chunks),
+                    path=mark.path,
+                    anchors=tuple(dict.fromkeys((*mark.anchors, *content_anchors(text, part_start, part_end)))),
+                    start=to_bytes(part_start),
+                    end=to_bytes(part_end),
+                    chars=chars,
+                    tokens=estimate_tokens(chars),
+                )
+            )
+    return chunks
+
+
+def dump_chunks(chunks: Iterable[Chunk]) -> str:
+    """JSONL content of the chunks"""
+    return "".join(f"{chunk.to_json()}\n" for chunk in chunks)
@@ -0,0 +1,71 @@
+"""
+Markdown as a side output of another builder (e.g., html), from the same read phase.
+
+If `markdown_cobuild_dir` is set, the documents that the primary builder writes are tracked
+(by the `doctree-resolved` event, which is emitted in the main process, also with `-j`).
+When the build is finished, they are resolved again for the markdown builder, and written to that directory.
+The markdown builder is initialized with the primary builder, so its event listeners (e.g., of `markdown_trace`)
+follow the whole build.
+"""
+
+import os
+from typing import Optional, Set
+
+from docutils import nodes
+from sphinx.application import Sphinx
+from sphinx.util import logging
+
+from sphinx_markdown_builder.builder import MarkdownBuilder
+
+logger = logging.getLogger(__name__)
+
+
+class MarkdownCoBuild:  # pylint: disable=too-few-public-methods
+    def __init__(self, app: Sphinx, outdir: str):
+        self.app = app
+        # Relative to the output directory of the primary builder
+        self.outdir = os.path.normpath(os.path.join(app.outdir, outdir))
+        self.docnames: Set[str] = set()
+        self.builder: Optional[MarkdownBuilder] = None
+        self.writing = False
+
+    def connect(self):
+        self.app.connect("doctree-resolved", self._on_doctree_resolved)
+        # Before the listeners of the markdown builder, so its trace (if any) is written after the markdown
+        self.app.connect("build-finished", self._on_build_finished)
+        self.builder = self._create_builder()
+
+    def _on_doctree_resolved(self, _app, _doctree: nodes.document, docname: str):
+        # The documents that the markdown builder resolves are not tracked
+        if not self.writing:
+            self.docnames.add(docname)
+
+    def _create_builder(self) -> MarkdownBuilder:
+        builder = MarkdownBuilder(self.app, self.app.env)
+        builder.outdir = self.outdir
+        builder.init()
+        return builder
+
+    def _on_build_finished(self, _app, exception: Optional[Exception]):
+        try:
+            if exception is None and self.docnames:
+                self._write()
+        finally:
+            self.builder.cleanup()
+
+    def _write(self):
+        logger.info("writing markdown of %d documents to %s", len(self.docnames), self.outdir)
+        self.writing = True
+        # The post-transforms resolve the references for `app.builder`
+        primary_builder, self.app.builder = self.app.builder, self.builder
+        try:
+            self.builder.write_doctrees(self.docnames)
+        finally:
+            self.app.builder = primary_builder
+            self.writing = False
+
+
+def on_builder_inited(app: Sphinx):
+    outdir = app.config.markdown_cobuild_dir
+    if outdir and app.builder.name != MarkdownBuilder.name:
+        MarkdownCoBuild(app, outdir).connect()
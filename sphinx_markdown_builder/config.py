@@ -0,0 +1,53 @@
+"""
+Configuration snapshot for the markdown translator.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from typing import Any
+
+from docutils import languages
+
+from sphinx_markdown_builder.contexts import MetaContext, SubContext
+
+DOC_INFO_FIELDS = "author", "contact", "copyright", "date", "organization", "revision", "status", "version"
+
+
+def settings_hash(config) -> str:
+    """Hashes the `markdown_*` configurations"""
+    settings = sorted((option.name, repr(option.value)) for option in config if option.name.startswith("markdown_"))
+    return hashlib.blake2b(repr(settings).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def render_doc_info(config) -> str:
+    """Renders the document info header from the project configuration"""
+    doc_info = SubContext()
+    for key in DOC_INFO_FIELDS:
+        value = getattr(config, key, "")
+        if isinstance(value, str):
+            meta = MetaContext(key)
+            meta.add(value)
+            doc_info.add(meta.make(), meta.params.prefix_eol, meta.params.suffix_eol)
+    return doc_info.make()
+
+
+@dataclass(frozen=True)
+class TranslatorConfig:
+    """
+    Invariants of the translator during a build.
+    The builder computes them once, instead of once per document.
+    """
+
+    language: Any  # The docutils language module
+    doc_info: str = ""  # Rendered document info header
+    anchor_sections: bool = False
+    anchor_signatures: bool = False
+
+    @classmethod
+    def from_config(cls, config, language_code: str, reporter=None) -> "TranslatorConfig":
+        return cls(
+            language=languages.get_language(language_code, reporter),
+            doc_info=render_doc_info(config) if config.markdown_docinfo else "",
+            anchor_sections=bool(config.markdown_anchor_sections),
+            anchor_signatures=bool(config.markdown_anchor_signatures),
+        )
@@ -7,7 +7,7 @@ import sys
 import textwrap
 import typing
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, Generic, Iterator, List, Optional, Type, TypeVar, Union
+from typing import Any, Callable, Dict, Generic, Iterable, Iterator, List, Optional, Tuple, Type, TypeVar, Union
 
 from tabulate import tabulate
 
@@ -151,11 +151,55 @@ class SubContext:
         self.content.append(value)
         self.ensure_eol_count = suffix_eol
 
+    def add_unique(self, value: str, prefix_eol: int = 0, suffix_eol: int = 0):
+        """Add `value` to current context, unless it already contains it"""
+        if value not in self.content:
+            self.add(value, prefix_eol, suffix_eol)
+
     def make(self) -> str:
         """Generate the context's content"""
         return "".join(self.content)
 
 
+# A call of a `SubContext` method: (method name, *arguments)
+Operation = Tuple[Any, ...]
+
+
+def replay(operations: Iterable[Operation], ctx: SubContext):
+    for name, *args in operations:
+        getattr(ctx, name)(*args)
+
+
+class RecordingContext(SubContext):
+    """
+    Records the operations applied to it, instead of applying them.
+    Replaying the operations on another context has the same result as applying them to it directly.
+    """
+
+    def __init__(self, params=SubContextParams()):
+        super().__init__(params)
+        self.operations: List[Operation] = []
+
+    def ensure_eol(self, count: int = 1):
+        self.operations.append(("ensure_eol", count))
+
+    def force_eol(self, count: int = 1):
+        self.operations.append(("force_eol", count))
+
+    def add(self, value: str, prefix_eol: int = 0, suffix_eol: int = 0):
+        if value:
+            self.operations.append(("add", value, prefix_eol, suffix_eol))
+
+    def add_unique(self, value: str, prefix_eol: int = 0, suffix_eol: int = 0):
+        if value:
+            self.operations.append(("add_unique", value, prefix_eol, suffix_eol))
+
+    def make(self) -> str:
+        ctx = SubContext()
+        replay(self.operations, ctx)
+        return ctx.make()
+
+
 class WrappedContext(SubContext):
     def __init__(
         self,
@@ -169,8 +213,7 @@ class WrappedContext(SubContext):
         self.suffix = suffix if suffix is not None else prefix
         self.wrap_empty = wrap_empty
 
-    def make(self):
-        content = super().make()
+    def wrap(self, content: str) -> str:
         match = WRAP_REGEXP.fullmatch(content)
         if match is None:
             # The expression has no match only when there is no non-space character.
@@ -187,6 +230,9 @@ class WrappedContext(SubContext):
             prefix_space = SPACE
         return f"{prefix_space}{self.prefix}{text}{self.suffix}{suffix_space}"
 
+    def make(self):
+        return self.wrap(super().make())
+
 
 class CommaSeparatedContext(SubContext):
     def __init__(self, sep: str = ", ", params=SubContextParams()):
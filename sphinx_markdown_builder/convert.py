@@ -0,0 +1,141 @@
+"""
+Conversion of the doctrees of a previous build (e.g., `sphinx-build -M html`) to markdown, without a read phase.
+
+    convert_markdown source build/doctrees build/markdown -j 4
+
+The pickled environment and doctrees are loaded, resolved for the markdown builder, and written in parallel.
+The hashes of the converted doctrees are kept in a manifest, so unchanged documents are not converted again.
+A document whose output could not be written is converted again by the next conversion.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from typing import Dict, Optional, Sequence, Set
+
+from sphinx.application import Sphinx
+from sphinx.util import logging
+from sphinx.util.docutils import docutils_namespace, patch_docutils
+from sphinx.util.osutil import os_path
+
+from sphinx_markdown_builder.config import settings_hash
+
+MANIFEST_FILE = ".markdown-manifest.json"
+HASH_BLOCK_SIZE = 2**20
+
+logger = logging.getLogger(__name__)
+
+
+def file_hash(file_path: str) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, "rb") as file:
+        for block in iter(lambda: file.read(HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class DoctreeConverter:
+    def __init__(self, app: Sphinx):
+        self.app = app
+        self.manifest_path = os.path.join(app.outdir, MANIFEST_FILE)
+
+    def _doctree_path(self, docname: str) -> str:
+        return os.path.join(self.app.doctreedir, f"{docname}.doctree")
+
+    def _output_path(self, docname: str) -> str:
+        return os.path.join(self.app.outdir, f"{os_path(docname)}{self.app.builder.out_suffix}")
+
+    def load_manifest(self) -> Dict[str, str]:
+        """
+        The doctree hashes of the converted documents, if they were converted with the same settings.
+        The `markdown_*` configurations invalidate all the converted documents when changed.
+        """
+        try:
+            with open(self.manifest_path, encoding="utf-8") as file:
+                manifest = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        if manifest.get("settings") != settings_hash(self.app.config):
+            return {}
+        return manifest.get("documents", {})
+
+    def save_manifest(self, hashes: Dict[str, str]):
+        os.makedirs(self.app.outdir, exist_ok=True)
+        with open(self.manifest_path, "w", encoding="utf-8") as file:
+            json.dump({"settings": settings_hash(self.app.config), "documents": hashes}, file, indent=1, sort_keys=True)
+
+    def convert(self, force: bool = False) -> Set[str]:
+        """Converts the documents whose doctree changed since their last conversion. Returns them."""
+        previous = {} if force else self.load_manifest()
+        hashes = {docname: file_hash(self._doctree_path(docname)) for docname in sorted(self.app.env.all_docs)}
+        outdated = {
+            docname
+            for docname, doctree_hash in hashes.items()
+            if previous.get(docname, None) != doctree_hash or not os.path.exists(self._output_path(docname))
+        }
+        logger.info("%d of %d documents changed", len(outdated), len(hashes))
+        self._write(outdated)
+
+        # The documents whose output could not be written keep their previous hash, so they are converted again
+        failed = {docname for docname in outdated if self._output_path(docname) in self.app.builder.failed_outputs}
+        for docname in failed:
+            if docname in previous:
+                hashes[docname] = previous[docname]
+            else:
+                del hashes[docname]
+        self.save_manifest(hashes)
+        return outdated - failed
+
+    def _write(self, docnames: Set[str]):
+        """Writes the documents, and finishes the build like `Sphinx.build()` (e.g., for the trace)"""
+        try:
+            self.app.builder.write_doctrees(docnames)
+        except Exception as err:
+            self.app.events.emit("build-finished", err)
+            raise
+        self.app.events.emit("build-finished", None)
+        self.app.builder.cleanup()
+
+
+def parse_overrides(definitions: Sequence[str]) -> Dict[str, str]:
+    overrides = {}
+    for definition in definitions:
+        name, _, value = definition.partition("=")
+        overrides[name] = value
+    return overrides
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="convert_markdown", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("sourcedir", help="the sources of the previous build (for its conf.py)")
+    parser.add_argument("doctreedir", help="the doctrees (and environment.pickle) of the previous build")
+    parser.add_argument("outdir")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="number of parallel processes")
+    parser.add_argument("-a", "--all", action="store_true", help="convert all the documents, even if unchanged")
+    parser.add_argument("-D", dest="define", action="append", default=[], metavar="setting=value")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = parse_args(argv)
+    with patch_docutils(args.sourcedir), docutils_namespace():
+        app = Sphinx(
+            args.sourcedir,
+            args.sourcedir,
+            args.outdir,
+            args.doctreedir,
+            "markdown",
+            confoverrides=parse_overrides(args.define),
+            parallel=args.jobs,
+        )
+        if not app.env.all_docs:
+            logger.error("no environment of a previous build in %s", args.doctreedir)
+            return 1
+        DoctreeConverter(app).convert(force=args.all)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,128 @@
+"""
+SQLite export of the generated markdown, with a full-text search index.
+
+Tables:
+  documents: the rendered markdown of each document.
+  sections: the section chunks of each document (byte offsets into the markdown).
+  anchors: the anchors of the sections and their content (e.g., targets and signatures), for resolving links.
+  search: an FTS5 index of the section contents.
+"""
+
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Sequence
+
+from sphinx_markdown_builder.chunks import SectionMark, make_chunks
+
+BATCH_SIZE = 1000
+PATH_SEPARATOR = " > "
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    docname TEXT PRIMARY KEY,
+    markdown TEXT NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sections (
+    docname TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    path TEXT NOT NULL,
+    start INTEGER NOT NULL,
+    end INTEGER NOT NULL,
+    PRIMARY KEY (docname, idx)
+);
+CREATE TABLE IF NOT EXISTS anchors (
+    anchor TEXT NOT NULL,
+    docname TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    PRIMARY KEY (docname, anchor)
+);
+CREATE INDEX IF NOT EXISTS anchors_by_name ON anchors (anchor);
+CREATE VIRTUAL TABLE IF NOT EXISTS search USING fts5 (
+    docname UNINDEXED,
+    idx UNINDEXED,
+    title,
+    content
+);
+"""
+
+DOC_TABLES = "documents", "sections", "anchors", "search"
+
+
+@dataclass(frozen=True)
+class DocumentRecord:
+    docname: str
+    markdown: str
+    sections: Sequence[SectionMark]
+
+
+class MarkdownDatabase:
+    """Writes documents to the database in large batches"""
+
+    def __init__(self, file_path: str, batch_size: int = BATCH_SIZE):
+        self.file_path = file_path
+        self.batch_size = batch_size
+        self.pending: List[DocumentRecord] = []
+        self._connection: Optional[sqlite3.Connection] = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        # Connect lazily, so the connection is only used by the process that writes
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.file_path)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.executescript(SCHEMA)
+        return self._connection
+
+    def add(self, record: DocumentRecord):
+        self.pending.append(record)
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def _delete(self, docnames: Iterable[str]):
+        params = [(docname,) for docname in docnames]
+        for table in DOC_TABLES:
+            self.connection.executemany(f"DELETE FROM {table} WHERE docname = ?", params)
+
+    def flush(self):
+        """Replaces the rows of all the pending documents in a single transaction"""
+        if not self.pending:
+            return
+
+        documents, sections, anchors, search = [], [], [], []
+        now = time.time()
+        for record in self.pending:
+            documents.append((record.docname, record.markdown, now))
+            data = record.markdown.encode("utf-8")
+            for chunk in make_chunks(record.docname, record.markdown, record.sections):
+                title = chunk.path[-1] if chunk.path else ""
+                path = PATH_SEPARATOR.join(chunk.path)
+                content = data[chunk.start : chunk.end].decode("utf-8")  # noqa: E203
+                sections.append((record.docname, chunk.index, title, path, chunk.start, chunk.end))
+                anchors.extend((anchor, record.docname, chunk.index) for anchor in chunk.anchors)
+                search.append((record.docname, chunk.index, title, content))
+
+        with self.connection:
+            self._delete(record.docname for record in self.pending)
+            self.connection.executemany("INSERT INTO documents VALUES (?, ?, ?)", documents)
+            self.connection.executemany("INSERT INTO sections VALUES (?, ?, ?, ?, ?, ?)", sections)
+            self.connection.executemany("INSERT OR IGNORE INTO anchors VALUES (?, ?, ?)", anchors)
+            self.connection.executemany("INSERT INTO search VALUES (?, ?, ?, ?)", search)
+        self.pending.clear()
+
+    def prune(self, docnames: Iterable[str]):
+        """Removes the rows of all the documents that are not in `docnames`"""
+        existing = {row[0] for row in self.connection.execute("SELECT docname FROM documents")}
+        removed = existing.difference(docnames)
+        if removed:
+            with self.connection:
+                self._delete(removed)
+
+    def close(self):
+        """Closes the connection (the pending documents must be flushed before)"""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
@@ -0,0 +1,105 @@
+"""
+Per-section incremental rendering.
+
+The IR of a document records a segment for each section of the second level (e.g., below the document title):
+the structural hash of its subtree, and the span of its operations.
+When the document is translated again, the sections with the same hash are not translated:
+their operations are copied from the previous IR, and the document is rendered from the spliced IR.
+If the sections of the document changed (added, removed, renamed or moved), or if the previous IR was translated
+by another version of the builder or with another configuration, the document is translated in full.
+"""
+
+import copy
+from typing import Dict, List, Optional, Tuple
+
+from docutils import nodes
+
+from sphinx_markdown_builder.ir import ADD, PLACEHOLDER, PLACEHOLDER_PATTERN, PUSH, DocumentIR, Segment
+from sphinx_markdown_builder.render_cache import structural_hash
+
+
+def segment_sections(document: nodes.document) -> List[nodes.section]:
+    """The sections of the second level"""
+    return [
+        child
+        for section in document.children
+        if isinstance(section, nodes.section)
+        for child in section.children
+        if isinstance(child, nodes.section)
+    ]
+
+
+def section_title(section: nodes.section) -> str:
+    return section[0].astext() if len(section) > 0 and isinstance(section[0], nodes.title) else ""
+
+
+def _shift_placeholders(value: str, offset: int) -> str:
+    return PLACEHOLDER_PATTERN.sub(lambda match: f"{PLACEHOLDER}{int(match.group(1)) + offset}{PLACEHOLDER}", value)
+
+
+def _shift_operation(operation: Tuple, offset: int) -> Tuple:
+    """Renumbers the URL placeholders of an operation"""
+    kind, *args = operation
+    if kind == ADD and PLACEHOLDER in args[0]:
+        return (kind, _shift_placeholders(args[0], offset), *args[1:])
+    if kind == PUSH and args[1]:
+        ctx = copy.deepcopy(args[0])
+        for name, value in vars(ctx).items():
+            if isinstance(value, str) and PLACEHOLDER in value:
+                setattr(ctx, name, _shift_placeholders(value, offset))
+        return (kind, ctx, *args[1:])
+    return operation
+
+
+class SegmentTracker:
+    """Records the segments of the translated sections, and splices the unchanged ones from the previous IR"""
+
+    def __init__(self, document: nodes.document, document_ir: DocumentIR, previous_ir: Optional[DocumentIR]):
+        """The IR must have the `settings` of the translation"""
+        sections = segment_sections(document)
+        self.document_ir = document_ir
+        self.document_ir.structure = tuple(section_title(section) for section in sections)
+        self.keys: Dict[int, bytes] = {id(section): structural_hash(section) for section in sections}
+        self.previous_ir = previous_ir
+        self.previous: Dict[bytes, Segment] = {}
+        reusable = previous_ir is not None and previous_ir.settings == document_ir.settings
+        if reusable and previous_ir.structure == document_ir.structure:
+            self.previous = {segment.key: segment for segment in previous_ir.segments}
+        self.spliced = 0
+        self._open: Optional[Tuple[bytes, int, int, int]] = None
+
+    def enter(self, section: nodes.section, unknown_visits: int) -> bool:
+        """Returns whether the section was spliced from the previous IR (so it must not be translated)"""
+        key = self.keys.get(id(section), None)
+        if key is None:
+            return False
+        segment = self.previous.get(key, None)
+        if segment is not None:
+            self._splice(segment)
+            return True
+        self._open = key, len(self.document_ir.operations), len(self.document_ir.urls), unknown_visits
+        return False
+
+    def leave(self, section: nodes.section, unknown_visits: int):
+        key = self.keys.get(id(section), None)
+        if key is None or self._open is None:
+            return
+        _, operations_start, urls_start, start_unknown_visits = self._open
+        self._open = None
+        # Do not reuse sections with side effects that a splice would skip (e.g., warnings)
+        if unknown_visits == start_unknown_visits:
+            self._add_segment(key, operations_start, urls_start)
+
+    def _add_segment(self, key: bytes, operations_start: int, urls_start: int):
+        operations = (operations_start, len(self.document_ir.operations))
+        urls = (urls_start, len(self.document_ir.urls))
+        self.document_ir.segments.append(Segment(key, operations, urls))
+
+    def _splice(self, segment: Segment):
+        operations_start, urls_start = len(self.document_ir.operations), len(self.document_ir.urls)
+        offset = urls_start - segment.urls[0]
+        self.document_ir.urls.extend(self.previous_ir.urls[segment.urls[0] : segment.urls[1]])  # noqa: E203
+        for operation in self.previous_ir.operations[segment.operations[0] : segment.operations[1]]:  # noqa: E203
+            self.document_ir.operations.append(_shift_operation(operation, offset) if offset else operation)
+        self._add_segment(segment.key, operations_start, urls_start)
+        self.spliced += 1
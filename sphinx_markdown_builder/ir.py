@@ -0,0 +1,230 @@
+"""
+Compact intermediate representation (IR) of the translated documents.
+
+The IR is the flat stream of the operations that the translator applied to its contexts,
+before the configuration-dependent parts are resolved:
+the reference URLs are placeholders, and the optional anchors are operations that are applied if enabled.
+Rendering an IR with other `markdown_*` settings does not need docutils, nor the doctree.
+
+The builder stores the IR of each document next to its doctree (see `markdown_ir`).
+"""
+
+import copy
+import hashlib
+import os
+import pickle
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sphinx_markdown_builder.chunks import SectionMark
+from sphinx_markdown_builder.config import TranslatorConfig, settings_hash
+from sphinx_markdown_builder.contexts import Operation, SubContext
+from sphinx_markdown_builder.urls import UrlResolver
+
+# Increment when the recorded operations (or the translator's use of them) change
+IR_VERSION = 3
+IR_SUFFIX = ".mdir"
+
+# Operations: (kind, *arguments)
+PUSH = "push"  # (context template, whether its strings have URL placeholders)
+POP = "pop"  # ()
+ADD = "add"  # (value, prefix EOL, suffix EOL)
+ENSURE_EOL = "eol"  # (count)
+CALL = "call"  # (method name) of the current context, e.g., `enter_row`
+ANCHOR = "anchor"  # (translator config option that enables it, or None, content)
+SECTION = "section"  # (titles path, anchors) of a section boundary in the root context
+
+PLACEHOLDER = "\0"
+PLACEHOLDER_PATTERN = re.compile("\0([0-9]+)\0")
+
+# A URL to resolve: ("resolve", refuri, refid, internal) or ("adjust", url)
+UrlReference = Tuple[Any, ...]
+SectionMarkIndex = Tuple[int, Tuple[str, ...], Tuple[str, ...]]
+
+
+@dataclass(frozen=True)
+class Segment:
+    """The operations (and the URLs) of a section, which can be reused if it did not change (see `incremental`)"""
+
+    key: bytes  # Structural hash of the section
+    operations: Tuple[int, int]  # Span in the operations of the IR
+    urls: Tuple[int, int]  # Span in the URLs of the IR
+
+
+@dataclass
+class DocumentIR:  # pylint: disable=too-many-instance-attributes
+    docname: str
+    fingerprint: str = ""  # The environment that the IR is valid for (see `environment_fingerprint()`)
+    operations: List[Operation] = field(default_factory=list)
+    urls: List[UrlReference] = field(default_factory=list)
+    version: int = IR_VERSION
+    structure: Tuple[str, ...] = ()  # Titles of the sections with segments
+    segments: List[Segment] = field(default_factory=list)
+    settings: str = ""  # The builder and configuration that translated the segments (see `settings_fingerprint()`)
+
+    def record(self, *operation):
+        self.operations.append(operation)
+
+    def push(self, ctx: SubContext):
+        """Records a pushed (empty) context"""
+        has_placeholder = any(isinstance(value, str) and PLACEHOLDER in value for value in vars(ctx).values())
+        self.operations.append((PUSH, copy.deepcopy(ctx), has_placeholder))
+
+    def url_placeholder(self, *reference) -> str:
+        self.urls.append(reference)
+        return f"{PLACEHOLDER}{len(self.urls) - 1}{PLACEHOLDER}"
+
+
+def compose_document(
+    doc_info: SubContext, root: SubContext, marks: Sequence[SectionMarkIndex]
+) -> Tuple[str, List[SectionMark]]:
+    """
+    Joins the document info header and the root context to the final text.
+    Converts the section marks (root body index, titles path, anchors) to character offsets in the text.
+    """
+    body = root.make()
+    ctx = SubContext()
+    for content in (doc_info.make(), body):
+        ctx.add(content.strip(), prefix_eol=2, suffix_eol=1)
+    ctx.force_eol(1)
+    text = ctx.make()
+    return text, _locate_sections(text, body, root, marks)
+
+
+def _locate_sections(text: str, body: str, root: SubContext, marks: Sequence[SectionMarkIndex]) -> List[SectionMark]:
+    stripped = body.strip()
+    # The stripped body is the last content of the text, followed by a single EOL
+    body_start = len(text) - len(stripped) - 1 if stripped else len(text)
+    lead = len(body) - len(body.lstrip())
+
+    sections = []
+    index = offset = 0
+    for mark_index, path, anchors in marks:
+        offset += sum(len(value) for value in root.body[index:mark_index])
+        index = mark_index
+        position = min(max(offset - lead, 0), len(stripped))
+        sections.append(SectionMark(body_start + position, path, anchors))
+    return sections
+
+
+class IRRenderer:  # pylint: disable=too-few-public-methods
+    """Applies the operations of an IR to fresh contexts, with the given settings"""
+
+    def __init__(self, document_ir: DocumentIR, options: TranslatorConfig, url_resolver: UrlResolver):
+        self.document_ir = document_ir
+        self.options = options
+        self.urls = [self._resolve_url(url_resolver, reference) for reference in document_ir.urls]
+        self.stack: List[SubContext] = [SubContext()]
+        self.doc_info = SubContext()
+        self.doc_info.add(options.doc_info, prefix_eol=1, suffix_eol=1)
+        self.marks: List[SectionMarkIndex] = []
+
+    def _resolve_url(self, url_resolver: UrlResolver, reference: UrlReference) -> str:
+        kind, *args = reference
+        if kind == "adjust":
+            return url_resolver.adjust_url(self.document_ir.docname, *args)
+        return url_resolver.resolve(self.document_ir.docname, *args)
+
+    def _substitute(self, value: str) -> str:
+        return PLACEHOLDER_PATTERN.sub(lambda match: self.urls[int(match.group(1))], value)
+
+    def _push(self, template: SubContext, has_placeholder: bool):
+        ctx = copy.deepcopy(template)
+        if has_placeholder:
+            for name, value in vars(ctx).items():
+                if isinstance(value, str) and PLACEHOLDER in value:
+                    setattr(ctx, name, self._substitute(value))
+        self.stack.append(ctx)
+
+    def _pop(self):
+        last_ctx = self.stack.pop()
+        ctx = self.stack[-1] if last_ctx.params.target == "body" else self.doc_info
+        ctx.add(last_ctx.make(), last_ctx.params.prefix_eol, last_ctx.params.suffix_eol)
+
+    def _add(self, value: str, prefix_eol: int, suffix_eol: int):
+        if PLACEHOLDER in value:
+            value = self._substitute(value)
+        self.stack[-1].add(value, prefix_eol, suffix_eol)
+
+    def _ensure_eol(self, count: int):
+        self.stack[-1].ensure_eol(count)
+
+    def _call(self, method: str):
+        getattr(self.stack[-1], method)()
+
+    def _anchor(self, option: Optional[str], content: str):
+        if option is None or getattr(self.options, option):
+            # Prevent adding the same anchor twice in the same context
+            self.stack[-1].add_unique(content, prefix_eol=2, suffix_eol=1)
+
+    def _section(self, path: Tuple[str, ...], anchors: Tuple[str, ...]):
+        self.marks.append((len(self.stack[-1].body), path, anchors))
+
+    def render(self) -> Tuple[str, List[SectionMark]]:
+        handlers = {
+            PUSH: self._push,
+            POP: self._pop,
+            ADD: self._add,
+            ENSURE_EOL: self._ensure_eol,
+            CALL: self._call,
+            ANCHOR: self._anchor,
+            SECTION: self._section,
+        }
+        for kind, *args in self.document_ir.operations:
+            handlers[kind](*args)
+        while len(self.stack) > 1:
+            self._pop()
+        return compose_document(self.doc_info, self.stack[0], self.marks)
+
+
+def render_ir(
+    document_ir: DocumentIR, options: TranslatorConfig, url_resolver: UrlResolver
+) -> Tuple[str, List[SectionMark]]:
+    """Returns the markdown text of the document, and its section boundaries"""
+    return IRRenderer(document_ir, options, url_resolver).render()
+
+
+def environment_fingerprint(all_docs: Dict[str, Any], doc_suffix: str, language_code: str) -> str:
+    """
+    The resolved doctrees can change when any document is read again (e.g., a title in a toctree),
+    and the resolved references depend on the document suffix.
+    The operations depend on the version of the builder, which can change them without a new `IR_VERSION`.
+    """
+    from sphinx_markdown_builder import __version__  # pylint: disable=import-outside-toplevel,cyclic-import
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{IR_VERSION}\0{__version__}\0{doc_suffix}\0{language_code}\0".encode("utf-8"))
+    for docname, read_time in sorted(all_docs.items()):
+        digest.update(f"{docname}\0{read_time}\0".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def settings_fingerprint(config, doc_suffix: str, language_code: str) -> str:
+    """The translation of a section depends on the version of the builder, and on its configuration"""
+    from sphinx_markdown_builder import __version__  # pylint: disable=import-outside-toplevel,cyclic-import
+
+    settings = f"{IR_VERSION}\0{__version__}\0{doc_suffix}\0{language_code}\0{settings_hash(config)}"
+    return hashlib.blake2b(settings.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def ir_path(doctree_dir: str, docname: str) -> str:
+    return os.path.join(doctree_dir, f"{docname}{IR_SUFFIX}")
+
+
+def save_ir(file_path: str, document_ir: DocumentIR):
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    with open(file_path, "wb") as file:
+        pickle.dump(document_ir, file, pickle.HIGHEST_PROTOCOL)
+
+
+def load_ir(file_path: str) -> Optional[DocumentIR]:
+    """Returns `None` if there is no valid IR in the file"""
+    try:
+        with open(file_path, "rb") as file:
+            document_ir = pickle.load(file)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+    if not isinstance(document_ir, DocumentIR) or document_ir.version != IR_VERSION:
+        return None
+    return document_ir
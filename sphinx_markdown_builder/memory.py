@@ -0,0 +1,82 @@
+"""
+Memory instrumentation of the write phase.
+
+For each document, records the peak depth of the translator's context and status stacks,
+the largest number of fragments in a single context, and the peak traced memory (`tracemalloc`) while writing it.
+"""
+
+import json
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Iterable, List
+
+
+@dataclass
+class TranslatorStats:
+    context_depth: int = 0  # Peak size of the context stack
+    status_depth: int = 0  # Peak size of the status stack
+    fragments: int = 0  # Largest number of fragments in a single context
+
+    def update_fragments(self, count: int):
+        self.fragments = max(self.fragments, count)
+
+
+@dataclass
+class DocumentMemory:
+    docname: str
+    peak_memory: int  # Peak traced memory while writing the document (bytes)
+    output_size: int  # Characters
+    context_depth: int
+    status_depth: int
+    fragments: int
+
+
+@dataclass
+class MemoryBudget:
+    max_memory: int = 0  # Bytes. Unlimited if zero.
+    max_depth: int = 0  # Context stack depth. Unlimited if zero.
+
+    def violations(self, record: DocumentMemory) -> List[str]:
+        violations = []
+        if 0 < self.max_memory < record.peak_memory:
+            violations.append(f"peak memory of {record.peak_memory} bytes exceeds {self.max_memory} bytes")
+        if 0 < self.max_depth < record.context_depth:
+            violations.append(f"context depth of {record.context_depth} exceeds {self.max_depth}")
+        return violations
+
+
+@contextmanager
+def trace_peak_memory():
+    """Yields a list, to which the peak traced memory is appended when the context exits"""
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    elif hasattr(tracemalloc, "reset_peak"):  # Python >= 3.9
+        tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+    result: List[int] = []
+    try:
+        yield result
+    finally:
+        _, peak = tracemalloc.get_traced_memory()
+        if started:
+            tracemalloc.stop()
+        result.append(max(0, peak - baseline))
+
+
+class MemoryReport:
+    def __init__(self, budget: MemoryBudget):
+        self.budget = budget
+        self.documents: List[DocumentMemory] = []
+
+    def add(self, records: Iterable[DocumentMemory]):
+        self.documents.extend(records)
+
+    def dumps(self) -> str:
+        """JSON report, with the documents sorted by their peak memory (descending)"""
+        documents = sorted(self.documents, key=lambda record: (-record.peak_memory, record.docname))
+        return json.dumps(
+            {"budget": asdict(self.budget), "documents": [asdict(record) for record in documents]},
+            indent=2,
+        )
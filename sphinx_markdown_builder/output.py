@@ -0,0 +1,157 @@
+"""
+Atomic and asynchronous writing of the output files.
+
+Each file is written to a temporary file in the same directory, and then replaces the target.
+So a crash, or a concurrent reader, never sees a truncated file.
+"""
+
+import errno
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from typing import TYPE_CHECKING, Iterator, List, Optional, Set
+
+if TYPE_CHECKING:  # pragma: no cover
+    from sphinx_markdown_builder.pipeline import StageTimeline
+    from sphinx_markdown_builder.store import ContentStore
+
+DEFAULT_THREADS = 0
+QUEUE_SIZE_PER_THREAD = 8
+
+
+def _fsync_dir(dir_path: str):
+    fd = os.open(dir_path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def atomic_replace(file_path: str) -> Iterator[str]:
+    """Yields a temporary path (in the same directory), which replaces the file when the block succeeds"""
+    temp_path = os.path.join(
+        os.path.dirname(file_path), f".{os.path.basename(file_path)}.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+    try:
+        yield temp_path
+        os.replace(temp_path, file_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def check_writable(file_path: str):
+    """
+    Replacing a file only requires a writable directory.
+    But, like writing in place, we refuse to replace a read-only file.
+    """
+    if os.path.exists(file_path) and not os.access(file_path, os.W_OK):
+        raise PermissionError(errno.EACCES, os.strerror(errno.EACCES), file_path)
+
+
+class OutputWriter:  # pylint: disable=too-many-instance-attributes
+    """
+    Writes files in a small thread pool, with a bounded queue of pending writes.
+    With `threads=0`, the files are written synchronously.
+    With a content store, the files are linked to its blobs (see `ContentStore.write()`).
+    The files that could not be written (whose error was handled by the error handler) are kept in `failed`.
+    """
+
+    def __init__(self, threads: int = DEFAULT_THREADS, fsync: bool = False, error_handler=None):
+        self.fsync = fsync
+        self.error_handler = error_handler or nullcontext
+        self.timeline: Optional["StageTimeline"] = None
+        self.store: Optional["ContentStore"] = None
+        self.failed: Set[str] = set()
+        self._created_dirs: Set[str] = set()
+        self._synced_dirs: Set[str] = set()
+        self._lock = threading.Lock()
+        self._futures: List[Future] = []
+        if threads > 0:
+            self._executor: Optional[ThreadPoolExecutor] = ThreadPoolExecutor(threads, "markdown-writer")
+            self._slots: Optional[threading.BoundedSemaphore] = threading.BoundedSemaphore(
+                threads * QUEUE_SIZE_PER_THREAD
+            )
+        else:
+            self._executor = None
+            self._slots = None
+
+    def _span(self, stage: str, name: str):
+        if self.timeline is None:
+            return nullcontext()
+        return self.timeline.span(stage, name)
+
+    def ensure_dir(self, dir_path: str):
+        """Creates the directory, unless this writer already did"""
+        if dir_path in self._created_dirs:
+            return
+        os.makedirs(dir_path, exist_ok=True)
+        with self._lock:
+            self._created_dirs.add(dir_path)
+
+    def _write(self, file_path: str, content: str):
+        dir_path = os.path.dirname(file_path)
+        self.ensure_dir(dir_path)
+        written = False
+        with self.error_handler(file_path):
+            check_writable(file_path)
+            if self.store is not None:
+                self.store.write(file_path, content)
+            else:
+                self._replace(file_path, content)
+            written = True
+        with self._lock:
+            if not written:
+                self.failed.add(file_path)
+            elif self.fsync:
+                self._synced_dirs.add(dir_path)
+
+    def _replace(self, file_path: str, content: str):
+        with atomic_replace(file_path) as temp_path:
+            with open(temp_path, "w", encoding="utf-8") as file:
+                file.write(content)
+                if self.fsync:
+                    file.flush()
+                    os.fsync(file.fileno())
+
+    def _run(self, file_path: str, content: str):
+        try:
+            with self._span("write", file_path):
+                self._write(file_path, content)
+        finally:
+            self._slots.release()
+
+    def write(self, file_path: str, content: str):
+        if self._executor is None:
+            with self._span("write", file_path):
+                self._write(file_path, content)
+            return
+
+        # Blocks while the queue is full, to limit the memory held by pending writes
+        with self._span("write-blocked", file_path):
+            self._slots.acquire()  # pylint: disable=consider-using-with
+        # Keep only the pending writes, and the failed ones, so `wait()` can raise their error
+        self._futures = [future for future in self._futures if not future.done() or future.exception() is not None]
+        self._futures.append(self._executor.submit(self._run, file_path, content))
+
+    def wait(self):
+        """Waits for all the pending writes, and raises the first error (if any)"""
+        futures, self._futures = self._futures, []
+        for future in futures:
+            future.result()
+
+    def close(self):
+        """Waits for all the pending writes, then syncs the directories of the written files"""
+        try:
+            self.wait()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+        synced_dirs, self._synced_dirs = self._synced_dirs, set()
+        for dir_path in sorted(synced_dirs):
+            with self.error_handler(dir_path):
+                _fsync_dir(dir_path)
@@ -0,0 +1,128 @@
+"""
+Pipelined write phase.
+
+Three stages run concurrently:
+  read: a thread prefetches and unpickles the upcoming doctrees.
+  translate: the main thread resolves and translates each doctree.
+  write: a thread pool writes the output files (see `OutputWriter`).
+Bounded queues between the stages limit the memory in use.
+"""
+
+import os
+import queue
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+_DONE = object()
+
+
+@dataclass(frozen=True)
+class Span:
+    stage: str
+    name: str
+    start: float
+    end: float
+    thread: str
+    process: int = 0
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+class StageTimeline:
+    """Records the busy (and blocked) intervals of each stage"""
+
+    def __init__(self):
+        self.spans: List[Span] = []
+        self.start = time.perf_counter()
+
+    def record(self, stage: str, name: str, start: float, end: float):
+        # list.append() is atomic, so no lock is required
+        self.spans.append(Span(stage, name, start, end, threading.current_thread().name, os.getpid()))
+
+    def extend(self, spans: Iterable[Span]):
+        """Adds spans that were recorded elsewhere (e.g., by a parallel worker)"""
+        self.spans.extend(spans)
+
+    @contextmanager
+    def span(self, stage: str, name: str = ""):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, name, start, time.perf_counter())
+
+    def totals(self) -> Dict[str, Tuple[int, float]]:
+        totals: Dict[str, Tuple[int, float]] = defaultdict(lambda: (0, 0.0))
+        for span in self.spans:
+            count, duration = totals[span.stage]
+            totals[span.stage] = count + 1, duration + span.duration
+        return dict(totals)
+
+    def report(self) -> str:
+        wall = time.perf_counter() - self.start
+        parts = [f"{stage} {duration:.2f}s ({count})" for stage, (count, duration) in sorted(self.totals().items())]
+        return f"pipeline timeline: wall {wall:.2f}s; " + ", ".join(parts)
+
+
+class WritePipeline:
+    def __init__(self, depth: int, timeline: Optional[StageTimeline] = None):
+        assert depth > 0, "Pipeline depth must be positive"
+        self.depth = depth
+        self.timeline = timeline if timeline is not None else StageTimeline()
+        self._stop = threading.Event()
+
+    def __enter__(self) -> "WritePipeline":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _put(self, items: queue.Queue, item) -> bool:
+        """Blocks while the queue is full (back-pressure), unless the pipeline is stopped"""
+        while not self._stop.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _read(self, docnames: Sequence[str], load: Callable[[str], Any], items: queue.Queue):
+        try:
+            for docname in docnames:
+                with self.timeline.span("read", docname):
+                    item = (docname, load(docname), None)
+                with self.timeline.span("read-blocked", docname):
+                    if not self._put(items, item):
+                        return
+        except BaseException as err:  # pylint: disable=broad-except
+            self._put(items, (None, None, err))
+        self._put(items, _DONE)
+
+    def prefetch(self, docnames: Sequence[str], load: Callable[[str], Any]) -> Iterator[Tuple[str, Any]]:
+        """Yields (docname, load(docname)) while loading the next documents in a background thread"""
+        items: queue.Queue = queue.Queue(maxsize=self.depth)
+        reader = threading.Thread(target=self._read, args=(docnames, load, items), name="markdown-reader", daemon=True)
+        reader.start()
+        try:
+            while True:
+                with self.timeline.span("translate-starved"):
+                    item = items.get()
+                if item is _DONE:
+                    break
+                docname, loaded, err = item
+                if err is not None:
+                    raise err
+                yield docname, loaded
+        finally:
+            self._stop.set()
+            reader.join()
+
+    def close(self):
+        self._stop.set()
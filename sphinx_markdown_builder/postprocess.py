@@ -0,0 +1,140 @@
+"""
+Post-processors of the rendered markdown, applied before each output is written (e.g., link rewriting,
+heading demotion, or front matter). Extensions register them in their `setup()`:
+
+    from sphinx_markdown_builder.postprocess import add_post_processor
+
+    def setup(app):
+        add_post_processor(app, "front-matter", add_front_matter, priority=900)
+        add_post_processor(app, "demote-headings", demote_headings, segments=True)
+
+The stages are collected from the listeners of the `markdown-post-processors` event (by their priority),
+which `add_post_processor()` connects; a listener returns a `PostProcessorStage`, or a list of them.
+
+A processor is called with the document name and its markdown, and returns the new markdown.
+A segment processor is called with each segment of the document (the text between two section boundaries)
+instead, so the section boundaries of the output (e.g., for `markdown_chunks`) are kept.
+After a processor of the whole document, the section boundaries are lost.
+
+The processors run by ascending priority (then in their registration order), in the process that
+translated the document (including the parallel workers), and the time of each one is reported.
+"""
+
+import time
+from collections import defaultdict
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple
+
+from sphinx.application import Sphinx
+from sphinx.errors import ExtensionError
+
+from sphinx_markdown_builder.chunks import SectionMark
+
+DEFAULT_PRIORITY = 500
+POST_PROCESSORS_EVENT = "markdown-post-processors"
+
+PostProcessor = Callable[[str, str], str]  # (docname, markdown or segment) -> markdown or segment
+
+
+@dataclass(frozen=True)
+class PostProcessorStage:
+    name: str
+    processor: PostProcessor
+    priority: int = DEFAULT_PRIORITY
+    segments: bool = False  # Called with each segment, instead of the whole document
+
+
+def add_post_processor(
+    app: Sphinx, name: str, processor: PostProcessor, priority: int = DEFAULT_PRIORITY, segments: bool = False
+):
+    """Registers a post-processor of the markdown outputs"""
+    app.setup_extension("sphinx_markdown_builder")  # Registers the event, if this extension is not set up yet
+    stage = PostProcessorStage(name, processor, priority, segments)
+    app.connect(POST_PROCESSORS_EVENT, lambda _: stage, priority=priority)
+
+
+def registered_stages(app: Sphinx) -> List[PostProcessorStage]:
+    """The registered post-processors, by their order of execution"""
+    stages: List[PostProcessorStage] = []
+    for result in app.emit(POST_PROCESSORS_EVENT):
+        if isinstance(result, PostProcessorStage):
+            result = [result]
+        for stage in result or ():
+            if any(registered.name == stage.name for registered in stages):
+                raise ExtensionError(f"markdown post-processor {stage.name!r} is already registered")
+            stages.append(stage)
+    return sorted(stages, key=lambda stage: stage.priority)  # The sort is stable
+
+
+def split_segments(text: str, sections: Sequence[SectionMark]) -> Iterator[str]:
+    """The text before the first section boundary, then the text after each boundary"""
+    start = 0
+    for section in sections:
+        yield text[start : section.offset]  # noqa: E203
+        start = section.offset
+    yield text[start:]
+
+
+class PostProcessPipeline:
+    """Runs the post-processors, and accumulates their count and time (seconds) per stage"""
+
+    def __init__(self, stages: Sequence[PostProcessorStage]):
+        self.stages = list(stages)
+        self.timings: Dict[str, Tuple[int, float]] = {}
+        self.reset()
+
+    def _call(self, stage: PostProcessorStage, docname: str, value: str) -> str:
+        start = time.perf_counter()
+        try:
+            result = stage.processor(docname, value)
+        except Exception as err:
+            raise ExtensionError(f"markdown post-processor {stage.name!r} failed on {docname}", err) from err
+        count, seconds = self.timings[stage.name]
+        self.timings[stage.name] = count + 1, seconds + time.perf_counter() - start
+        return result
+
+    def _run_segments(
+        self, stages: Sequence[PostProcessorStage], docname: str, text: str, sections: List[SectionMark]
+    ) -> Tuple[str, List[SectionMark]]:
+        """Streams each segment through consecutive segment processors, and moves the section boundaries"""
+        segments = []
+        for segment in split_segments(text, sections):
+            for stage in stages:
+                segment = self._call(stage, docname, segment)
+            segments.append(segment)
+        offset = 0
+        moved = []
+        for section, segment in zip(sections, segments):
+            offset += len(segment)
+            moved.append(replace(section, offset=offset))
+        return "".join(segments), moved
+
+    def run(self, docname: str, text: str, sections: List[SectionMark]) -> Tuple[str, List[SectionMark]]:
+        index = 0
+        while index < len(self.stages):
+            stage = self.stages[index]
+            if not stage.segments:
+                text, sections = self._call(stage, docname, text), []
+                index += 1
+                continue
+            end = index
+            while end < len(self.stages) and self.stages[end].segments:
+                end += 1
+            text, sections = self._run_segments(self.stages[index:end], docname, text, sections)
+            index = end
+        return text, sections
+
+    def reset(self):
+        self.timings = defaultdict(lambda: (0, 0.0))
+
+    def merge(self, timings: Dict[str, Tuple[int, float]]):
+        """Adds the timings of another pipeline (e.g., of a parallel worker)"""
+        for name, (count, seconds) in timings.items():
+            total_count, total_seconds = self.timings[name]
+            self.timings[name] = total_count + count, total_seconds + seconds
+
+    def report(self) -> str:
+        parts = [
+            f"{stage.name} {self.timings[stage.name][1]:.2f}s ({self.timings[stage.name][0]})" for stage in self.stages
+        ]
+        return "post-processors: " + ", ".join(parts)
@@ -0,0 +1,95 @@
+"""
+Profiling of the slowest documents.
+
+Each (sampled) document is written under `cProfile`, and the statistics of the N slowest are kept,
+to be dumped as `pstats` files that can be loaded with `pstats.Stats` or a viewer (e.g., snakeviz).
+"""
+
+import cProfile
+import heapq
+import io
+import marshal
+import os
+import pstats
+import time
+import zlib
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List
+
+PROFILE_DIR = "_profile"
+PROFILE_SUFFIX = ".pstats"
+SUMMARY_FILE = "summary.txt"
+SUMMARY_FUNCTIONS = 20
+
+
+@dataclass(order=True)
+class DocumentProfile:
+    elapsed: float
+    docname: str
+    stats: Dict[Any, Any] = field(compare=False, repr=False)  # The raw statistics, as dumped by `pstats`
+
+
+def is_sampled(docname: str, sample: float) -> bool:
+    """A deterministic sample of the documents, so the same documents are profiled in every build"""
+    return zlib.crc32(docname.encode("utf-8")) < sample * 2**32
+
+
+class DocumentProfiler:
+    """Profiles the documents, and keeps the profiles of the `keep` slowest ones (in a min-heap)"""
+
+    def __init__(self, keep: int, sample: float = 1.0):
+        assert keep > 0, "The number of profiles to keep must be positive"
+        self.keep = keep
+        self.sample = sample
+        self.profiles: List[DocumentProfile] = []
+
+    def add(self, profiles: Iterable[DocumentProfile]):
+        for profile in profiles:
+            if len(self.profiles) < self.keep:
+                heapq.heappush(self.profiles, profile)
+            elif profile > self.profiles[0]:
+                heapq.heapreplace(self.profiles, profile)
+
+    @contextmanager
+    def profile(self, docname: str):
+        if not is_sampled(docname, self.sample):
+            yield
+            return
+
+        profiler = cProfile.Profile()
+        start = time.perf_counter()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            elapsed = time.perf_counter() - start
+            profiler.create_stats()
+            self.add([DocumentProfile(elapsed, docname, profiler.stats)])
+
+    def slowest(self) -> List[DocumentProfile]:
+        return sorted(self.profiles, reverse=True)
+
+    def dump(self, dir_path: str) -> str:
+        """Writes `<docname>.pstats` for each kept profile, and a summary of them. Returns the summary path."""
+        summary = io.StringIO()
+        summary.write(f"The {len(self.profiles)} slowest documents:\n")
+        for profile in self.slowest():
+            summary.write(f"{profile.elapsed:10.3f}s  {profile.docname}\n")
+
+        for profile in self.slowest():
+            file_path = os.path.join(dir_path, f"{profile.docname}{PROFILE_SUFFIX}")
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            with open(file_path, "wb") as file:
+                marshal.dump(profile.stats, file)
+
+            summary.write(f"\n{'=' * 80}\n{profile.docname} ({profile.elapsed:.3f}s)\n")
+            stats = pstats.Stats(file_path, stream=summary)
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(SUMMARY_FUNCTIONS)
+
+        summary_path = os.path.join(dir_path, SUMMARY_FILE)
+        os.makedirs(dir_path, exist_ok=True)
+        with open(summary_path, "w", encoding="utf-8") as file:
+            file.write(summary.getvalue())
+        return summary_path
@@ -0,0 +1,83 @@
+"""
+Memoization of repeated subtree renderings.
+
+Autodoc output repeats identical subtrees (e.g., inherited docstrings and field lists) across many objects.
+A subtree is keyed by a structural hash of its nodes, and its rendering is stored as the operations
+it applied to the enclosing context (see `RecordingContext`), so it can be replayed in any context.
+"""
+
+import hashlib
+from collections import OrderedDict
+from typing import Hashable, List, Optional, Tuple
+
+from docutils import nodes
+
+from sphinx_markdown_builder.contexts import Operation
+from sphinx_markdown_builder.urls import CacheStats
+
+# Approximate memory used by an entry and an operation, in addition to their strings
+ENTRY_OVERHEAD = 256
+OPERATION_OVERHEAD = 64
+
+
+def structural_hash(root: nodes.Node) -> bytes:
+    """
+    Hashes the node classes, attributes and texts of a subtree.
+    The nodes are hashed in pre-order, with their number of children, which determines the structure.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, nodes.Text):
+            digest.update(f"\0T{len(node)}\0".encode())
+            digest.update(str(node).encode("utf-8", "surrogatepass"))
+            continue
+        cls = node.__class__
+        attributes = sorted(node.attributes.items())
+        digest.update(f"\0E{cls.__module__}.{cls.__qualname__}\0{len(node.children)}\0{attributes!r}".encode())
+        stack.extend(reversed(node.children))
+    return digest.digest()
+
+
+def _operations_size(operations: Tuple[Operation, ...]) -> int:
+    size = ENTRY_OVERHEAD
+    for operation in operations:
+        size += OPERATION_OVERHEAD
+        if isinstance(operation[1], str):
+            size += len(operation[1])
+    return size
+
+
+class RenderCache:
+    """LRU cache of rendered subtrees, bounded by the approximate size of the stored operations"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.size = 0
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[Hashable, Tuple[Tuple[Operation, ...], int]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Tuple[Operation, ...]]:
+        entry = self._entries.get(key, None)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key: Hashable, operations: List[Operation]):
+        stored = tuple(operations)
+        size = _operations_size(stored)
+        if size > self.max_size or key in self._entries:
+            return
+        self._entries[key] = stored, size
+        self.size += size
+        while self.size > self.max_size:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.size -= evicted_size
+            self.stats.evictions += 1
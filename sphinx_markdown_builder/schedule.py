@@ -0,0 +1,208 @@
+"""
+Scheduling of the parallel write phase.
+
+Sphinx chunks the documents in order, so a few large documents can end up as stragglers at the end of the build.
+If `markdown_schedule_history` is set, the translation time and the output size of each document are kept in a
+manifest, and the next builds batch the documents longest-processing-time first: the largest documents are written
+alone and first, and the smaller ones are grouped in batches of decreasing cost.
+The batches are dispatched in that order, each one when a worker is done with its previous one,
+so the idle workers take over the remaining work.
+"""
+
+import json
+import os
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Iterable, List, Sequence
+
+from sphinx.util import parallel
+
+HISTORY_VERSION = 1
+BATCHES_PER_WORKER = 8  # Bounds the number of forked workers for many small documents
+
+
+@dataclass(frozen=True)
+class DocumentCost:
+    docname: str
+    seconds: float  # Translation time (including the variants)
+    size: int  # Output size in characters
+
+
+@dataclass(frozen=True)
+class BatchRun:
+    docnames: List[str]
+    start: float  # `time.perf_counter()` of the worker, which shares the clock of the main process
+    end: float
+    process: int
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+class ScheduleHistory:
+    """The costs of the documents in the previous builds"""
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.documents: Dict[str, DocumentCost] = {}
+
+    def load(self):
+        try:
+            with open(self.file_path, encoding="utf-8") as file:
+                history = json.load(file)
+        except (OSError, ValueError):
+            return
+        if history.get("version") != HISTORY_VERSION:
+            return
+        for docname, cost in history.get("documents", {}).items():
+            self.documents[docname] = DocumentCost(docname, cost["seconds"], cost["size"])
+
+    def add(self, costs: Iterable[DocumentCost]):
+        for cost in costs:
+            self.documents[cost.docname] = cost
+
+    def save(self, docnames: Iterable[str]):
+        """Saves the costs of the existing documents"""
+        documents = {
+            docname: {"seconds": round(cost.seconds, 6), "size": cost.size}
+            for docname, cost in sorted(self.documents.items())
+            if docname in docnames
+        }
+        os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
+        with open(self.file_path, "w", encoding="utf-8") as file:
+            json.dump({"version": HISTORY_VERSION, "documents": documents}, file, indent=1)
+
+    def estimates(self, docnames: Sequence[str]) -> Dict[str, float]:
+        """The expected translation time of the documents. A new document is expected to take the average time."""
+        known = [cost.seconds for cost in self.documents.values()]
+        default = sum(known) / len(known) if known else 1.0
+        return {
+            docname: self.documents[docname].seconds if docname in self.documents else default for docname in docnames
+        }
+
+
+def make_batches(estimates: Dict[str, float], nproc: int) -> List[List[str]]:
+    """
+    Batches the documents longest-processing-time first (guided self-scheduling).
+    Each batch costs at most half of the remaining work per worker, so the batches shrink toward the end of the build.
+    """
+    total = sum(estimates.values())
+    if total <= 0:
+        return parallel.make_chunks(sorted(estimates), nproc)
+
+    min_cost = total / (nproc * BATCHES_PER_WORKER)
+    remaining = total
+    batches: List[List[str]] = []
+    batch: List[str] = []
+    batch_cost = 0.0
+    for docname in sorted(estimates, key=lambda name: (-estimates[name], name)):
+        cost = estimates[docname]
+        if batch and batch_cost + cost > max(remaining / (2 * nproc), min_cost):
+            batches.append(batch)
+            remaining -= batch_cost
+            batch, batch_cost = [], 0.0
+        batch.append(docname)
+        batch_cost += cost
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+class BatchDispatcher:
+    """
+    Starts the tasks in their order, each one when a worker is free.
+    `ParallelTasks` starts its waiting tasks in an unspecified order, so no task is added before a worker is free.
+    """
+
+    POLL_INTERVAL = 0.02  # Seconds, as `ParallelTasks.join()`
+
+    def __init__(self, nproc: int):
+        self.tasks = parallel.ParallelTasks(nproc)
+        self.running = 0
+
+    def wait_worker(self):
+        """Waits until a worker is free (the results of the finished tasks are handled meanwhile)"""
+        try:
+            while self.running >= self.tasks.nproc:
+                if not self.tasks._join_one():  # pylint: disable=protected-access
+                    time.sleep(self.POLL_INTERVAL)
+        except BaseException:
+            self.tasks.terminate()  # As `ParallelTasks.join()`, on failure
+            raise
+
+    def add_task(self, task_func: Callable, arg: Any, result_func: Callable[[Any, Any], None]):
+        def on_done(done_arg, result):
+            self.running -= 1
+            result_func(done_arg, result)
+
+        self.wait_worker()
+        self.running += 1
+        self.tasks.add_task(task_func, arg, on_done)
+
+    def join(self):
+        self.tasks.join()
+
+
+class ScheduleReport:
+    """The critical path of the parallel write phase, and how busy each worker was"""
+
+    def __init__(self, nproc: int):
+        self.nproc = nproc
+        self.runs: List[BatchRun] = []
+        self.costs: Dict[str, DocumentCost] = {}
+
+    def add_run(self, run: BatchRun):
+        self.runs.append(run)
+
+    def add_costs(self, costs: Iterable[DocumentCost]):
+        for cost in costs:
+            self.costs[cost.docname] = cost
+
+    def lanes(self) -> List[List[BatchRun]]:
+        """Assigns the batches to worker slots: a batch is started when the previous batch of its slot is done"""
+        lanes: List[List[BatchRun]] = []
+        for run in sorted(self.runs, key=lambda run: run.start):
+            free = [lane for lane in lanes if lane[-1].end <= run.start]
+            if free:
+                max(free, key=lambda lane: lane[-1].end).append(run)
+            else:
+                lanes.append([run])
+        return lanes
+
+    def summary(self) -> dict:
+        if not self.runs:
+            return {}
+        start = min(run.start for run in self.runs)
+        wall = max(run.end for run in self.runs) - start
+        lanes = self.lanes()
+        critical = max(lanes, key=lambda lane: lane[-1].end)
+        longest = max(self.costs.values(), key=lambda cost: cost.seconds, default=None)
+        total = sum(run.duration for run in self.runs)
+        return {
+            "batches": len(self.runs),
+            "workers": len(lanes),
+            "wall": wall,
+            # The makespan of a perfect schedule is at least the average work per worker, or the longest document
+            "lower_bound": max(total / self.nproc, longest.seconds if longest else 0.0),
+            "utilization": [sum(run.duration for run in lane) / wall if wall > 0 else 1.0 for lane in lanes],
+            "critical_path": [docname for run in critical for docname in run.docnames],
+            "critical_path_seconds": critical[-1].end - start,
+            "longest": asdict(longest) if longest else None,
+        }
+
+    def report(self) -> str:
+        summary = self.summary()
+        if not summary:
+            return "write schedule: no parallel batches"
+        utilization = ", ".join(f"{100 * busy:.0f}%" for busy in summary["utilization"])
+        longest = summary["longest"]
+        report = (
+            f"write schedule: {summary['batches']} batches on {summary['workers']} workers, "
+            f"wall {summary['wall']:.2f}s (lower bound {summary['lower_bound']:.2f}s); "
+            f"utilization {utilization}; critical path of {len(summary['critical_path'])} documents "
+            f"({summary['critical_path_seconds']:.2f}s)"
+        )
+        if longest:
+            report += f", longest document {longest['docname']} ({longest['seconds']:.2f}s)"
+        return report
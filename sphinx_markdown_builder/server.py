@@ -0,0 +1,273 @@
+"""
+On-demand render server.
+
+Serves the markdown of the documents of a built environment, without pre-rendering them:
+a document is translated when it is first requested, and kept in a size-bounded LRU cache.
+When the environment is pickled again (e.g., by a rebuild), it is reloaded, and the cache is cleared.
+
+    serve_markdown source build/doctrees --port 8000
+
+    GET /<docname>      The markdown of the document (also with the `.md` suffix)
+    GET /_metrics       Cache statistics (JSON)
+"""
+
+import argparse
+import json
+import os
+import pickle
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import asdict, dataclass
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Sequence, Tuple
+from urllib.parse import unquote, urlsplit
+
+from docutils.io import StringOutput
+from sphinx.application import ENV_PICKLE_FILENAME, Sphinx
+from sphinx.util import logging
+from sphinx.util.docutils import docutils_namespace, patch_docutils
+
+DEFAULT_CACHE_SIZE = 64 * 2**20  # Characters
+METRICS_PATH = "/_metrics"
+MARKDOWN_SUFFIX = ".md"
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ServerStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0  # Entries of a doctree that changed since it was translated
+    coalesced: int = 0  # Requests that waited for the translation of a concurrent request
+    reloads: int = 0  # Reloads of the environment
+
+
+class DocumentCache:
+    """LRU cache of the translated documents (with the mtime of their doctree), bounded by their total size"""
+
+    def __init__(self, max_size: int, stats: ServerStats):
+        self.max_size = max_size
+        self.size = 0
+        self.stats = stats
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, docname: str, mtime: float) -> Optional[str]:
+        entry = self._entries.get(docname, None)
+        if entry is not None and entry[0] != mtime:
+            self.stats.invalidations += 1
+            self._remove(docname)
+            entry = None
+        if entry is None:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        self._entries.move_to_end(docname)
+        return entry[1]
+
+    def put(self, docname: str, mtime: float, markdown: str):
+        if len(markdown) > self.max_size:
+            return
+        self._remove(docname)
+        self._entries[docname] = mtime, markdown
+        self.size += len(markdown)
+        while self.size > self.max_size:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.size -= len(evicted)
+            self.stats.evictions += 1
+
+    def clear(self):
+        self.stats.invalidations += len(self._entries)
+        self._entries.clear()
+        self.size = 0
+
+    def _remove(self, docname: str):
+        entry = self._entries.pop(docname, None)
+        if entry is not None:
+            self.size -= len(entry[1])
+
+
+class DocumentRenderer:
+    """
+    Translates the documents of a built environment on demand.
+    Concurrent requests of the same document are coalesced into a single translation.
+    The translations are serialized, since the environment and the builder are not thread-safe.
+    """
+
+    def __init__(self, app: Sphinx, cache_size: int = DEFAULT_CACHE_SIZE):
+        self.app = app
+        self.stats = ServerStats()
+        self.cache = DocumentCache(cache_size, self.stats)
+        self._lock = threading.Lock()
+        self._translate_lock = threading.Lock()
+        self._pending: Dict[str, Future] = {}
+        self._env_mtime = self._environment_mtime()
+        app.builder.prepare_writing(set(app.env.all_docs))
+
+    def has_document(self, docname: str) -> bool:
+        return docname in self.app.env.all_docs
+
+    @property
+    def environment_path(self) -> str:
+        return os.path.join(self.app.doctreedir, ENV_PICKLE_FILENAME)
+
+    def _environment_mtime(self) -> Optional[float]:
+        try:
+            return os.path.getmtime(self.environment_path)
+        except OSError:
+            return None
+
+    def refresh(self):
+        """Reloads the environment if it was pickled again, since its documents and toctrees may have changed"""
+        mtime = self._environment_mtime()
+        if mtime is None or mtime == self._env_mtime:
+            return
+        with self._translate_lock:
+            if mtime == self._env_mtime:
+                return
+            try:
+                with open(self.environment_path, "rb") as file:
+                    env = pickle.load(file)
+                env.setup(self.app)
+            except Exception as err:  # pylint: disable=broad-except
+                # A running build may still be writing it: keep the current environment until the next request
+                logger.warning("cannot reload the environment %s: %s", self.environment_path, err)
+                return
+            self.app.env = self.app.builder.env = env
+            self.app.builder.prepare_writing(set(env.all_docs))
+            self._env_mtime = mtime
+        with self._lock:
+            self.cache.clear()
+            self.stats.reloads += 1
+
+    def _doctree_mtime(self, docname: str) -> float:
+        return os.path.getmtime(os.path.join(self.app.doctreedir, f"{docname}.doctree"))
+
+    def render(self, docname: str) -> str:
+        """Raises `FileNotFoundError` if the document has no doctree"""
+        mtime = self._doctree_mtime(docname)
+        with self._lock:
+            markdown = self.cache.get(docname, mtime)
+            if markdown is not None:
+                return markdown
+            future = self._pending.get(docname, None)
+            owner = future is None
+            if owner:
+                future = self._pending[docname] = Future()
+            else:
+                self.stats.coalesced += 1
+
+        if not owner:
+            return future.result()
+
+        try:
+            markdown = self._translate(docname)
+        except BaseException as ex:
+            future.set_exception(ex)
+            raise
+        finally:
+            with self._lock:
+                del self._pending[docname]
+        with self._lock:
+            self.cache.put(docname, mtime, markdown)
+        future.set_result(markdown)
+        return markdown
+
+    def _translate(self, docname: str) -> str:
+        env, builder = self.app.env, self.app.builder
+        with self._translate_lock:
+            # Sphinx (>= 7.2) keeps the pickled doctrees in memory, which would be stale after a rebuild
+            getattr(env, "_pickled_doctree_cache", {}).pop(docname, None)
+            doctree = env.get_and_resolve_doctree(docname, builder)
+            getattr(env, "_pickled_doctree_cache", {}).pop(docname, None)
+            builder.current_doc_name = docname
+            builder.writer.write(doctree, StringOutput(encoding="utf-8"))
+            return builder.writer.output
+
+    def metrics(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                **asdict(self.stats),
+                "entries": len(self.cache),
+                "size": self.cache.size,
+                "max_size": self.cache.max_size,
+            }
+
+
+class RenderRequestHandler(BaseHTTPRequestHandler):
+    renderer: DocumentRenderer  # Set by `create_server()`
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        path = unquote(urlsplit(self.path).path)
+        if path == METRICS_PATH:
+            self._respond(HTTPStatus.OK, json.dumps(self.renderer.metrics()), "application/json")
+            return
+
+        docname = path.strip("/")
+        if docname.endswith(MARKDOWN_SUFFIX):
+            docname = docname[: -len(MARKDOWN_SUFFIX)]
+        try:
+            self.renderer.refresh()
+            if not self.renderer.has_document(docname):
+                self._respond(HTTPStatus.NOT_FOUND, f"No such document: {docname}\n", "text/plain")
+                return
+            markdown = self.renderer.render(docname)
+        except FileNotFoundError:
+            self._respond(HTTPStatus.NOT_FOUND, f"No doctree of document: {docname}\n", "text/plain")
+            return
+        except Exception as err:  # pylint: disable=broad-except
+            logger.warning("cannot render %s: %r", docname, err, exc_info=True)
+            self._respond(HTTPStatus.INTERNAL_SERVER_ERROR, f"Cannot render document: {docname}\n", "text/plain")
+            return
+        self._respond(HTTPStatus.OK, markdown, "text/markdown")
+
+    def _respond(self, status: HTTPStatus, content: str, content_type: str):
+        body = content.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def create_server(renderer: DocumentRenderer, host: str = "127.0.0.1", port: int = 8000) -> ThreadingHTTPServer:
+    handler = type("Handler", (RenderRequestHandler,), {"renderer": renderer})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="serve_markdown", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("sourcedir", nargs="?", default="source")
+    parser.add_argument("doctreedir", nargs="?", default="build/doctrees", help="the doctrees of a previous build")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--cache-size", type=int, default=DEFAULT_CACHE_SIZE, help="in characters")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = parse_args(argv)
+    with tempfile.TemporaryDirectory(prefix="markdown-") as outdir:
+        with patch_docutils(args.sourcedir), docutils_namespace():
+            app = Sphinx(args.sourcedir, args.sourcedir, outdir, args.doctreedir, "markdown", status=None)
+            server = create_server(DocumentRenderer(app, args.cache_size), args.host, args.port)
+            print(f"Serving {len(app.env.all_docs)} documents on http://{args.host}:{server.server_port}")
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,44 @@
+"""
+Stand-ins of the Sphinx builder and configuration, to use the markdown writer without a Sphinx application:
+
+    docutils.core.publish_string(source, writer=MarkdownWriter())
+
+Only the docutils nodes are supported (e.g., no Sphinx roles or directives).
+"""
+
+from sphinx_markdown_builder.config import DOC_INFO_FIELDS
+from sphinx_markdown_builder.translator import MarkdownTranslator
+from sphinx_markdown_builder.urls import UrlResolver
+
+
+class StandaloneConfig:  # pylint: disable=too-few-public-methods
+    """The configurations of the translator, with the same defaults as the extension's `setup()`"""
+
+    markdown_http_base = ""
+    markdown_uri_doc_suffix = ".md"
+    markdown_anchor_sections = False
+    markdown_anchor_signatures = False
+    markdown_docinfo = False
+
+    def __init__(self, **overrides):
+        for name, value in overrides.items():
+            if not hasattr(self, name) and name not in DOC_INFO_FIELDS:
+                raise ValueError(f"Unknown configuration: {name}")
+            setattr(self, name, value)
+
+
+class StandaloneBuilder:  # pylint: disable=too-few-public-methods
+    """The attributes of `MarkdownBuilder` that the writer and the translator use"""
+
+    render_cache = None
+    translator_config = None  # The translator creates its config from `config`
+    ir_fingerprint = None
+
+    def __init__(self, config: StandaloneConfig, docname: str = "index"):
+        self.config = config
+        self.url_resolver = UrlResolver(config.markdown_http_base, config.markdown_uri_doc_suffix)
+        self.current_doc_name = docname
+
+    @staticmethod
+    def create_translator(document, builder) -> MarkdownTranslator:
+        return MarkdownTranslator(document, builder)
@@ -0,0 +1,215 @@
+"""
+Content-addressed store of the output files, shared between build directories (see `markdown_content_store`).
+
+Each output is stored once, as a blob named after the hash of its content, and then reflinked
+(or copied, if the file system does not support reflinks) into the output directory.
+Builds of many branches or versions of the same documentation share the identical outputs.
+
+With `markdown_content_store_hardlinks`, the outputs are hard-linked to the blobs instead: they share their inode,
+so the outputs must be treated as read-only (a change of an output, or of its mode, changes the blob).
+
+The last use of a blob is the modification time of its access file, in `used/` (not of the blob itself,
+which would change all the outputs linked to it). The garbage collection relies on it:
+
+    gc_markdown_store /var/cache/markdown-store --max-age 30 --max-size 1G
+"""
+
+import argparse
+import errno
+import hashlib
+import os
+import shutil
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Iterator, Optional, Sequence, Tuple
+
+from sphinx_markdown_builder.output import atomic_replace
+from sphinx_markdown_builder.urls import CacheStats
+
+OBJECTS_DIR = "objects"
+USED_DIR = "used"
+FICLONE = 0x40049409  # Linux ioctl to clone the extents of a file (reflink)
+SIZE_UNITS = {"": 1, "K": 2**10, "M": 2**20, "G": 2**30, "T": 2**40}
+SECONDS_PER_DAY = 24 * 60 * 60
+
+DIGEST_SIZE = 20
+
+# Hard links can fail because of the file system, rather than the file
+LINK_ERRORS = {errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP, errno.EOPNOTSUPP}
+
+
+def blob_digest(content: bytes) -> str:
+    """The hash of a content, which names its blob (and identifies the outputs in their change set)"""
+    return hashlib.blake2b(content, digest_size=DIGEST_SIZE).hexdigest()
+
+
+def _reflink(source: str, target: str):
+    import fcntl  # pylint: disable=import-outside-toplevel
+
+    with open(source, "rb") as source_file, open(target, "wb") as target_file:
+        fcntl.ioctl(target_file.fileno(), FICLONE, source_file.fileno())
+
+
+@dataclass
+class CollectedGarbage:
+    blobs: int = 0
+    size: int = 0  # Bytes of the removed blobs (only the unlinked ones free space)
+    remaining_blobs: int = 0
+    remaining_size: int = 0
+
+
+class ContentStore:
+    def __init__(self, root: str, fsync: bool = False, hard_links: bool = False):
+        self.root = root
+        self.fsync = fsync
+        self.hard_links = hard_links
+        self.stats = CacheStats()  # Hits: reused blobs. Misses: new blobs.
+        self._lock = threading.Lock()
+
+    def blob_path(self, digest: str) -> str:
+        return os.path.join(self.root, OBJECTS_DIR, digest[:2], digest[2:])
+
+    def used_path(self, blob_path: str) -> str:
+        """The access file of the blob, whose modification time is the last use of the blob"""
+        return os.path.join(self.root, USED_DIR, os.path.relpath(blob_path, os.path.join(self.root, OBJECTS_DIR)))
+
+    def _mark_used(self, blob_path: str):
+        used_path = self.used_path(blob_path)
+        try:
+            os.utime(used_path)
+        except FileNotFoundError:
+            os.makedirs(os.path.dirname(used_path), exist_ok=True)
+            with open(used_path, "ab"):
+                pass
+
+    def put(self, content: bytes) -> str:
+        """Stores the content, unless it is already stored. Returns the path of its blob."""
+        blob_path = self.blob_path(blob_digest(content))
+        # Marked before the lookup, so that the garbage collection does not find it unused meanwhile
+        self._mark_used(blob_path)
+        hit = os.path.exists(blob_path)
+        if not hit:
+            self._add_blob(blob_path, content)
+        with self._lock:
+            if hit:
+                self.stats.hits += 1
+            else:
+                self.stats.misses += 1
+        return blob_path
+
+    def _add_blob(self, blob_path: str, content: bytes):
+        os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+        # Concurrent builds may add the same blob, with the same content
+        with atomic_replace(blob_path) as temp_path:
+            with open(temp_path, "wb") as file:
+                file.write(content)
+                if self.fsync:
+                    file.flush()
+                    os.fsync(file.fileno())
+
+    @staticmethod
+    def materialize(blob_path: str, file_path: str, hard_link: bool = False):
+        """Replaces the file with a reflink of the blob, or a copy (or a hard link of the blob, if `hard_link`)"""
+        with atomic_replace(file_path) as temp_path:
+            if hard_link:
+                try:
+                    os.link(blob_path, temp_path)
+                    return
+                except OSError as err:
+                    if err.errno not in LINK_ERRORS:
+                        raise
+            try:
+                _reflink(blob_path, temp_path)
+            except (OSError, ImportError):
+                shutil.copyfile(blob_path, temp_path)
+
+    def write(self, file_path: str, content: str):
+        data = content.encode("utf-8")
+        blob_path = self.put(data)
+        try:
+            self.materialize(blob_path, file_path, self.hard_links)
+        except FileNotFoundError:
+            if not os.path.isdir(os.path.dirname(file_path) or "."):
+                raise
+            # The garbage collection removed the blob after it was marked as used: store it again
+            self._add_blob(blob_path, data)
+            try:
+                self.materialize(blob_path, file_path, self.hard_links)
+            except FileNotFoundError:
+                with atomic_replace(file_path) as temp_path:  # Removed again: a plain write
+                    with open(temp_path, "wb") as file:
+                        file.write(data)
+
+    def iter_blobs(self) -> Iterator[Tuple[str, os.stat_result, float]]:
+        """The blobs, with their stat and their last use"""
+        for dir_path, _, file_names in os.walk(os.path.join(self.root, OBJECTS_DIR)):
+            for file_name in file_names:
+                if not file_name.endswith(".tmp"):
+                    file_path = os.path.join(dir_path, file_name)
+                    stat = os.stat(file_path)
+                    try:
+                        last_use = os.stat(self.used_path(file_path)).st_mtime
+                    except FileNotFoundError:
+                        last_use = stat.st_mtime
+                    yield file_path, stat, last_use
+
+    def collect_garbage(self, max_age: Optional[float] = None, max_size: Optional[int] = None) -> CollectedGarbage:
+        """
+        Removes the blobs that were not used for `max_age` seconds,
+        and then the least recently used blobs, until the store is at most `max_size` bytes.
+        Removing a blob does not affect the output files that are linked to it.
+        """
+        blobs = sorted(self.iter_blobs(), key=lambda blob: blob[2])
+        total_size = sum(stat.st_size for _, stat, _ in blobs)
+        oldest = time.time() - max_age if max_age is not None else None
+        result = CollectedGarbage()
+        for blob_path, stat, last_use in blobs:
+            expired = oldest is not None and last_use < oldest
+            if expired or (max_size is not None and total_size > max_size):
+                os.remove(blob_path)
+                try:
+                    os.remove(self.used_path(blob_path))
+                except FileNotFoundError:
+                    pass
+                total_size -= stat.st_size
+                result.blobs += 1
+                result.size += stat.st_size if stat.st_nlink == 1 else 0
+            else:
+                result.remaining_blobs += 1
+        result.remaining_size = total_size
+        return result
+
+
+def parse_size(value: str) -> int:
+    """Parses a size in bytes, with an optional unit (e.g., `512M`, `1G`)"""
+    value = value.strip().upper().rstrip("B")
+    unit = value[-1:] if value[-1:] in SIZE_UNITS else ""
+    return int(float(value[: len(value) - len(unit)]) * SIZE_UNITS[unit])
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="gc_markdown_store", description="Garbage collection of a content store")
+    parser.add_argument("store", help="the directory of the store (see `markdown_content_store`)")
+    parser.add_argument("--max-age", type=float, help="remove the blobs that were not used for that many days")
+    parser.add_argument("--max-size", type=parse_size, help="then remove the least recently used blobs (e.g., 1G)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = parse_args(argv)
+    if args.max_age is None and args.max_size is None:
+        print("Nothing to do: set --max-age or --max-size", file=sys.stderr)
+        return 2
+    max_age = args.max_age * SECONDS_PER_DAY if args.max_age is not None else None
+    result = ContentStore(args.store).collect_garbage(max_age, args.max_size)
+    print(
+        f"Removed {result.blobs} blobs (freed {result.size} bytes); "
+        f"{result.remaining_blobs} blobs ({result.remaining_size} bytes) remain"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
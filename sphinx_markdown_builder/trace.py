@@ -0,0 +1,120 @@
+"""
+Build timeline trace, in the Chrome trace-event format.
+
+The trace can be opened in a trace viewer (e.g., https://ui.perfetto.dev or chrome://tracing),
+to find the slow documents and the serial parts of the build.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from sphinx.application import Sphinx
+from sphinx.environment import BuildEnvironment
+
+from sphinx_markdown_builder.pipeline import Span, StageTimeline
+
+# Spans recorded by the read phase, which must survive the parallel read (see `BuildTracer`)
+ENV_SPANS_ATTR = "markdown_trace_spans"
+
+
+def trace_events(timeline: StageTimeline) -> List[Dict[str, Any]]:
+    """Converts the spans to complete events, with the names of the processes and threads as metadata"""
+    main_process = os.getpid()
+    threads: Dict[Tuple[int, str], int] = {}
+    events = []
+    for span in sorted(timeline.spans, key=lambda s: s.start):
+        thread_id = threads.setdefault((span.process, span.thread), len(threads) + 1)
+        events.append(
+            {
+                "name": f"{span.stage}: {span.name}" if span.name else span.stage,
+                "cat": span.stage,
+                "ph": "X",
+                "ts": round((span.start - timeline.start) * 1e6, 3),
+                "dur": round(span.duration * 1e6, 3),
+                "pid": span.process,
+                "tid": thread_id,
+                "args": {"name": span.name},
+            }
+        )
+
+    for process in sorted({process for process, _ in threads}):
+        name = "sphinx-build" if process == main_process else f"worker {process}"
+        events.append({"name": "process_name", "ph": "M", "pid": process, "args": {"name": name}})
+    for (process, thread), thread_id in threads.items():
+        events.append({"name": "thread_name", "ph": "M", "pid": process, "tid": thread_id, "args": {"name": thread}})
+    return events
+
+
+def dump_trace(timeline: StageTimeline) -> str:
+    return json.dumps({"traceEvents": trace_events(timeline), "displayTimeUnit": "ms"})
+
+
+class BuildTracer:  # pylint: disable=too-few-public-methods
+    """
+    Records the spans of the build phases, and of each document in the read phase, using the Sphinx events.
+    The builder records the spans of the write phase in the same timeline.
+    The trace is written when the build is finished.
+
+    Parallel readers are forked processes, so their spans are passed back in the environment,
+    which the main process merges.
+    """
+
+    def __init__(self, file_path: str, timeline: Optional[StageTimeline] = None):
+        self.file_path = file_path
+        self.timeline = timeline if timeline is not None else StageTimeline()
+        self._phase_start: Dict[str, float] = {}
+        self._doc_start: Dict[str, float] = {}
+
+    def connect(self, app: Sphinx):
+        app.connect("env-before-read-docs", self._on_read_start)
+        app.connect("source-read", self._on_source_read)
+        app.connect("doctree-read", self._on_doctree_read)
+        app.connect("env-merge-info", self._on_merge_info)
+        app.connect("env-updated", self._on_read_end)
+        app.connect("env-check-consistency", self._on_consistency_check)
+        app.connect("build-finished", self._on_build_finished)
+
+    def _end_phase(self, stage: str):
+        start = self._phase_start.pop(stage, None)
+        if start is not None:
+            self.timeline.record(stage, "", start, time.perf_counter())
+
+    def _on_read_start(self, _app, env: BuildEnvironment, _docnames):
+        self._phase_start["read-phase"] = time.perf_counter()
+        setattr(env, ENV_SPANS_ATTR, [])
+
+    def _on_source_read(self, _app, docname: str, _source):
+        self._doc_start[docname] = time.perf_counter()
+
+    def _on_doctree_read(self, app: Sphinx, _doctree):
+        docname = app.env.docname
+        start = self._doc_start.pop(docname, None)
+        if start is None:
+            return
+        span = Span("parse", docname, start, time.perf_counter(), threading.current_thread().name, os.getpid())
+        getattr(app.env, ENV_SPANS_ATTR, []).append(span)
+
+    def _on_merge_info(self, _app, _env, _docnames, other: BuildEnvironment):
+        self.timeline.extend(getattr(other, ENV_SPANS_ATTR, []))
+
+    def _on_read_end(self, _app, env: BuildEnvironment):
+        # The spans must not be pickled with the environment
+        self.timeline.extend(getattr(env, ENV_SPANS_ATTR, []))
+        if hasattr(env, ENV_SPANS_ATTR):
+            delattr(env, ENV_SPANS_ATTR)
+        self._end_phase("read-phase")
+        # The environment is pickled right after this event, if any document was read
+        self._phase_start["pickle-environment"] = time.perf_counter()
+
+    def _on_consistency_check(self, _app, _env):
+        self._end_phase("pickle-environment")
+
+    def _on_build_finished(self, app: Sphinx, _exception):
+        self.timeline.record("build", "", self.timeline.start, time.perf_counter())
+        file_path = os.path.join(app.outdir, self.file_path)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, "w", encoding="utf-8") as file:
+            file.write(dump_trace(self.timeline))
@@ -1,3 +1,4 @@
+# pylint: disable=too-many-lines
 """
 Custom docutils translator for markdown.
 
@@ -24,22 +25,25 @@ https://github.com/docutils/docutils/blob/master/docutils/docutils/writers/html5
 """
 
 import dataclasses
-import posixpath
+import functools
 import re
-from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple, Union
 
-from docutils import languages, nodes
+from docutils import nodes
 from sphinx.util.docutils import SphinxTranslator
 
+from sphinx_markdown_builder.chunks import SectionMark
+from sphinx_markdown_builder.config import DOC_INFO_FIELDS, TranslatorConfig
 from sphinx_markdown_builder.contexts import (
+    DEFAULT_TRANSLATOR,
     CommaSeparatedContext,
     ContextStatus,
     DocInfoContext,
     IndentContext,
     ItalicContext,
     ListMarker,
-    MetaContext,
     PushContext,
+    RecordingContext,
     StrongContext,
     SubContext,
     SubContextParams,
@@ -48,16 +52,31 @@ from sphinx_markdown_builder.contexts import (
     TitleContext,
     UniqueString,
     WrappedContext,
+    replay,
 )
 from sphinx_markdown_builder.escape import escape_html_quote, escape_markdown_chars
+from sphinx_markdown_builder.incremental import SegmentTracker
+from sphinx_markdown_builder.ir import (
+    ADD,
+    ANCHOR,
+    CALL,
+    ENSURE_EOL,
+    POP,
+    SECTION,
+    DocumentIR,
+    SectionMarkIndex,
+    compose_document,
+)
+from sphinx_markdown_builder.memory import TranslatorStats
+from sphinx_markdown_builder.render_cache import RenderCache, structural_hash
+from sphinx_markdown_builder.walker import SKIP_NODE
 
 if TYPE_CHECKING:  # pragma: no cover
     from sphinx_markdown_builder import MarkdownBuilder
 
 VISIT_DEPART_PATTERN = re.compile("(visit|depart)_(.+)")
 SKIP = UniqueString("skip")
-
-DOC_INFO_FIELDS = "author", "contact", "copyright", "date", "organization", "revision", "status", "version"
+CODE_FENCE_PATTERN = re.compile("`{3,}")
 
 PREDEFINED_ELEMENTS: Dict[str, Union[PushContext, SKIP, None]] = dict(  # pylint: disable=use-dict-literal
     # Doctree elements for which Markdown element is <prefix><content><suffix>
@@ -116,6 +135,31 @@ PREDEFINED_ELEMENTS: Dict[str, Union[PushContext, SKIP, None]] = dict(  # pylint
     imgsgnode=None,
 )
 
+# Elements of the direct signature renderer (see `MarkdownTranslator._render_signature()`)
+SIG_TEXT = "text"
+SIG_PASS = "pass"
+SIG_WRAP = "wrap"
+SIG_REFERENCE = "reference"
+SIG_PARAMETERS = "parameters"
+SIG_PARAMETER = "parameter"
+
+SignatureRule = Tuple[str, Optional[WrappedContext]]
+
+# Elements with explicit handlers, that the renderer reproduces.
+# Other supported elements are the predefined ones that are ignored or wrapped.
+SIGNATURE_ELEMENTS: Dict[str, SignatureRule] = {
+    "Text": (SIG_TEXT, None),
+    "reference": (SIG_REFERENCE, None),
+    "desc_parameterlist": (SIG_PARAMETERS, WrappedContext("(", ")", wrap_empty=True)),
+    "desc_parameter": (SIG_PARAMETER, None),
+}
+
+# Elements whose rendering is memoized, if the builder has a render cache
+RENDER_CACHE_ELEMENTS = {"desc_content", "field_list", "note", "warning", "seealso", "attention"}
+
+# A subtree being recorded for the render cache: (key, recording context, doc info size, unknown visits)
+Recording = Tuple[Tuple, RecordingContext, int, int]
+
 
 def _assign_visit_method(method, variable: str):
     match = VISIT_DEPART_PATTERN.fullmatch(method.__name__)
@@ -136,37 +180,76 @@ def pushing_status(method):
     return _assign_visit_method(method, "__pushing_status__")
 
 
-class MarkdownTranslator(SphinxTranslator):  # pylint: disable=too-many-public-methods
+class MarkdownTranslator(SphinxTranslator):  # pylint: disable=too-many-public-methods,too-many-instance-attributes
     def __init__(self, document: nodes.document, builder: "MarkdownBuilder"):
         super().__init__(document, builder)
         self.builder: "MarkdownBuilder" = builder
-        # noinspection PyUnresolvedReferences
-        self.language = languages.get_language(self.settings.language_code, document.reporter)
+        self.options = self._get_options(builder)
+        self.language = self.options.language
         # Warn only once per writer about unsupported elements
         self._warned = set()
+        # Return the SKIP_NODE signal instead of raising SkipNode (set when traversed by `walk()`)
+        self.skip_by_signal = False
+        # Handlers are resolved once per node class
+        self._visit_handlers: Dict[type, Callable] = {}
+        self._depart_handlers: Dict[type, Callable] = {}
+        self._signature_rules: Dict[type, Optional[SignatureRule]] = {}
+        self._unknown_visits = 0
+
+        # Records the intermediate representation of the document, if the builder has an IR fingerprint
+        fingerprint = getattr(builder, "ir_fingerprint", None)
+        self.ir: Optional[DocumentIR] = None
+        if isinstance(fingerprint, str):
+            self.ir = DocumentIR(builder.current_doc_name, fingerprint)
+
+        # Splices the unchanged sections from the previous IR of the document (see `incremental`)
+        self.segments: Optional[SegmentTracker] = None
+        if self.ir is not None and getattr(builder, "incremental_sections", False) is True:
+            previous_ir = getattr(builder, "previous_ir", None)
+            self.ir.settings = builder.ir_settings
+            self.segments = SegmentTracker(
+                document, self.ir, previous_ir if isinstance(previous_ir, DocumentIR) else None
+            )
+
+        # Memoization of repeated subtrees (see `RENDER_CACHE_ELEMENTS`)
+        # The replayed subtrees have resolved URLs and anchors, so they cannot be recorded in an IR
+        render_cache = getattr(builder, "render_cache", None)
+        self._render_cache: Optional[RenderCache] = None
+        if isinstance(render_cache, RenderCache) and self.ir is None:
+            self._render_cache = render_cache
+        self._recordings: List[Optional[Recording]] = []
 
         # FIFO Sub context allow us to handle unique cases when post-processing is required
         self._ctx_queue: List[SubContext] = [SubContext()]
         self._doc_info: SubContext = SubContext()
         self._status_queue: List[ContextStatus] = [ContextStatus()]
+        self.stats = TranslatorStats(context_depth=1, status_depth=1)
 
-        if self.config.markdown_docinfo:
-            self._add_doc_info_from_config()
+        # Section boundaries in the root context: (body index, titles path, anchors)
+        self._section_stack: List[Tuple[Tuple[str, ...], Tuple[str, ...]]] = [((), ())]
+        self._section_marks: List[SectionMarkIndex] = []
+        self.sections: List[SectionMark] = []
 
-    def _add_doc_info_from_config(self):
-        for key in DOC_INFO_FIELDS:
-            value = getattr(self.config, key, "")
-            if isinstance(value, str):
-                self._push_context(MetaContext(key))
-                self.ctx.add(value)
-                self._pop_context()
+        # The document info from the config is the first content of the header
+        self._doc_info.add(self.options.doc_info, prefix_eol=1, suffix_eol=1)
+
+    def _get_options(self, builder) -> TranslatorConfig:
+        """Use the builder's snapshot of the config, if it has one (see `MarkdownBuilder.prepare_writing()`)"""
+        options = getattr(builder, "translator_config", None)
+        if isinstance(options, TranslatorConfig):
+            return options
+        # noinspection PyUnresolvedReferences
+        return TranslatorConfig.from_config(self.config, self.settings.language_code, self.document.reporter)
 
     @property
     def ctx(self) -> SubContext:
         return self._ctx_queue[-1]
 
     def _push_context(self, ctx: SubContext):
+        if self.ir is not None:
+            self.ir.push(ctx)
         self._ctx_queue.append(ctx)
+        self.stats.context_depth = max(self.stats.context_depth, len(self._ctx_queue))
 
     def _pop_context(self, _node=None, count=1):
         for _ in range(count):
@@ -174,6 +257,9 @@ class MarkdownTranslator(SphinxTranslator):  # pylint: disable=too-many-public-m
                 break
 
             last_ctx = self._ctx_queue.pop()
+            if self.ir is not None:
+                self.ir.record(POP)
+            self.stats.update_fragments(len(last_ctx.body))
             ctx = self.ctx if last_ctx.params.target == "body" else self._doc_info
             ctx.add(last_ctx.make(), last_ctx.params.prefix_eol, last_ctx.params.suffix_eol)
 
@@ -188,6 +274,7 @@ class MarkdownTranslator(SphinxTranslator):  # pylint: disable=too-many-public-m
     def _push_status(self, **changes):
         cur_status = self.status
         self._status_queue.append(dataclasses.replace(cur_status, **changes))
+        self.stats.status_depth = max(self.stats.status_depth, len(self._status_queue))
 
     def _pop_status(self, _node=None, count=1):
         count = min(len(self._status_queue) - 1, count)
@@ -202,25 +289,50 @@ class MarkdownTranslator(SphinxTranslator):  # pylint: disable=too-many-public-m
         self._pop_context(count=2**31)
         assert len(self._ctx_queue) == 1
 
-        ctx = SubContext()
-        for sub_ctx in (self._doc_info, self._ctx_queue[0]):
-            ctx.add(sub_ctx.make().strip(), prefix_eol=2, suffix_eol=1)
-        ctx.force_eol(1)
-        return ctx.make()
+        self.stats.update_fragments(len(self._ctx_queue[0].body))
+        text, self.sections = compose_document(self._doc_info, self._ctx_queue[0], self._section_marks)
+        return text
+
+    def _mark_section(self):
+        """Marks a section boundary, to allow splitting the output to section chunks"""
+        # Sections can only be nested in other sections, so they are always rendered in the root context
+        if len(self._ctx_queue) == 1:
+            path, anchors = self._section_stack[-1]
+            self._section_marks.append((len(self.ctx.body), path, anchors))
+            if self.ir is not None:
+                self.ir.record(SECTION, path, anchors)
 
     def add(self, value: str, prefix_eol: int = 0, suffix_eol: int = 0):
         """See `SubContext.add()`"""
         self.ctx.add(value, prefix_eol, suffix_eol)
+        if self.ir is not None and value:
+            self.ir.record(ADD, value, prefix_eol, suffix_eol)
 
     def ensure_eol(self, count=1):
         """Ensure the last line in current base is terminated by X new lines."""
         self.ctx.ensure_eol(count)
+        if self.ir is not None:
+            self.ir.record(ENSURE_EOL, count)
+
+    def _ctx_call(self, ctx_type: type, method: str):
+        """Calls a method of the current context, which must be of `ctx_type` (e.g., `TableContext.enter_row()`)"""
+        ctx = self.ctx
+        assert isinstance(ctx, ctx_type)
+        getattr(ctx, method)()
+        if self.ir is not None:
+            self.ir.record(CALL, method)
 
     def _pass(self, _node=None):
         pass
 
     def _skip(self, _node=None):
-        raise nodes.SkipNode
+        """
+        Skips the node's subtree.
+        When traversed by `walk()`, returns the `SKIP_NODE` signal instead of raising `SkipNode`.
+        """
+        if not self.skip_by_signal:
+            raise nodes.SkipNode
+        return SKIP_NODE
 
     def _has_attr(self, item):
         try:
@@ -298,13 +410,117 @@ class MarkdownTranslator(SphinxTranslator):  # pylint: disable=too-many-public-m
 
         return None
 
+    def _find_handler(self, node_class: type, state: str, default: Callable) -> Callable:
+        """Same lookup as `SphinxTranslator`: the handler of the first class in the node's MRO that has one"""
+        for cls in node_class.__mro__:
+            method = getattr(self, f"{state}_{cls.__name__}", None)
+            if method is not None:
+                return method
+        return default
+
+    def dispatch_visit(self, node):
+        """Calls the visit handler of the node, and returns its result (e.g., `SKIP_NODE`)"""
+        try:
+            method = self._visit_handlers[node.__class__]
+        except KeyError:
+            method = self._visit_handlers[node.__class__] = self._cached_handler(
+                node.__class__, "visit", self._find_handler(node.__class__, "visit", self.unknown_visit)
+            )
+        return method(node)
+
+    def dispatch_departure(self, node):
+        try:
+            method = self._depart_handlers[node.__class__]
+        except KeyError:
+            method = self._depart_handlers[node.__class__] = self._cached_handler(
+                node.__class__, "depart", self._find_handler(node.__class__, "depart", self.unknown_departure)
+            )
+        method(node)
+
     def unknown_visit(self, node):
         """Warn once per instance for unsupported nodes."""
+        self._unknown_visits += 1
         node_type = node.__class__.__name__
         if node_type not in self._warned:
             super().unknown_visit(node)
             self._warned.add(node_type)
-        raise nodes.SkipNode
+        return self._skip()
+
+    ################################################################################
+    # render cache
+    ################################################################################
+
+    def _cached_handler(self, node_class: type, state: str, method: Callable) -> Callable:
+        if self._render_cache is None or node_class.__name__ not in RENDER_CACHE_ELEMENTS:
+            return method
+        if state == "visit":
+            return functools.partial(self._visit_cached, method)
+        return functools.partial(self._depart_cached, method)
+
+    def _render_cache_key(self, node) -> Optional[Tuple]:
+        """
+        The rendering of a subtree depends on the subtree, the status, the options, the HTTP base,
+        and the document if URLs are relative to it.
+        Returns `None` if the current context affects the rendering (e.g., inside a table).
+        """
+        if isinstance(self.ctx, (TableContext, CommaSeparatedContext)):
+            return None
+        status = self.status
+        url_resolver = self.builder.url_resolver
+        return (
+            structural_hash(node),
+            status.escape_text,
+            status.section_level,
+            status.list_marker is not None,
+            status.desc_type,
+            status.default_ref_internal,
+            self.options,
+            url_resolver.http_base,
+            self.builder.current_doc_name if url_resolver.http_base else None,
+        )
+
+    def _visit_cached(self, method: Callable, node):
+        key = self._render_cache_key(node)
+        if key is not None:
+            operations = self._render_cache.get(key)
+            if operations is not None:
+                replay(operations, self.ctx)
+                return self._skip()
+
+        self._start_recording(key)
+        try:
+            result = method(node)
+        except (nodes.SkipNode, nodes.SkipDeparture):
+            self._finish_recording(store=False)
+            raise
+        if result is SKIP_NODE:
+            self._finish_recording(store=False)
+        return result
+
+    def _depart_cached(self, method: Callable, node):
+        method(node)
+        self._finish_recording(store=True)
+
+    def _start_recording(self, key: Optional[Tuple]):
+        if key is None:
+            self._recordings.append(None)
+            return
+        recorder = RecordingContext()
+        self._recordings.append((key, recorder, len(self._doc_info.body), self._unknown_visits))
+        self._push_context(recorder)
+
+    def _finish_recording(self, store: bool):
+        """Replays the recorded operations on the enclosing context, and stores them in the cache"""
+        recording = self._recordings.pop()
+        if recording is None:
+            return
+        key, recorder, doc_info_size, unknown_visits = recording
+        assert self.ctx is recorder, "Unbalanced contexts in a recorded subtree"
+        self._ctx_queue.pop()
+        replay(recorder.operations, self.ctx)
+        # Do not store subtrees with side effects that a replay would skip (e.g., warnings)
+        if store and doc_info_size == len(self._doc_info.body) and unknown_visits == self._unknown_visits:
+            self._render_cache.put(key, recorder.operations)
 
     ################################################################################
     # visit/depart handlers
@@ -409,10 +625,26 @@ class MarkdownTranslator(SphinxTranslator):  # pylint: disable=too-many-public-m
             IndentContext(": ", only_first=True, support_multi_line_break=True, params=SubContextParams(1, 2))
         )
 
-    def visit_math_block(self, _node):
+    def _add_raw_block(self, node, opening: str, closing: str):
+        """
+        Fast path for a block that contains only text: adds its whole text as a single segment.
+        Returns `None` if the block contains other nodes (e.g., parsed-literal).
+        """
+        if not all(isinstance(child, nodes.Text) for child in node.children):
+            return None
+        self.add(opening, prefix_eol=1, suffix_eol=1)
+        self.add(node.astext().replace("\r", ""))
+        self.add(closing, prefix_eol=1, suffix_eol=2)
+        return self._skip()
+
+    def visit_math_block(self, node):
         """docutils math block"""
+        skip = self._add_raw_block(node, "$$", "$$")
+        if skip is not None:
+            return skip
         self._push_status(escape_text=False)
         self.add("$$", prefix_eol=1, suffix_eol=1)
+        return None
 
     def depart_math_block(self, _node):
         """docutils math block"""
@@ -437,20 +669,33 @@ class MarkdownTranslator(SphinxTranslator):  # pylint: disable=too-many-public-m
         self.add("`")
         self._pop_status()
 
-    def visit_literal_block(self, node):
+    @staticmethod
+    def _code_fence(node) -> str:
+        """A fence longer than any backtick sequence in the code, so the code cannot close it"""
+        longest = max((len(fence) for fence in CODE_FENCE_PATTERN.findall(node.astext())), default=0)
+        return "`" * max(3, longest + 1)
+
+    def _visit_code_block(self, node, code_type: str):
+        fence = self._code_fence(node)
+        skip = self._add_raw_block(node, f"{fence}{code_type}", fence)
+        if skip is not None:
+            return skip
         self._push_status(escape_text=False)
+        self.add(f"{fence}{code_type}", prefix_eol=1, suffix_eol=1)
+        return None
+
+    def visit_literal_block(self, node):
         code_type = node["classes"][1] if "code" in node["classes"] else ""
         if "language" in node:
             code_type = node["language"]
-        self.add(f"```{code_type}", prefix_eol=1, suffix_eol=1)
+        return self._visit_code_block(node, code_type)
 
-    def depart_literal_block(self, _node):
-        self.add("```", prefix_eol=1, suffix_eol=2)
+    def depart_literal_block(self, node):
+        self.add(self._code_fence(node), prefix_eol=1, suffix_eol=2)
         self._pop_status()
 
-    def visit_doctest_block(self, _node):
-        self._push_status(escape_text=False)
-        self.add("```pycon", prefix_eol=1, suffix_eol=1)
+    def visit_doctest_block(self, node):
+        return self._visit_code_block(node, "pycon")
 
     depart_doctest_block = depart_literal_block
 
@@ -460,16 +705,30 @@ class MarkdownTranslator(SphinxTranslator):  # pylint: disable=too-many-public-m
 
     def visit_problematic(self, node):
         self.add(f"```\n{node.astext()}\n```", prefix_eol=2, suffix_eol=2)
-        raise nodes.SkipNode
+        return self._skip()
 
-    @pushing_status
     def visit_section(self, node):
+        if self.segments is not None and self.segments.enter(node, self._unknown_visits):
+            return self._skip()
+
         self.ensure_eol(2)
-        if self.config.markdown_anchor_sections:
-            for anchor in node.get("ids", []):
-                self._add_anchor(anchor)
+        path, _ = self._section_stack[-1]
+        title = node[0].astext() if len(node) > 0 and isinstance(node[0], nodes.title) else ""
+        self._section_stack.append(((*path, title), tuple(node.get("ids", []))))
+        self._mark_section()
+
+        for anchor in node.get("ids", []):
+            self._add_anchor(anchor, "anchor_sections")
 
         self._push_status(section_level=self.status.section_level + 1)
+        return None
+
+    def depart_section(self, node):
+        self._pop_status()
+        self._section_stack.pop()
+        self._mark_section()
+        if self.segments is not None:
+            self.segments.leave(node, self._unknown_visits)
 
     @pushing_context
     def visit_title(self, _node):
@@ -498,38 +757,23 @@ class MarkdownTranslator(SphinxTranslator):  # pylint: disable=too-many-public-m
         """Simply replace a transition by a horizontal rule."""
         # Can use three or more '*', '_' or '-'.
         self.add("---", prefix_eol=2, suffix_eol=1)
-        raise nodes.SkipNode
+        return self._skip()
 
     def _adjust_url(self, url: str):
         """Replace `refuri` in reference with HTTP address, if possible"""
-        if not self.config.markdown_http_base:
-            return url
-
-        # If HTTP page build URL known, make link relative to that.
-        this_doc = self.builder.current_doc_name
-        if url == "":  # Reference to this doc
-            url = self.builder.get_target_uri(this_doc)
-        else:  # URL is relative to the current docname.
-            this_dir = posixpath.dirname(this_doc)
-            if this_dir:
-                url = posixpath.normpath(f"{this_dir}/{url}")
-        return f"{self.config.markdown_http_base}/{url}"
+        if self.ir is not None:
+            return self.ir.url_placeholder("adjust", url)
+        return self.builder.url_resolver.adjust_url(self.builder.current_doc_name, url)
 
     def _fetch_ref_uri(self, node):
-        uri = node.get("refuri", "")
-
-        # Do not modify external URL in any way
-        if not node.get("internal", self.status.default_ref_internal):
-            return uri
-
-        uri = self._adjust_url(uri)
-
-        # Whatever the URL is, add the anchor to it
-        ref_id = node.get("refid", None)
-        if ref_id is not None:
-            uri = f"#{ref_id}"
-
-        return uri
+        reference = (
+            node.get("refuri", ""),
+            node.get("refid", None),
+            node.get("internal", self.status.default_ref_internal),
+        )
+        if self.ir is not None:
+            return self.ir.url_placeholder("resolve", *reference)
+        return self.builder.url_resolver.resolve(self.builder.current_doc_name, *reference)
 
     @pushing_context
     def visit_reference(self, node):
@@ -541,11 +785,18 @@ class MarkdownTranslator(SphinxTranslator):  # pylint: disable=too-many-public-m
         reftarget = self._adjust_url(node.get("reftarget", ""))
         self._push_context(WrappedContext("[", f"]({reftarget})"))
 
-    def _add_anchor(self, anchor: str):
+    def _add_anchor(self, anchor: str, option: Optional[str] = None):
+        """Adds an anchor, if the translator config `option` enables it (or if there is no option)"""
+        enabled = option is None or getattr(self.options, option)
+        if not enabled and self.ir is None:
+            return
         content = f'<a id="{escape_html_quote(anchor)}"></a>'
-        # Prevent adding the same anchor twice in the same context
-        if content not in self.ctx.content:
-            self.add(content, prefix_eol=2, suffix_eol=1)
+        if self.ir is not None:
+            # The IR has the anchor regardless of the option, and is rendered according to it
+            self.ir.record(ANCHOR, option, content)
+        if enabled:
+            # Prevent adding the same anchor twice in the same context
+            self.ctx.add_unique(content, prefix_eol=2, suffix_eol=1)
 
     def visit_target(self, node):
         ref_id = node.get("refid", None)
@@ -623,15 +874,110 @@ class MarkdownTranslator(SphinxTranslator):  # pylint: disable=too-many-public-m
         """the main signature of class/method"""
 
         # Insert anchors if enabled by the config
-        if self.config.markdown_anchor_signatures:
-            for anchor in node.get("ids", []):
-                self._add_anchor(anchor)
+        for anchor in node.get("ids", []):
+            self._add_anchor(anchor, "anchor_signatures")
 
         # We don't want methods to be at the same level as classes,
         # If signature has a non-null class, that's means it is a signature
         # of a class method
         h_level = 4 if node.get("class", None) else 3
+        content = self._render_signature(node, self.status.escape_text)
+        if content is not None and content.strip():
+            title = TitleContext(h_level)
+            title.add(content)
+            self.add(title.make(), title.params.prefix_eol, title.params.suffix_eol)
+            return self._skip()
+
         self._push_context(TitleContext(h_level))
+        return None
+
+    def _handler_element(self, node_class: type, state: str) -> Optional[str]:
+        """The element of the handler that `_find_handler()` resolves for the node class"""
+        for cls in node_class.__mro__:
+            if getattr(self, f"{state}_{cls.__name__}", None) is not None:
+                return cls.__name__
+        return None
+
+    def _find_signature_rule(  # pylint: disable=too-many-return-statements
+        self, node_class: type
+    ) -> Optional[SignatureRule]:
+        element = self._handler_element(node_class, "visit")
+        if element is None or element != self._handler_element(node_class, "depart"):
+            return None
+        if element in SIGNATURE_ELEMENTS:
+            return SIGNATURE_ELEMENTS[element]
+
+        # Handlers that are added explicitly override the predefined ones,
+        # including those of `app.add_node()`, which are set on the instance
+        if self._is_element_defined(element):
+            return None
+        action = PREDEFINED_ELEMENTS.get(element, "__undefined__")
+        if action is None:
+            return SIG_PASS, None
+        if not isinstance(action, PushContext) or action.ctx is not WrappedContext:
+            return None
+        # Only simple wrappers, that do not depend on the node, nor add EOLs
+        if action.translator is not DEFAULT_TRANSLATOR or "params" in action.kwargs:
+            return None
+        return SIG_WRAP, action.create(None, element)
+
+    def _signature_rule(self, node_class: type) -> Optional[SignatureRule]:
+        try:
+            return self._signature_rules[node_class]
+        except KeyError:
+            rule = self._signature_rules[node_class] = self._find_signature_rule(node_class)
+            return rule
+
+    def _render_signature(self, node, escape_text: bool) -> Optional[str]:
+        """
+        Renders the children of a signature in a single pass, without pushing contexts.
+        Produces the same text as the generic handlers, or returns `None` if an element is not supported.
+        """
+        parts: List[str] = []
+        for child in node.children:
+            rule = self._signature_rule(child.__class__)
+            if rule is None or rule[0] == SIG_PARAMETER:  # Parameters are only supported in a parameter list
+                return None
+            content = self._render_signature_node(child, rule, escape_text)
+            if content is None:
+                return None
+            parts.append(content)
+        return "".join(parts)
+
+    def _render_signature_node(self, node, rule: SignatureRule, escape_text: bool) -> Optional[str]:
+        kind, wrapper = rule
+        if kind == SIG_TEXT:
+            text = node.astext().replace("\r", "")
+            return escape_markdown_chars(text) if escape_text else text
+
+        if kind == SIG_REFERENCE:
+            wrapper = WrappedContext("[", f"]({self._fetch_ref_uri(node)})")
+        if kind == SIG_PARAMETERS:
+            content = self._render_parameters(node, escape_text)
+        else:
+            content = self._render_signature(node, escape_text)
+        if content is None or wrapper is None:
+            return content
+        return wrapper.wrap(content)
+
+    def _render_parameters(self, node, escape_text: bool) -> Optional[str]:
+        """Same as `CommaSeparatedContext`: the content outside the parameters, then the separated parameters"""
+        body: List[str] = []
+        parameters: List[str] = []
+        for child in node.children:
+            rule = self._signature_rule(child.__class__)
+            if rule is None:
+                return None
+            if rule[0] == SIG_PARAMETER:
+                content = self._render_signature(child, escape_text)
+                output = parameters
+            else:
+                content = self._render_signature_node(child, rule, escape_text)
+                output = body
+            if content is None:
+                return None
+            output.append(content)
+        return "".join(body) + ", ".join(parameters)
 
     def visit_desc_parameterlist(self, _node):
         self._push_context(WrappedContext("(", ")", wrap_empty=True))
@@ -640,18 +986,12 @@ class MarkdownTranslator(SphinxTranslator):  # pylint: disable=too-many-public-m
     def depart_desc_parameterlist(self, _node):
         self._pop_context(count=2)
 
-    @property
-    def sep_ctx(self) -> CommaSeparatedContext:
-        ctx = self.ctx
-        assert isinstance(ctx, CommaSeparatedContext)
-        return ctx
-
     def visit_desc_parameter(self, _node):
         """single method/class ctr param"""
-        self.sep_ctx.enter_parameter()  # workaround pylint: disable=no-member
+        self._ctx_call(CommaSeparatedContext, "enter_parameter")
 
     def depart_desc_parameter(self, _node):
-        self.sep_ctx.exit_parameter()  # workaround pylint: disable=no-member
+        self._ctx_call(CommaSeparatedContext, "exit_parameter")
 
     def visit_field_list(self, _node):
         self._start_list("*")
@@ -690,36 +1030,30 @@ class MarkdownTranslator(SphinxTranslator):  # pylint: disable=too-many-public-m
     #           paragraph (optional)
     ###############################################################################
 
-    @property
-    def table_ctx(self) -> TableContext:
-        ctx = self.ctx
-        assert isinstance(ctx, TableContext)
-        return ctx
-
     @pushing_context
     def visit_table(self, _node):
         self._push_context(TableContext(params=SubContextParams(2, 1)))
 
     def visit_thead(self, _node):
-        self.table_ctx.enter_head()  # workaround pylint: disable=no-member
+        self._ctx_call(TableContext, "enter_head")
 
     def depart_thead(self, _node):
-        self.table_ctx.exit_head()  # workaround pylint: disable=no-member
+        self._ctx_call(TableContext, "exit_head")
 
     def visit_tbody(self, _node):
-        self.table_ctx.enter_body()  # workaround pylint: disable=no-member
+        self._ctx_call(TableContext, "enter_body")
 
     def depart_tbody(self, _node):
-        self.table_ctx.exit_body()  # workaround pylint: disable=no-member
+        self._ctx_call(TableContext, "exit_body")
 
     def visit_row(self, _node):
-        self.table_ctx.enter_row()  # workaround pylint: disable=no-member
+        self._ctx_call(TableContext, "enter_row")
 
     def depart_row(self, _node):
-        self.table_ctx.exit_row()  # workaround pylint: disable=no-member
+        self._ctx_call(TableContext, "exit_row")
 
     def visit_entry(self, _node):
-        self.table_ctx.enter_entry()  # workaround pylint: disable=no-member
+        self._ctx_call(TableContext, "enter_entry")
 
     def depart_entry(self, _node):
-        self.table_ctx.exit_entry()  # workaround pylint: disable=no-member
+        self._ctx_call(TableContext, "exit_entry")
@@ -0,0 +1,89 @@
+"""
+Resolution of reference URLs.
+"""
+
+import posixpath
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+DEFAULT_CACHE_SIZE = 2**16
+
+CacheKey = Tuple[Optional[str], str, Optional[str], bool]
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    def merge(self, other: "CacheStats"):
+        self.hits += other.hits
+        self.misses += other.misses
+        self.evictions += other.evictions
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class UrlResolver:
+    """
+    Resolves the URLs of references, according to the `markdown_http_base` and `markdown_uri_doc_suffix` configurations.
+    API documents resolve the same references over and over, so the resolved URLs are cached (LRU).
+    """
+
+    def __init__(self, http_base: str = "", doc_suffix: str = ".md", cache_size: int = DEFAULT_CACHE_SIZE):
+        self.http_base = http_base
+        self.http_prefix = f"{http_base}/"
+        self.doc_suffix = doc_suffix
+        self.cache_size = cache_size
+        self.stats = CacheStats()
+        self._cache: "OrderedDict[CacheKey, str]" = OrderedDict()
+
+    def target_uri(self, docname: str) -> str:
+        return f"{docname}{self.doc_suffix}"
+
+    def adjust_url(self, docname: str, url: str) -> str:
+        """Replace `refuri` in reference with HTTP address, if possible"""
+        if not self.http_base:
+            return url
+
+        # If HTTP page build URL known, make link relative to that.
+        if url == "":  # Reference to this doc
+            url = self.target_uri(docname)
+        else:  # URL is relative to the current docname.
+            this_dir = posixpath.dirname(docname)
+            if this_dir:
+                url = posixpath.normpath(f"{this_dir}/{url}")
+        return f"{self.http_prefix}{url}"
+
+    def _resolve(self, docname: str, refuri: str, ref_id: Optional[str], internal: bool) -> str:
+        # Do not modify external URL in any way
+        if not internal:
+            return refuri
+
+        # Whatever the URL is, add the anchor to it
+        if ref_id is not None:
+            return f"#{ref_id}"
+
+        return self.adjust_url(docname, refuri)
+
+    def resolve(self, docname: str, refuri: str, ref_id: Optional[str], internal: bool) -> str:
+        # Without an HTTP base, the resolution does not depend on the current document
+        key = (docname if self.http_base else None, refuri, ref_id, internal)
+        cache = self._cache
+        url = cache.get(key, None)
+        if url is not None:
+            self.stats.hits += 1
+            cache.move_to_end(key)
+            return url
+
+        self.stats.misses += 1
+        url = cache[key] = self._resolve(docname, refuri, ref_id, internal)
+        if len(cache) > self.cache_size:
+            cache.popitem(last=False)
+            self.stats.evictions += 1
+        return url
@@ -0,0 +1,69 @@
+"""
+Output variants: additional outputs of the same build, with different reference and anchor settings.
+
+For example, in `conf.py`:
+
+    markdown_variants = {
+        "web": {"markdown_http_base": "https://example.com/docs", "markdown_uri_doc_suffix": ".html"},
+    }
+
+renders each document again into `<outdir>-web` (e.g., `build/markdown-web`), without another read phase.
+The variants are siblings of the output directory, so their files never clash with the outputs of the documents.
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from sphinx_markdown_builder.config import TranslatorConfig
+from sphinx_markdown_builder.urls import UrlResolver
+
+# The configurations that a variant can override
+VARIANT_OPTIONS = (
+    "markdown_http_base",
+    "markdown_uri_doc_suffix",
+    "markdown_anchor_sections",
+    "markdown_anchor_signatures",
+    "markdown_docinfo",
+)
+
+
+class VariantConfig:  # pylint: disable=too-few-public-methods
+    """The project configuration, with the variant's overrides"""
+
+    def __init__(self, config, overrides: Dict[str, Any]):
+        self._config = config
+        self._overrides = overrides
+
+    def __getattr__(self, item):
+        try:
+            return self._overrides[item]
+        except KeyError:
+            return getattr(self._config, item)
+
+
+@dataclass
+class OutputVariant:
+    name: str
+    outdir: str
+    config: VariantConfig
+    url_resolver: UrlResolver
+    translator_config: Optional[TranslatorConfig] = None  # Created when the write phase starts
+
+    @property
+    def doc_suffix(self) -> str:
+        return self.url_resolver.doc_suffix
+
+
+def unknown_options(overrides: Dict[str, Any]) -> List[str]:
+    return sorted(set(overrides) - set(VARIANT_OPTIONS))
+
+
+def create_variant(name: str, overrides: Dict[str, Any], config, outdir: str) -> OutputVariant:
+    variant_config = VariantConfig(config, {key: overrides[key] for key in VARIANT_OPTIONS if key in overrides})
+    return OutputVariant(
+        name,
+        f"{os.path.normpath(outdir)}-{name}",
+        variant_config,
+        UrlResolver(variant_config.markdown_http_base, variant_config.markdown_uri_doc_suffix),
+    )
@@ -0,0 +1,80 @@
+"""
+Iterative doctree traversal.
+
+Same semantics as `docutils.nodes.Node.walkabout()`, but uses an explicit stack instead of recursion,
+so very deep doctrees do not hit the recursion limit.
+Visit handlers may return `SKIP_NODE` to skip the node's subtree and departure, instead of raising `SkipNode`.
+The docutils exceptions (`SkipNode`, `SkipDeparture`, `SkipChildren`, `SkipSiblings`, `StopTraversal`)
+are still supported.
+"""
+
+from typing import List
+
+from docutils import nodes
+
+from sphinx_markdown_builder.contexts import UniqueString
+
+SKIP_NODE = UniqueString("skip node")
+
+# Visit results
+_ENTER = 0  # Visit children, then depart
+_ENTER_NO_DEPART = 1  # Visit children, without departure
+_DEPART = 2  # Skip children, but depart
+_SKIP = 3  # Skip children and departure
+_SKIP_SIBLINGS = 4  # Skip children, departure, and the following siblings
+_STOP = 5  # Depart, and stop the traversal
+
+
+def _visit(visitor: nodes.NodeVisitor, node: nodes.Node) -> int:
+    try:
+        return _SKIP if visitor.dispatch_visit(node) is SKIP_NODE else _ENTER
+    except nodes.SkipNode:
+        return _SKIP
+    except nodes.SkipDeparture:
+        return _ENTER_NO_DEPART
+    except nodes.SkipChildren:
+        return _DEPART
+    except nodes.SkipSiblings:
+        return _SKIP_SIBLINGS
+    except nodes.StopTraversal:
+        return _STOP
+
+
+class _Frame:  # pylint: disable=too-few-public-methods
+    __slots__ = "node", "children", "index", "depart"
+
+    def __init__(self, node: nodes.Node, action: int):
+        self.node = node
+        # Like walkabout(), iterate over a copy, in case the handlers modify the children
+        self.children = node.children[:] if action in (_ENTER, _ENTER_NO_DEPART) else []
+        self.index = 0
+        self.depart = action != _ENTER_NO_DEPART
+
+
+def walk(root: nodes.Node, visitor: nodes.NodeVisitor):
+    """
+    Traverse a tree of `Node` objects, calling the `dispatch_visit()` method of `visitor` when entering each node,
+    and the `dispatch_departure()` method before exiting each node.
+    """
+    action = _visit(visitor, root)
+    if action in (_SKIP, _SKIP_SIBLINGS):
+        return
+
+    stack: List[_Frame] = [_Frame(root, action)]
+    stopped = action == _STOP
+    while stack:
+        frame = stack[-1]
+        if stopped or frame.index >= len(frame.children):
+            stack.pop()
+            if frame.depart:
+                visitor.dispatch_departure(frame.node)
+            continue
+
+        child = frame.children[frame.index]
+        frame.index += 1
+        action = _visit(visitor, child)
+        if action == _SKIP_SIBLINGS:
+            frame.index = len(frame.children)
+        elif action != _SKIP:
+            stack.append(_Frame(child, action))
+            stopped = action == _STOP
@@ -4,7 +4,10 @@ Custom docutils writer for markdown.
 
 from docutils import frontend, writers
 
+from sphinx_markdown_builder.ir import render_ir
+from sphinx_markdown_builder.standalone import StandaloneBuilder, StandaloneConfig
 from sphinx_markdown_builder.translator import MarkdownTranslator
+from sphinx_markdown_builder.walker import walk
 
 
 class MarkdownWriter(writers.Writer):
@@ -14,6 +17,18 @@ class MarkdownWriter(writers.Writer):
     output = None
     """Final translated form of `document`."""
 
+    sections = None
+    """Section boundaries in `output`."""
+
+    stats = None
+    """Translator's figures of the last document (`TranslatorStats`)."""
+
+    ir = None
+    """Intermediate representation of the last document (`DocumentIR`), if recorded."""
+
+    segments = None
+    """Sections of the last document that were reused from its previous IR (`SegmentTracker`), if enabled."""
+
     # Add configuration settings for additional Markdown flavours here.
     settings_spec = (
         "Markdown writer options",
@@ -40,13 +55,30 @@ class MarkdownWriter(writers.Writer):
         ),
     )
 
+    # The first section of a standalone document is not promoted to the document title
+    settings_default_overrides = {"doctitle_xform": False}
+
     translator_class = MarkdownTranslator
 
-    def __init__(self, builder=None):
+    def __init__(self, builder=None, **config):
+        """
+        Without a builder (e.g., `docutils.core.publish_string(source, writer=MarkdownWriter())`),
+        a stand-in builder is used, with the `markdown_*` configurations passed as keywords.
+        """
         super().__init__()
+        if builder is None:
+            builder = StandaloneBuilder(StandaloneConfig(**config))
         self.builder = builder
 
     def translate(self):
         visitor = self.builder.create_translator(self.document, self.builder)
-        self.document.walkabout(visitor)
+        visitor.skip_by_signal = True
+        walk(self.document, visitor)
         self.output = visitor.astext()
+        self.sections = visitor.sections
+        self.stats = visitor.stats
+        self.ir = visitor.ir
+        self.segments = visitor.segments
+        if self.ir is not None:
+            # The translator's output has URL placeholders
+            self.output, self.sections = render_ir(self.ir, visitor.options, self.builder.url_resolver)
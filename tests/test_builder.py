@@ -1,14 +1,33 @@
 """
 Integration tests for the markdown builder
 """
+
+import json
 import os
 import shutil
+import sqlite3
 import stat
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from pathlib import Path
 from typing import Iterable
+from unittest.mock import patch
+from urllib.error import HTTPError
+from urllib.request import urlopen
 
 import pytest
+from sphinx.application import Sphinx
 from sphinx.cmd.build import main
+from sphinx.util.docutils import docutils_namespace, patch_docutils
+
+from sphinx_markdown_builder import convert
+from sphinx_markdown_builder.api import build_markdown, iter_markdown
+from sphinx_markdown_builder.builder import MarkdownBuilder
+from sphinx_markdown_builder.database import MarkdownDatabase
+from sphinx_markdown_builder.memory import TranslatorStats
+from sphinx_markdown_builder.server import DocumentRenderer, create_server
+from sphinx_markdown_builder.store import main as store_main
 
 BUILD_PATH = "./tests/docs-build"
 SOURCE_PATH = "./tests/source"
@@ -90,3 +109,249 @@ def test_builder_access_issue(flags: Iterable[str], build_path: str):
         run_sphinx(build_path, *flags)
     finally:
         _chmod_output(build_path, lambda mode: mode | flag)
+
+
+def test_chunks(tmp_path):
+    run_sphinx(str(tmp_path), "-q", "-D", "markdown_chunks=True", "-D", "markdown_anchor_sections=True")
+    data = (tmp_path / "markdown" / "ExampleRSTFile.md").read_bytes()
+    with open(tmp_path / "markdown" / "ExampleRSTFile.chunks.jsonl", encoding="utf-8") as file:
+        chunks = [json.loads(line) for line in file]
+    assert [chunk["index"] for chunk in chunks] == list(range(len(chunks)))
+    assert all(chunk["docname"] == "ExampleRSTFile" for chunk in chunks)
+    sections = [chunk for chunk in chunks if chunk["path"]]
+    assert sections and all(chunk["anchors"] for chunk in sections)
+    first = sections[0]
+    assert "\n# Example .rst File\n" in data[first["start"] : first["end"]].decode("utf-8")  # noqa: E203
+
+
+def test_sqlite(tmp_path):
+    run_sphinx(str(tmp_path), "-q", "-D", "markdown_sqlite=markdown.sqlite", "-D", "markdown_anchor_signatures=True")
+    with closing(sqlite3.connect(tmp_path / "markdown" / "markdown.sqlite")) as connection:
+        query = "SELECT docname FROM anchors WHERE anchor = ?"
+        # A section, a glossary term and a signature
+        for anchor in ("heading-levels", "term-Glossary1-Term1", "my_module.func1"):
+            assert len(connection.execute(query, (anchor,)).fetchall()) == 1
+        assert connection.execute("SELECT count(*) FROM search WHERE search MATCH 'edX'").fetchone()[0] > 0
+
+    # A locked database does not fail the build
+    close = MarkdownDatabase.close
+    with patch.object(MarkdownDatabase, "flush", side_effect=sqlite3.OperationalError("database is locked")):
+        with patch.object(MarkdownDatabase, "close", autospec=True, side_effect=close) as close_mock:
+            run_sphinx(str(tmp_path), "-a", "-q", "-D", "markdown_sqlite=markdown.sqlite")
+    assert close_mock.called
+
+
+def test_trace(tmp_path):
+    run_sphinx(str(tmp_path), "-a", "-q", "-j", "2", "-D", "markdown_trace=trace.json")
+    trace = json.loads((tmp_path / "markdown" / "trace.json").read_text(encoding="utf-8"))
+    stages = {event["cat"] for event in trace["traceEvents"] if event["ph"] == "X"}
+    assert {"build", "read-phase", "parse", "translate"} <= stages
+
+
+def test_memory_report(tmp_path):
+    def write_variants(self, *_args):
+        self.writer.stats = TranslatorStats(99, 99, 99)  # As the translation of a variant
+
+    with patch.object(MarkdownBuilder, "_write_variants", write_variants):
+        run_sphinx(str(tmp_path), "-a", "-q", "-D", "markdown_memory_report=memory.json")
+    report = json.loads((tmp_path / "markdown" / "memory.json").read_text(encoding="utf-8"))
+    index = next(record for record in report["documents"] if record["docname"] == "index")
+    assert index["output_size"] == len((tmp_path / "markdown" / "index.md").read_text(encoding="utf-8"))
+    assert 1 <= index["context_depth"] < 99 and index["fragments"] < 99
+
+
+def test_variants(tmp_path):
+    source = tmp_path / "source"
+    shutil.copytree(SOURCE_PATH, source)
+    shutil.copytree(os.path.join(os.path.dirname(SOURCE_PATH), "my_module"), tmp_path / "my_module")
+    variants = {"web": {"markdown_uri_doc_suffix": ".html"}, "library": {"markdown_anchor_sections": True}}
+    with open(source / "conf.py", "a", encoding="utf-8") as file:
+        file.write(f"\nmarkdown_variants = {variants!r}\n")
+    assert main(["-M", "markdown", str(source), str(tmp_path / "variants"), "-q", "-j", "2"]) == 0
+    run_sphinx(str(tmp_path / "web"), "-q", "-D", "markdown_uri_doc_suffix=.html")
+    outdirs = ("markdown", "markdown-library")
+    for name in ("index.md", "links.md", os.path.join("library", "my_module.md")):
+        expected = (tmp_path / "web" / "markdown" / name).read_text(encoding="utf-8")
+        assert (tmp_path / "variants" / "markdown-web" / name).read_text(encoding="utf-8") == expected
+    # A variant named after a source directory does not clash with the outputs of its documents
+    module, variant_module = (tmp_path / "variants" / name / "library" / "my_module.md" for name in outdirs)
+    assert module.read_text(encoding="utf-8") != variant_module.read_text(encoding="utf-8")
+    assert not (tmp_path / "variants" / "markdown" / "web").exists()
+
+
+def test_build_markdown():
+    documents = build_markdown(SOURCE_PATH)
+    assert {"index", "blocks", "links"} <= set(documents)
+    assert all(isinstance(markdown, str) and markdown for markdown in documents.values())
+    assert dict(iter_markdown(SOURCE_PATH, jobs=2)) == documents
+
+
+def test_render_server(tmp_path):
+    run_sphinx(str(tmp_path), "-q")
+    with patch_docutils(SOURCE_PATH), docutils_namespace():
+        app = Sphinx(SOURCE_PATH, SOURCE_PATH, str(tmp_path / "serve"), str(tmp_path / "doctrees"), "markdown")
+        renderer = DocumentRenderer(app)
+        server = create_server(renderer, port=0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            url = f"http://127.0.0.1:{server.server_port}"
+            with ThreadPoolExecutor(4) as executor:
+                documents = list(executor.map(lambda _: urlopen(f"{url}/index.md").read().decode(), range(4)))
+            assert documents == [(tmp_path / "markdown" / "index.md").read_text(encoding="utf-8")] * 4
+
+            metrics = json.loads(urlopen(f"{url}/_metrics").read())
+            assert metrics["entries"] == 1 and metrics["hits"] + metrics["misses"] == 4
+
+            doctree = tmp_path / "doctrees" / "index.doctree"
+            os.utime(doctree, (doctree.stat().st_atime, doctree.stat().st_mtime + 1))
+            assert urlopen(f"{url}/index").read().decode() == documents[0]
+            assert json.loads(urlopen(f"{url}/_metrics").read())["invalidations"] == 1
+
+            environment = tmp_path / "doctrees" / "environment.pickle"
+            os.utime(environment, (environment.stat().st_atime, environment.stat().st_mtime + 1))
+            assert urlopen(f"{url}/index").read().decode() == documents[0]
+            metrics = json.loads(urlopen(f"{url}/_metrics").read())
+            assert metrics["reloads"] == 1 and metrics["invalidations"] == 2
+
+            (tmp_path / "doctrees" / "links.doctree").unlink()
+            with pytest.raises(HTTPError) as error:
+                urlopen(f"{url}/links")
+            assert error.value.code == 404
+            renderer.cache.clear()
+            with patch.object(renderer, "_translate", side_effect=RuntimeError("broken")):
+                with pytest.raises(HTTPError) as error:
+                    urlopen(f"{url}/index")
+            assert error.value.code == 500
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+def test_convert_doctrees(tmp_path):
+    run_sphinx(str(tmp_path), "-q")
+    doctrees, outdir = str(tmp_path / "doctrees"), tmp_path / "converted"
+    assert convert.main([SOURCE_PATH, doctrees, str(outdir), "-j", "2"]) == 0
+    expected = tmp_path / "markdown" / "index.md"
+    assert (outdir / "index.md").read_text(encoding="utf-8") == expected.read_text(encoding="utf-8")
+    assert (outdir / "library" / "my_module.md").exists()
+
+    # Unchanged doctrees are not converted again
+    (outdir / "index.md").write_text("stale", encoding="utf-8")
+    assert convert.main([SOURCE_PATH, doctrees, str(outdir)]) == 0
+    assert (outdir / "index.md").read_text(encoding="utf-8") == "stale"
+    assert convert.main([SOURCE_PATH, doctrees, str(outdir), "-a", "-D", "markdown_trace=trace.json"]) == 0
+    assert (outdir / "index.md").read_text(encoding="utf-8") == expected.read_text(encoding="utf-8")
+    assert (outdir / "trace.json").exists()
+
+    # A document whose output could not be written is not recorded as converted
+    (outdir / "index.md").unlink()
+    (outdir / "index.md").mkdir()
+    assert convert.main([SOURCE_PATH, doctrees, str(outdir), "-a"]) == 0
+    manifest = json.loads((outdir / convert.MANIFEST_FILE).read_text(encoding="utf-8"))
+    assert "index" not in manifest["documents"] and "links" in manifest["documents"]
+
+
+def test_cobuild(tmp_path):
+    run_sphinx(str(tmp_path / "standalone"), "-q")
+    flags = ["-q", "-D", "markdown_cobuild_dir=../markdown", "-D", "markdown_trace=trace.json"]
+    assert main(["-M", "html", SOURCE_PATH, str(tmp_path), *flags]) == 0
+    assert (tmp_path / "html" / "index.html").exists()
+    for name in ("index.md", "blocks.md", os.path.join("library", "my_module.md")):
+        expected = (tmp_path / "standalone" / "markdown" / name).read_text(encoding="utf-8")
+        assert (tmp_path / "markdown" / name).read_text(encoding="utf-8") == expected
+    trace = json.loads((tmp_path / "markdown" / "trace.json").read_text(encoding="utf-8"))
+    stages = {event["cat"] for event in trace["traceEvents"] if event["ph"] == "X"}
+    assert {"build", "read-phase", "translate"} <= stages
+
+
+def test_incremental_sections(tmp_path):
+    source = tmp_path / "source"
+    shutil.copytree(SOURCE_PATH, source)
+    shutil.copytree(os.path.join(os.path.dirname(SOURCE_PATH), "my_module"), tmp_path / "my_module")
+    flags = ["-q", "-D", "markdown_incremental_sections=True"]
+    assert main(["-M", "markdown", str(source), str(tmp_path / "incremental"), *flags]) == 0
+
+    rst = source / "ExampleRSTFile.rst"
+    text = rst.read_text(encoding="utf-8")
+    rst.write_text(text.replace("is heading 1", "is heading 1 (see `links <https://example.org>`_)"), encoding="utf-8")
+    assert main(["-M", "markdown", str(source), str(tmp_path / "incremental"), *flags]) == 0
+    assert main(["-M", "markdown", str(source), str(tmp_path / "full"), "-q"]) == 0
+    expected = (tmp_path / "full" / "markdown" / "ExampleRSTFile.md").read_text(encoding="utf-8")
+    assert "https://example.org" in expected
+    assert (tmp_path / "incremental" / "markdown" / "ExampleRSTFile.md").read_text(encoding="utf-8") == expected
+
+
+HARDLINK_FLAGS = ["-E", "-D", "markdown_content_store_hardlinks=1"]
+
+
+def test_content_store(tmp_path):
+    store = tmp_path / "store"
+    for name in ("main", "branch"):
+        run_sphinx(str(tmp_path / name), "-q", "-D", f"markdown_content_store={store}")
+    main_index, branch_index = (tmp_path / name / "markdown" / "index.md" for name in ("main", "branch"))
+    assert main_index.read_text(encoding="utf-8") == branch_index.read_text(encoding="utf-8")
+    assert not os.path.samefile(main_index, branch_index)  # Reflinked or copied, by default
+
+    for name in ("main", "branch"):
+        run_sphinx(str(tmp_path / name), "-q", "-D", f"markdown_content_store={store}", *HARDLINK_FLAGS)
+    assert os.path.samefile(main_index, branch_index)
+
+    # The outputs do not depend on the blobs
+    assert store_main([str(store), "--max-size", "0"]) == 0
+    assert not list(store.glob("objects/*/*"))
+    assert main_index.exists()
+
+
+def test_changes(tmp_path):
+    source = tmp_path / "source"
+    shutil.copytree(SOURCE_PATH, source)
+    shutil.copytree(os.path.join(os.path.dirname(SOURCE_PATH), "my_module"), tmp_path / "my_module")
+    outdir = tmp_path / "markdown"
+    flags = ["-q", "-D", "markdown_changes=changes.json", "-D", "markdown_delete_orphans=True"]
+    assert main(["-M", "markdown", str(source), str(tmp_path), *flags]) == 0
+    changes = json.loads((outdir / "changes.json").read_text(encoding="utf-8"))
+    assert "index.md" in changes["added"] and not changes["modified"] and not changes["deleted"]
+
+    blocks = source / "blocks.rst"
+    blocks.write_text(blocks.read_text(encoding="utf-8") + "\nA new paragraph.\n", encoding="utf-8")
+    (source / "empty.rst").unlink()
+    assert main(["-M", "markdown", str(source), str(tmp_path), *flags]) == 0
+    changes = json.loads((outdir / "changes.json").read_text(encoding="utf-8"))
+    # The toctree of the index no longer has the deleted document
+    assert set(changes["modified"]) == {"blocks.md", "index.md"} and changes["deleted"] == ["empty.md"]
+    assert "links.md" in changes["unchanged"] and not changes["added"]
+    assert not (outdir / "empty.md").exists() and not changes["orphaned"]
+
+    # Without markdown_delete_orphans, the outputs of the removed documents remain, and are orphaned
+    (source / "blocks.rst").unlink()
+    # A failed write is not reported as modified: the previous output remains
+    links = source / "links.rst"
+    links.write_text(links.read_text(encoding="utf-8") + "\nA new paragraph.\n", encoding="utf-8")
+    (outdir / "links.md").unlink()
+    (outdir / "links.md").mkdir()
+    flags = ["-q", "-D", "markdown_changes=changes.json"]
+    assert main(["-M", "markdown", str(source), str(tmp_path), *flags]) == 0
+    changes = json.loads((outdir / "changes.json").read_text(encoding="utf-8"))
+    assert changes["orphaned"] == ["blocks.md"] and not changes["deleted"] and (outdir / "blocks.md").exists()
+    assert "links.md" not in changes["modified"] and "links.md" in changes["unchanged"]
+    assert len(changes["modified"]["index.md"]) == 40  # The hash of its blob in a content store
+
+
+def test_post_processors(tmp_path):
+    source = tmp_path / "source"
+    source.mkdir()
+    # The example of the README
+    readme = (Path(__file__).parent.parent / "README.md").read_text(encoding="utf-8")
+    example = next(block for block in readme.split("```python\n") if "add_post_processor(app" in block).split("```")[0]
+    (source / "conf.py").write_text(f'extensions = ["sphinx_markdown_builder"]\n{example}', encoding="utf-8")
+    for name in ("index", "other"):
+        (source / f"{name}.rst").write_text(f"{name}\n=====\n\nText.\n\nSection\n-------\n\nMore.\n", encoding="utf-8")
+    flags = ["-q", "-j", "2", "-D", "markdown_chunks=True"]
+    assert main(["-M", "markdown", str(source), str(tmp_path), *flags]) == 0
+    output = (tmp_path / "markdown" / "other.md").read_text(encoding="utf-8")
+    assert output == "---\ndoc: other\n---\n\n## other\n\nText.\n\n### Section\n\nMore.\n"
+
+    # The segments begin with the anchors of their section
+    assert main(["-M", "markdown", str(source), str(tmp_path), "-E", "-D", "markdown_anchor_sections=1", *flags]) == 0
+    output = (tmp_path / "markdown" / "other.md").read_text(encoding="utf-8")
+    assert '<a id="section"></a>\n\n### Section\n' in output
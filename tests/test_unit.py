@@ -1,15 +1,52 @@
 """
 Unit tests for the markdown builder
 """
+
+import errno
 import logging
-from unittest.mock import Mock
+import os
+import pstats
+import stat
+import sys
+import time
+from contextlib import contextmanager
+from types import MethodType
+from unittest.mock import Mock, patch
 
+import docutils.core
+import docutils.languages
 import docutils.nodes
 import pytest
 import sphinx.util.logging
+from sphinx import addnodes
 
+from sphinx_markdown_builder.api import MarkdownConverter
+from sphinx_markdown_builder.chunks import SectionMark, make_chunks
+from sphinx_markdown_builder.config import TranslatorConfig, render_doc_info
 from sphinx_markdown_builder.contexts import SubContext
+from sphinx_markdown_builder.database import DocumentRecord, MarkdownDatabase
+from sphinx_markdown_builder.ir import environment_fingerprint, load_ir, render_ir, save_ir
+from sphinx_markdown_builder.memory import DocumentMemory, MemoryBudget, trace_peak_memory
+from sphinx_markdown_builder.output import OutputWriter
+from sphinx_markdown_builder.pipeline import Span, StageTimeline, WritePipeline
+from sphinx_markdown_builder.postprocess import PostProcessorStage, PostProcessPipeline
+from sphinx_markdown_builder.profiling import DocumentProfile, DocumentProfiler, is_sampled
+from sphinx_markdown_builder.render_cache import RenderCache, structural_hash
+from sphinx_markdown_builder.schedule import (
+    BatchDispatcher,
+    BatchRun,
+    DocumentCost,
+    ScheduleHistory,
+    ScheduleReport,
+    make_batches,
+)
+from sphinx_markdown_builder.store import ContentStore, parse_size
+from sphinx_markdown_builder.trace import trace_events
 from sphinx_markdown_builder.translator import MarkdownTranslator
+from sphinx_markdown_builder.urls import UrlResolver
+from sphinx_markdown_builder.variants import create_variant, unknown_options
+from sphinx_markdown_builder.walker import walk
+from sphinx_markdown_builder.writer import MarkdownWriter
 
 
 def make_mock():
@@ -19,6 +56,20 @@ def make_mock():
     return MarkdownTranslator(document, builder)
 
 
+def make_translator(source: str, render_cache=None):
+    document = docutils.core.publish_doctree(source, settings_overrides={"doctitle_xform": False})
+    builder = Mock(name="builder")
+    builder.render_cache = render_cache
+    builder.url_resolver = UrlResolver()
+    builder.config.markdown_docinfo = False
+    builder.config.markdown_anchor_sections = False
+    builder.config.markdown_anchor_signatures = False
+    builder.config.markdown_http_base = ""
+    mt = MarkdownTranslator(document, builder)
+    document.walkabout(mt)
+    return mt
+
+
 def test_bad_attribute():
     mt = make_mock()
 
@@ -75,3 +126,506 @@ def test_problematic():
         mt.dispatch_visit(node)
     mt.add("suffix")
     assert mt.astext() == "prefix\n\n```\ntext\n```\n\nsuffix\n"
+
+
+def test_section_chunks():
+    mt = make_translator("Title\n=====\n\nIntro.\n\nSub\n---\n\nBody ü.\n")
+    text = mt.astext()
+    data = text.encode("utf-8")
+
+    chunks = make_chunks("doc", text, mt.sections)
+    assert [chunk.path for chunk in chunks] == [("Title",), ("Title", "Sub")]
+    contents = [data[chunk.start : chunk.end].decode("utf-8") for chunk in chunks]  # noqa: E203
+    assert contents == ["# Title\n\nIntro.", "## Sub\n\nBody ü."]
+    assert chunks[1].chars == len("## Sub\n\nBody ü.")
+
+    chunks = make_chunks("doc", "a" * 5 + "\n\n" + "b" * 5, [], max_chars=8)
+    assert [(chunk.start, chunk.end, chunk.tokens) for chunk in chunks] == [(0, 5, 2), (7, 12, 2)]
+
+
+def test_database(tmp_path):
+    db = MarkdownDatabase(str(tmp_path / "markdown.sqlite"), batch_size=2)
+    markdown = 'intro\n\n# Alpha\n\n<a id="a.&quot;target&quot;"></a>\n\nfirst'
+    db.add(DocumentRecord("a", markdown, [SectionMark(7, ("Alpha",), ("alpha",))]))
+    assert db.pending  # Not flushed before the batch is full
+    db.add(DocumentRecord("b", "# Beta\n\nsecond", [SectionMark(0, ("Beta",), ("beta",))]))
+    assert not db.pending
+
+    # Re-adding a document replaces its rows
+    db.add(DocumentRecord("b", "# Beta\n\nthird", [SectionMark(0, ("Beta",), ("beta",))]))
+    db.flush()
+    query = "SELECT docname, title FROM search WHERE search MATCH ?"
+    assert db.connection.execute(query, ("first",)).fetchall() == [("a", "Alpha")]
+    assert db.connection.execute(query, ("second",)).fetchall() == []
+    assert db.connection.execute(query, ("third",)).fetchall() == [("b", "Beta")]
+    anchors = db.connection.execute("SELECT anchor, idx FROM anchors WHERE docname = 'a' ORDER BY anchor").fetchall()
+    assert anchors == [('a."target"', 1), ("alpha", 1)]
+
+    db.prune(["b"])
+    assert db.connection.execute("SELECT docname FROM documents").fetchall() == [("b",)]
+    db.close()
+
+
+def test_url_resolver():
+    resolver = UrlResolver("https://localhost", ".html", cache_size=2)
+    assert resolver.resolve("dir/doc", "other.html", None, True) == "https://localhost/dir/other.html"
+    assert resolver.resolve("dir/doc", "", None, True) == "https://localhost/dir/doc.html"
+    assert resolver.resolve("dir/doc", "other.html", "anchor", True) == "#anchor"
+    assert resolver.resolve("dir/doc", "https://example.com", None, False) == "https://example.com"
+    assert resolver.resolve("dir/doc", "https://example.com", None, False) == "https://example.com"
+    assert (resolver.stats.hits, resolver.stats.misses, resolver.stats.evictions) == (1, 4, 2)
+
+    resolver = UrlResolver()
+    assert resolver.resolve("dir/doc", "other.md", None, True) == "other.md"
+    assert resolver.resolve("doc", "other.md", None, True) == "other.md"
+    assert resolver.stats.hits == 1
+
+
+def test_translator_config():
+    config = Mock(name="config", author="Me", version="1.0", copyright=None)
+    doc_info = render_doc_info(config)
+    assert doc_info == '<meta name="author" content="Me"/>\n<meta name="version" content="1.0"/>'
+
+    mt = make_mock()
+    mt.builder.translator_config = TranslatorConfig(language=None, doc_info=doc_info, anchor_sections=True)
+    mt = MarkdownTranslator(mt.document, mt.builder)
+    assert mt.options is mt.builder.translator_config
+    mt.add("content")
+    assert mt.astext() == f"{doc_info}\n\ncontent\n"
+
+
+def test_write_pipeline():
+    loaded = []
+    with WritePipeline(depth=2) as pipeline:
+        for docname, value in pipeline.prefetch(["a", "b", "c"], str.upper):
+            loaded.append((docname, value))
+    assert loaded == [("a", "A"), ("b", "B"), ("c", "C")]
+    assert pipeline.timeline.totals()["read"][0] == 3
+
+    def failing_load(docname):
+        raise ValueError(docname)
+
+    with pytest.raises(ValueError):
+        with WritePipeline(depth=1) as pipeline:
+            list(pipeline.prefetch(["a"], failing_load))
+
+
+def test_output_writer(tmp_path):
+    writer = OutputWriter(threads=2, fsync=True)
+    for i in range(20):
+        writer.write(str(tmp_path / "sub" / f"{i}.md"), f"content {i}")
+    writer.write(str(tmp_path / "sub" / "0.md"), "new content")
+    writer.close()
+
+    assert writer._created_dirs == {str(tmp_path / "sub")}  # pylint: disable=protected-access
+    assert (tmp_path / "sub" / "0.md").read_text() == "new content"
+    assert (tmp_path / "sub" / "19.md").read_text() == "content 19"
+    assert sorted(os.listdir(tmp_path / "sub")) == sorted(f"{i}.md" for i in range(20))  # No temporary files
+
+
+@pytest.mark.skipif(hasattr(os, "geteuid") and os.geteuid() == 0, reason="root can write read-only files")
+def test_output_writer_read_only(tmp_path):
+    errors = []
+
+    @contextmanager
+    def error_handler(file_path):
+        try:
+            yield
+        except OSError as err:
+            errors.append((file_path, err.errno))
+
+    read_only = tmp_path / "read-only.md"
+    read_only.write_text("content")
+    read_only.chmod(stat.S_IRUSR)
+    writer = OutputWriter(threads=1, error_handler=error_handler)
+    writer.write(str(read_only), "new content")
+    writer.close()
+
+    assert read_only.read_text() == "content"
+    assert errors == [(str(read_only), errno.EACCES)]
+    assert writer.failed == {str(read_only)}
+
+
+class RecordingVisitor(docutils.nodes.SparseNodeVisitor):
+    def __init__(self, document):
+        super().__init__(document)
+        self.events = []
+
+    def dispatch_visit(self, node):
+        self.events.append(("visit", node.__class__.__name__))
+        if isinstance(node, docutils.nodes.emphasis):
+            raise docutils.nodes.SkipNode
+        if isinstance(node, docutils.nodes.strong):
+            raise docutils.nodes.SkipChildren
+        if isinstance(node, docutils.nodes.literal):
+            raise docutils.nodes.SkipSiblings
+        if isinstance(node, docutils.nodes.title_reference):
+            raise docutils.nodes.StopTraversal
+        return None
+
+    def dispatch_departure(self, node):
+        self.events.append(("depart", node.__class__.__name__))
+
+
+def test_walk_compatibility():
+    document = docutils.core.publish_doctree("*a* **b** text\n\n``c`` d\n\n`e` f\n\nignored\n")
+    visitor = RecordingVisitor(document)
+    document.walkabout(visitor)
+    expected = visitor.events
+    visitor.events = []
+    walk(document, visitor)
+    assert visitor.events == expected
+
+
+def test_walk_deep_tree():
+    depth = 5 * sys.getrecursionlimit()
+    mt = make_translator("text")
+    # Build bottom-up, since docutils' setup of a child node is recursive as well
+    node = docutils.nodes.Text("deep")
+    for _ in range(depth):
+        node = docutils.nodes.inline("", "", node)
+    paragraph = docutils.nodes.paragraph("", "", node, docutils.nodes.problematic(text="skipped"))
+
+    mt.skip_by_signal = True
+    walk(paragraph, mt)
+    assert mt.astext() == "text\n\ndeep\n\n```\nskipped\n```\n"
+
+
+def test_code_fence_collision():
+    mt = make_translator("::\n\n    ```python\n    code\n    ```\n\n>>> print('````')\n````\n")
+    assert mt.astext() == "````\n```python\ncode\n```\n````\n\n`````pycon\n>>> print('````')\n````\n`````\n"
+
+
+def make_signature(*children):
+    parameters = addnodes.desc_parameterlist(
+        "",
+        "",
+        addnodes.desc_parameter("", "", addnodes.desc_sig_name("", "x")),
+        addnodes.desc_parameter("", "", docutils.nodes.emphasis("", "*args")),
+        *children,
+    )
+    return addnodes.desc_signature(
+        "",
+        "",
+        addnodes.desc_annotation("", "class "),
+        addnodes.desc_addname("", "module."),
+        addnodes.desc_name("", "my_func"),
+        parameters,
+    )
+
+
+@pytest.mark.parametrize("children", [(), (addnodes.desc_optional("", "y"),)], ids=["direct", "fallback"])
+def test_signature_renderer(children):
+    def render(generic: bool):
+        mt = make_translator("text")
+        if generic:
+            mt._render_signature = lambda *_args: None
+        make_signature(*children).walkabout(mt)
+        return mt.astext()
+
+    assert render(generic=False) == render(generic=True)
+    assert render(generic=False).endswith("### *class* module.my_func(x,  *\\*args*)\n")
+
+
+def test_signature_renderer_added_node():
+    mt = make_translator("text")
+    # As `app.add_node()` does, through `create_translator()`
+    mt.visit_desc_annotation = MethodType(lambda self, node: self.add("[annotation]") or self._skip(), mt)
+    mt.depart_desc_annotation = MethodType(lambda self, node: None, mt)
+    make_signature().walkabout(mt)
+    assert mt.astext().endswith("### [annotation]module.my_func(x,  *\\*args*)\n")
+
+
+RENDER_CACHE_SOURCE = """
+.. note:: Some *note*.
+
+   * item
+
+* .. note:: Some *note*.
+
+     * item
+
+.. note:: Some *note*.
+
+   * item
+
+:param x: The value.
+
+.. warning:: Other.
+"""
+
+
+def test_render_cache():
+    cache = RenderCache(max_size=2**20)
+    expected = make_translator(RENDER_CACHE_SOURCE).astext()
+    assert make_translator(RENDER_CACHE_SOURCE, cache).astext() == expected
+    # The first note is stored, and reused by the third one, but not by the one in the list
+    assert cache.stats.hits == 1
+    # All the subtrees are reused by another document
+    assert make_translator(RENDER_CACHE_SOURCE, cache).astext() == expected
+    assert cache.stats.hits == 6
+
+
+def test_render_cache_bounded():
+    paragraph = docutils.nodes.paragraph("", "text")
+    assert structural_hash(paragraph) == structural_hash(docutils.nodes.paragraph("", "text"))
+    assert structural_hash(paragraph) != structural_hash(docutils.nodes.paragraph("", "other"))
+
+    cache = RenderCache(max_size=1000)
+    for index in range(10):
+        cache.put(index, [("add", "x" * 100, 0, 0)])
+    assert cache.size <= 1000
+    assert len(cache) == cache.size // (100 + 64 + 256)
+    assert cache.stats.evictions == 10 - len(cache)
+    assert cache.get(9) == (("add", "x" * 100, 0, 0),)
+    assert cache.get(0) is None
+    cache.put("big", [("add", "x" * 1000, 0, 0)])
+    assert cache.get("big") is None
+
+
+def test_trace_events():
+    timeline = StageTimeline()
+    with timeline.span("translate", "index"):
+        pass
+    worker = os.getpid() + 1
+    timeline.extend([Span("write", "index", timeline.start + 1, timeline.start + 1.5, "MainThread", worker)])
+
+    events = trace_events(timeline)
+    spans = [event for event in events if event["ph"] == "X"]
+    assert [(span["name"], span["pid"]) for span in spans] == [
+        ("translate: index", os.getpid()),
+        ("write: index", worker),
+    ]
+    assert spans[1]["ts"] == 1e6 and spans[1]["dur"] == 0.5e6
+    assert spans[0]["tid"] != spans[1]["tid"]
+    names = {event["pid"]: event["args"]["name"] for event in events if event["name"] == "process_name"}
+    assert names == {os.getpid(): "sphinx-build", worker: f"worker {worker}"}
+
+
+def test_document_profiler(tmp_path):
+    profiler = DocumentProfiler(keep=2)
+    with profiler.profile("api/module"):
+        sorted(range(1000), key=str)
+    stats = profiler.profiles[0].stats
+    profiler.add([DocumentProfile(elapsed, f"doc{elapsed}", stats) for elapsed in (-1.0, 1000.0, -2.0)])
+    assert [profile.docname for profile in profiler.slowest()] == ["doc1000.0", "api/module"]
+
+    summary_path = profiler.dump(str(tmp_path))
+    assert pstats.Stats(str(tmp_path / "api" / "module.pstats")).total_calls > 0
+    with open(summary_path, encoding="utf-8") as file:
+        assert file.readline() == "The 2 slowest documents:\n"
+
+    docnames = [f"doc{index}" for index in range(1000)]
+    assert not any(is_sampled(docname, 0.0) for docname in docnames)
+    assert all(is_sampled(docname, 1.0) for docname in docnames)
+    assert 400 < sum(is_sampled(docname, 0.5) for docname in docnames) < 600
+
+
+def test_memory_stats():
+    mt = make_translator("* a\n\n  * *b*\n\n* c\n")
+    mt.astext()
+    # Root, list items (2), paragraph, emphasis
+    assert mt.stats.context_depth == 5
+    # Root, list markers (2)
+    assert mt.stats.status_depth == 3
+    assert mt.stats.fragments >= 2
+
+    with trace_peak_memory() as peak_memory:
+        data = [bytearray(100_000)]
+    del data
+    assert peak_memory[0] >= 100_000
+
+    record = DocumentMemory("index", peak_memory=2000, output_size=10, context_depth=4, status_depth=1, fragments=1)
+    assert MemoryBudget().violations(record) == []
+    assert MemoryBudget(max_memory=2000, max_depth=4).violations(record) == []
+    assert len(MemoryBudget(max_memory=1000, max_depth=3).violations(record)) == 2
+
+
+def test_variants():
+    config = Mock(name="config")
+    config.markdown_http_base = ""
+    config.markdown_uri_doc_suffix = ".md"
+    config.markdown_docinfo = False
+    config.markdown_anchor_sections = False
+    config.markdown_anchor_signatures = False
+    overrides = {"markdown_http_base": "https://localhost", "markdown_anchor_sections": True, "markdown_other": 1}
+    assert unknown_options(overrides) == ["markdown_other"]
+
+    variant = create_variant("web", overrides, config, "out")
+    assert variant.outdir == "out-web"
+    assert variant.config.markdown_anchor_sections is True
+    assert variant.config.markdown_docinfo is False
+    assert variant.config.project is config.project
+    assert variant.doc_suffix == ".md"
+    assert variant.url_resolver.adjust_url("api/index", "module.md") == "https://localhost/api/module.md"
+
+
+IR_SOURCE = """
+Title
+=====
+
+Some *text*.
+
++-------+-----+
+| link: | y   |
++-------+-----+
+"""
+
+
+def translate_ir_source(url_resolver: UrlResolver, fingerprint=None, **options):
+    document = docutils.core.publish_doctree(IR_SOURCE, settings_overrides={"doctitle_xform": False})
+    # An internal reference in a table cell, where the URL length affects the column width
+    entry = next(iter(document.findall(docutils.nodes.entry)))
+    entry[0] += docutils.nodes.reference("", "other", refuri="other.md", internal=True)
+    builder = Mock(name="builder")
+    builder.render_cache = None
+    builder.url_resolver = url_resolver
+    builder.current_doc_name = "api/index"
+    builder.ir_fingerprint = fingerprint
+    builder.translator_config = TranslatorConfig(docutils.languages.get_language("en"), **options)
+    mt = MarkdownTranslator(document, builder)
+    document.walkabout(mt)
+    mt.text = mt.astext()
+    return mt
+
+
+def test_ir(tmp_path):
+    document_ir = translate_ir_source(UrlResolver(), fingerprint="env").ir
+    assert document_ir.docname == "api/index" and document_ir.fingerprint == "env"
+    assert document_ir.urls == [("resolve", "other.md", None, True)]
+
+    for options, url_resolver in (
+        ({}, UrlResolver()),
+        ({"anchor_sections": True}, UrlResolver("https://localhost")),
+    ):
+        expected = translate_ir_source(url_resolver, **options)
+        assert render_ir(document_ir, expected.options, url_resolver) == (expected.text, expected.sections)
+    assert "](https://localhost/api/other.md)" in expected.text
+    assert '<a id="title"></a>' in expected.text
+
+    file_path = str(tmp_path / "api" / "index.mdir")
+    save_ir(file_path, document_ir)
+    assert render_ir(load_ir(file_path), expected.options, url_resolver) == (expected.text, expected.sections)
+    (tmp_path / "api" / "index.mdir").write_bytes(b"not a pickle")
+    assert load_ir(file_path) is None
+
+    # An upgrade of the builder invalidates the IR of the environment
+    fingerprint = environment_fingerprint({"api/index": 1.0}, ".md", "en")
+    with patch("sphinx_markdown_builder.__version__", "0.0.0"):
+        assert environment_fingerprint({"api/index": 1.0}, ".md", "en") != fingerprint
+
+
+def test_incremental_settings():
+    def translate(settings, previous_ir=None):
+        source = "Title\n=====\n\nSub\n---\n\nBody.\n"
+        document = docutils.core.publish_doctree(source, settings_overrides={"doctitle_xform": False})
+        builder = Mock(name="builder", render_cache=None, url_resolver=UrlResolver(), current_doc_name="doc")
+        builder.ir_fingerprint, builder.incremental_sections = "env", True
+        builder.previous_ir, builder.ir_settings = previous_ir, settings
+        builder.translator_config = TranslatorConfig(docutils.languages.get_language("en"))
+        mt = MarkdownTranslator(document, builder)
+        document.walkabout(mt)
+        return mt
+
+    first = translate("settings")
+    assert translate("settings", first.ir).segments.spliced == 1
+    # The sections of another builder version or configuration are translated again
+    assert translate("other settings", first.ir).segments.spliced == 0
+
+
+def test_standalone_writer():
+    source = "Title\n=====\n\nSome *text*.\n\nSection\n-------\n\n- item\n"
+    expected = "# Title\n\nSome *text*.\n\n## Section\n\n- item\n"
+    assert docutils.core.publish_string(source, writer=MarkdownWriter()).decode("utf-8") == expected
+
+    converter = MarkdownConverter(markdown_anchor_sections=True)
+    assert converter.convert_all([source, "Other\n=====\n"]) == [
+        '<a id="title"></a>\n\n' + expected.replace("## Section", '<a id="section"></a>\n\n## Section'),
+        '<a id="other"></a>\n\n# Other\n',
+    ]
+    with pytest.raises(ValueError):
+        MarkdownWriter(markdown_unknown=True)
+
+
+def test_schedule(tmp_path):
+    history = ScheduleHistory(str(tmp_path / "history.json"))
+    history.add([DocumentCost("huge", 8.0, 1000), DocumentCost("big", 4.0, 500)])
+    history.add(DocumentCost(f"small{i}", 0.5, 10) for i in range(8))
+    history.save({"huge", "big", "small0", "small1", "small2", "small3", "small4", "small5", "small6", "small7"})
+    loaded = ScheduleHistory(history.file_path)
+    loaded.load()
+    assert loaded.documents == history.documents
+
+    estimates = loaded.estimates(["small0", "huge", "new", "big", "small1", "small2", "small3"])
+    assert estimates["new"] == 16.0 / 10
+    batches = make_batches(estimates, 2)
+    assert batches[:3] == [["huge"], ["big"], ["new"]]
+    assert sorted(name for batch in batches for name in batch) == sorted(estimates)
+
+    report = ScheduleReport(2)
+    report.add_costs([DocumentCost("huge", 8.0, 1000)])
+    report.add_run(BatchRun(["huge"], 0.0, 8.0, 1))
+    report.add_run(BatchRun(["big"], 0.0, 4.0, 2))
+    report.add_run(BatchRun(["small0", "small1"], 4.5, 6.0, 3))
+    summary = report.summary()
+    assert summary["workers"] == 2 and summary["critical_path"] == ["huge"]
+    assert summary["utilization"] == [1.0, 5.5 / 8.0]
+
+
+def test_content_store_gc(tmp_path):
+    store = ContentStore(str(tmp_path / "store"))
+    old, new = store.put(b"old"), store.put(b"new content")
+    assert store.put(b"old") == old and (store.stats.hits, store.stats.misses) == (1, 2)
+    os.utime(store.used_path(old), (0, 0))
+    store.materialize(new, str(tmp_path / "new.md"), hard_link=True)
+    assert (tmp_path / "new.md").read_bytes() == b"new content"
+    assert os.path.getmtime(new) > 0  # The blob itself is not touched by its uses
+
+    result = store.collect_garbage(max_age=24 * 60 * 60)
+    assert (result.blobs, result.remaining_blobs) == (1, 1) and not os.path.exists(old)
+    assert not os.path.exists(store.used_path(old))
+    result = store.collect_garbage(max_size=0)
+    assert (result.blobs, result.size, result.remaining_size) == (1, 0, 0)  # Still linked to new.md
+
+    # The blob is removed after it was marked as used: it is stored again
+    blob = store.put(b"gone")
+    os.remove(blob)
+    with patch.object(store, "put", return_value=blob):
+        store.write(str(tmp_path / "gone.md"), "gone")
+    assert (tmp_path / "gone.md").read_bytes() == b"gone" and os.path.exists(blob)
+    assert parse_size("512") == 512 and parse_size("1.5k") == 1536 and parse_size("2GB") == 2 * 2**30
+
+
+def test_batch_dispatcher():
+    def run_batch(batch):
+        start = time.perf_counter()
+        time.sleep(batch[1])
+        return start
+
+    starts = {}
+    dispatcher = BatchDispatcher(2)
+    # The second worker is freed while the next batches are resolved, and then takes them in their order
+    for index, duration in enumerate([0.6, 0.2, 0.05, 0.05, 0.05]):
+        dispatcher.add_task(run_batch, (index, duration), lambda batch, start: starts.__setitem__(batch[0], start))
+        time.sleep(0.05)
+    dispatcher.join()
+    assert sorted(starts, key=starts.get) == [0, 1, 2, 3, 4] and dispatcher.running == 0
+
+
+def test_post_processors():
+    text = "intro\n\n# Alpha\n\nfirst\n\n# Beta\n\nsecond\n"
+    sections = [SectionMark(7, ("Alpha",), ("alpha",)), SectionMark(23, ("Beta",), ("beta",))]
+    demote = PostProcessorStage("demote", lambda _, segment: segment.replace("# ", "## "), segments=True)
+    upper = PostProcessorStage("upper", lambda _, segment: segment.upper(), segments=True)
+    pipeline = PostProcessPipeline([demote, upper])
+    result, marks = pipeline.run("doc", text, sections)
+    assert result == "INTRO\n\n## ALPHA\n\nFIRST\n\n## BETA\n\nSECOND\n"
+    assert [mark.offset for mark in marks] == [7, 24]
+    assert marks[1].path == ("Beta",)
+    assert pipeline.timings["demote"][0] == 3
+
+    pipeline = PostProcessPipeline([PostProcessorStage("strip", lambda _, text: text.strip()), demote])
+    assert pipeline.run("doc", text, sections) == (text.strip().replace("# ", "## "), [])
+    pipeline.merge({"strip": (2, 0.5)})
+    assert pipeline.timings["strip"][0] == 3
+    assert pipeline.report().startswith("post-processors: strip 0.5")